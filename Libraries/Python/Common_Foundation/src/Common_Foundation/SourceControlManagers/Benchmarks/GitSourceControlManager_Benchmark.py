@@ -0,0 +1,168 @@
+# ----------------------------------------------------------------------
+# |
+# |  GitSourceControlManager_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 23:00:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Measures the time it takes to enumerate the history of a synthetic, linear git repository.
+
+Usage:
+    python -m Common_Foundation.SourceControlManagers.Benchmarks.GitSourceControlManager_Benchmark [--num-commits 20000] [--include-paged]
+
+`--include-paged` also measures the previous implementation, which paged through the history
+with `git log -n 10 --skip <offset>`; this takes minutes for large repositories.
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Callable, Optional
+
+from Common_Foundation.SourceControlManagers.GitSourceControlManager import GitSourceControlManager, Repository
+
+
+# ----------------------------------------------------------------------
+def Execute(
+    num_commits: int,
+    include_paged: bool,
+) -> None:
+    with tempfile.TemporaryDirectory() as temp_directory:
+        repo_root = Path(temp_directory)
+
+        sys.stdout.write("Creating a repository with {} commits...".format(num_commits))
+        sys.stdout.flush()
+
+        start = time.perf_counter()
+        _CreateRepository(repo_root, num_commits)
+        sys.stdout.write("DONE ({:.2f}s)\n\n".format(time.perf_counter() - start))
+
+        repo = GitSourceControlManager().Open(repo_root)
+
+        _Measure("EnumChanges", lambda: sum(1 for _ in repo.EnumChanges()), num_commits)
+        _Measure("EnumChangesEx", lambda: sum(1 for _ in repo.EnumChangesEx()), num_commits)
+
+        if include_paged:
+            _Measure(
+                "EnumChanges (paged)",
+                lambda: _EnumPaged(repo, repo.GetEnumChangesCommandLine()),
+            )
+
+            _Measure(
+                "EnumChangesEx (paged)",
+                lambda: _EnumPaged(repo, repo.GetEnumChangesExCommandLine()),
+            )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRepository(
+    repo_root: Path,
+    num_commits: int,
+) -> None:
+    subprocess.run(["git", "init", "--quiet", str(repo_root)], check=True)
+
+    # Each commit modifies one of a fixed set of files so that every commit has changes
+    commands: list[str] = []
+
+    for index in range(num_commits):
+        message = "Commit {}\n".format(index)
+        content = "{}\n".format(index)
+
+        commands += [
+            "commit refs/heads/main",
+            "mark :{}".format(index + 1),
+            "author Benchmark <benchmark@example.com> {} +0000".format(1600000000 + index),
+            "committer Benchmark <benchmark@example.com> {} +0000".format(1600000000 + index),
+            "data {}".format(len(message)),
+            message,
+        ]
+
+        if index:
+            commands.append("from :{}".format(index))
+
+        commands += [
+            "M 644 inline file_{}.txt".format(index % 100),
+            "data {}".format(len(content)),
+            content,
+        ]
+
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo_root,
+        input="\n".join(commands).encode("utf-8"),
+        check=True,
+    )
+
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=repo_root, check=True)
+    subprocess.run(["git", "checkout", "--quiet", "--force"], cwd=repo_root, check=True)
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    name: str,
+    func: Callable[[], Optional[int]],
+    expected_count: Optional[int]=None,
+) -> None:
+    sys.stdout.write("{:<25}".format(name))
+    sys.stdout.flush()
+
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+
+    assert expected_count is None or count == expected_count, (name, count, expected_count)
+
+    sys.stdout.write("{:>10.2f}s\n".format(elapsed))
+
+
+# ----------------------------------------------------------------------
+def _EnumPaged(
+    repo: Repository,
+    log_command_line: str,
+) -> None:
+    """Reproduces the git invocations made by the previous, paged implementation"""
+
+    page_size = 10
+    offset = 0
+
+    while True:
+        result = GitSourceControlManager.Execute(
+            "{} -n {} --skip {}".format(log_command_line, page_size, offset),
+            cwd=repo.repo_root,
+        )
+
+        result.RaiseOnError()
+
+        if not result.output or result.output.isspace():
+            break
+
+        offset += page_size
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+
+    parser.add_argument("--num-commits", type=int, default=20000, help="Number of commits in the synthetic repository.")
+    parser.add_argument("--include-paged", action="store_true", help="Measure the previous, paged implementation as well.")
+
+    args = parser.parse_args()
+
+    Execute(args.num_commits, args.include_paged)
@@ -15,15 +15,23 @@
 # ----------------------------------------------------------------------
 """Contains the GitSourceControlManager object"""
 
+import hashlib
 import itertools
+import json
+import os
 import re
+import sqlite3
+import struct
+import subprocess
 import textwrap
+import threading
+import weakref
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import auto, Enum
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, List, Generator, Optional, Pattern, Tuple, Union
+from typing import Any, Callable, cast, ClassVar, Dict, List, Generator, Optional, Pattern, Tuple, Union
 
 from Common_Foundation.ContextlibEx import ExitStack
 from Common_Foundation.Shell.All import CurrentShell
@@ -34,10 +42,66 @@ from Common_Foundation import SubprocessEx
 # ----------------------------------------------------------------------
 class GitSourceControlManager(SourceControlManager):
     # ----------------------------------------------------------------------
-    def __init__(self):
+    # Set this environment variable to a value other than "0" to prevent GetChangeInfo results from
+    # being persisted in the repository's git directory.
+    DISABLE_CHANGE_INFO_CACHE_ENV_VAR       = "COMMON_FOUNDATION_DISABLE_GIT_CHANGE_INFO_CACHE"
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class ObjectInfo(object):
+        """Object information returned by `git cat-file`"""
+
+        # ----------------------------------------------------------------------
+        id: str
+        type: str
+        size: int
+        content: Optional[bytes]            # None if the content was not requested
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        *,
+        use_change_info_cache: Optional[bool]=None,     # Defaults to the value of DISABLE_CHANGE_INFO_CACHE_ENV_VAR
+    ):
         super(GitSourceControlManager, self).__init__()
 
+        if use_change_info_cache is None:
+            value = os.getenv(self.__class__.DISABLE_CHANGE_INFO_CACHE_ENV_VAR)
+            use_change_info_cache = value is None or value == "0"
+
         self._is_available: Optional[bool]  = None
+        self._use_change_info_cache         = use_change_info_cache
+
+        # Long-lived `git cat-file` processes, keyed by (repo_root, include_content)
+        self._cat_file_processes: Dict[Tuple[Path, bool], GitSourceControlManager._CatFileProcess]  = {}
+        self._cat_file_processes_lock       = threading.Lock()
+
+        # Persisted GetChangeInfo results, keyed by repo_root (None if the cache couldn't be opened)
+        self._change_info_caches: Dict[Path, Optional[GitSourceControlManager._ChangeInfoCache]]    = {}
+        self._change_info_caches_lock       = threading.Lock()
+
+        # True if the configuration doesn't customize GetChangeInfo output, keyed by repo_root
+        self._default_change_info_formats: Dict[Path, bool]                 = {}
+        self._default_change_info_formats_lock          = threading.Lock()
+
+        # Release the processes and caches when this object is garbage collected (or when the
+        # interpreter exits) without keeping this object alive until then.
+        weakref.finalize(
+            self,
+            self.__class__._CloseResources,
+            self._cat_file_processes,
+            self._cat_file_processes_lock,
+            self._change_info_caches,
+            self._change_info_caches_lock,
+        )
 
     # ----------------------------------------------------------------------
     @property
@@ -64,10 +128,6 @@ class GitSourceControlManager(SourceControlManager):
     def ignore_filename(self) -> Optional[str]:
         return ".gitignore"
 
-    # ----------------------------------------------------------------------
-    # |
-    # |  Public Methods
-    # |
     # ----------------------------------------------------------------------
     @staticmethod
     def Execute(
@@ -126,6 +186,30 @@ class GitSourceControlManager(SourceControlManager):
         if not self.IsAvailable():
             return None
 
+        # Detecting the repository via the filesystem is much faster than spawning git. Defer to git
+        # when its discovery process is customized by the environment or the results are ambiguous.
+        if (
+            not any(os.getenv(var) for var in self.__class__._GIT_DISCOVERY_ENVIRONMENT_VARS)
+            and directory.is_dir()
+        ):
+            resolved_directory = directory.resolve()
+
+            if ".git" not in resolved_directory.parts:
+                device = resolved_directory.stat().st_dev
+
+                for potential_root in itertools.chain([resolved_directory], resolved_directory.parents):
+                    # git doesn't search across filesystem boundaries by default
+                    if potential_root.stat().st_dev != device:
+                        break
+
+                    if self.__class__._IsRootDirectory(potential_root):
+                        return potential_root
+
+                    if (potential_root / ".git").exists():
+                        break
+                else:
+                    return None
+
         result = self.__class__.Execute('git -C "{}" rev-parse --show-toplevel'.format(str(directory)), strip=True)
 
         if result.returncode == 0:
@@ -136,6 +220,13 @@ class GitSourceControlManager(SourceControlManager):
 
         return result
 
+    # ----------------------------------------------------------------------
+    def IsRoot(
+        self,
+        directory: Path,
+    ) -> bool:
+        return self.__class__._IsRootDirectory(directory)
+
     # ----------------------------------------------------------------------
     def Create(
         self,
@@ -195,6 +286,403 @@ class GitSourceControlManager(SourceControlManager):
 
         return Repository(self, realized_root)
 
+    # ----------------------------------------------------------------------
+    def GetObjectInfo(
+        self,
+        repo_root: Path,
+        object_name: str,
+    ) -> Optional["GitSourceControlManager.ObjectInfo"]:
+        """Resolves an object name via a persistent `git cat-file --batch-check` process"""
+
+        return self._GetCatFileProcess(repo_root, include_content=False).Query(object_name)
+
+    # ----------------------------------------------------------------------
+    def ReadObject(
+        self,
+        repo_root: Path,
+        object_name: str,
+    ) -> Optional["GitSourceControlManager.ObjectInfo"]:
+        """Reads an object via a persistent `git cat-file --batch` process"""
+
+        return self._GetCatFileProcess(repo_root, include_content=True).Query(object_name)
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Terminates any persistent `git cat-file` processes and closes any caches"""
+
+        self.__class__._CloseResources(
+            self._cat_file_processes,
+            self._cat_file_processes_lock,
+            self._change_info_caches,
+            self._change_info_caches_lock,
+        )
+
+    # ----------------------------------------------------------------------
+    def ClearChangeInfoCache(
+        self,
+        repo_root: Path,
+    ) -> None:
+        """Removes GetChangeInfo results persisted for the repository"""
+
+        with self._change_info_caches_lock:
+            cache = self._change_info_caches.pop(repo_root, None)
+
+        if cache is not None:
+            cache.Close()
+
+        filename = self._GetChangeInfoCacheFilename(repo_root)
+        if filename is not None:
+            filename.unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Data
+    # |
+    # ----------------------------------------------------------------------
+    # Configuration settings that change the output of GetGetChangeInfoCommandLine
+    _CHANGE_INFO_FORMAT_CONFIG_REGEX        = r"^(log\.date|log\.showsignature|i18n\.logoutputencoding|mailmap\.file|mailmap\.blob)$"
+
+    _GIT_DISCOVERY_ENVIRONMENT_VARS         = [
+        "GIT_DIR",
+        "GIT_WORK_TREE",
+        "GIT_CEILING_DIRECTORIES",
+        "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+    ]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Types
+    # |
+    # ----------------------------------------------------------------------
+    class _CatFileProcess(object):
+        """Services object queries over the pipes of a single `git cat-file` process"""
+
+        # ----------------------------------------------------------------------
+        def __init__(
+            self,
+            repo_root: Path,
+            include_content: bool,
+        ):
+            self._include_content           = include_content
+            self._lock                      = threading.Lock()
+
+            self._process                   = subprocess.Popen(
+                [
+                    "git",
+                    "-C",
+                    str(repo_root),
+                    "cat-file",
+                    "--batch" if include_content else "--batch-check",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+
+        # ----------------------------------------------------------------------
+        @property
+        def is_alive(self) -> bool:
+            return self._process.poll() is None
+
+        # ----------------------------------------------------------------------
+        def Query(
+            self,
+            object_name: str,
+        ) -> Optional["GitSourceControlManager.ObjectInfo"]:
+            # The protocol is line-based, so names with newlines can't be expressed
+            if not object_name or "\n" in object_name:
+                return None
+
+            with self._lock:
+                assert self._process.stdin is not None
+                assert self._process.stdout is not None
+
+                self._process.stdin.write("{}\n".format(object_name).encode("utf-8"))
+                self._process.stdin.flush()
+
+                header = self._process.stdout.readline()
+                if not header:
+                    raise Exception("The 'git cat-file' process terminated unexpectedly.")
+
+                # "<id> <type> <size>" on success, "<name> missing" (or "ambiguous") on failure
+                parts = header.decode("utf-8").rstrip("\n").rsplit(" ", 2)
+                if len(parts) != 3 or not parts[2].isdigit():
+                    return None
+
+                object_id, object_type, size_str = parts
+                size = int(size_str)
+
+                content: Optional[bytes] = None
+
+                if self._include_content:
+                    # The content is followed by a newline
+                    content = self._process.stdout.read(size + 1)[:-1]
+
+            return GitSourceControlManager.ObjectInfo(object_id, object_type, size, content)
+
+        # ----------------------------------------------------------------------
+        def Close(self) -> None:
+            if self._process.stdin is not None:
+                self._process.stdin.close()
+
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+            if self._process.stdout is not None:
+                self._process.stdout.close()
+
+    # ----------------------------------------------------------------------
+    class _ChangeInfoCache(object):
+        """Persists GetChangeInfo results, which never change for a given commit"""
+
+        FILENAME                            = "Common_Foundation.ChangeInfo.db"
+        VERSION                             = 2
+
+        # ----------------------------------------------------------------------
+        def __init__(
+            self,
+            filename: Path,
+        ):
+            self._lock                      = threading.Lock()
+            self._connection                = sqlite3.connect(str(filename), timeout=5, check_same_thread=False)
+
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.__class__.VERSION:
+                self._connection.executescript(
+                    textwrap.dedent(
+                        """\
+                        DROP TABLE IF EXISTS change_info;
+
+                        CREATE TABLE change_info(
+                            id TEXT PRIMARY KEY,
+                            user TEXT NOT NULL,
+                            date TEXT NOT NULL,
+                            summary TEXT NOT NULL,
+                            files TEXT NOT NULL
+                        );
+
+                        PRAGMA user_version = {};
+                        """,
+                    ).format(self.__class__.VERSION),
+                )
+
+        # ----------------------------------------------------------------------
+        def Get(
+            self,
+            commit_id: str,
+        ) -> Optional[Tuple[str, str, str, List[str]]]:
+            # The cache is an optimization; errors (locked or corrupt databases) are treated as misses
+            try:
+                with self._lock:
+                    row = self._connection.execute(
+                        "SELECT user, date, summary, files FROM change_info WHERE id = ?",
+                        (commit_id, ),
+                    ).fetchone()
+            except sqlite3.Error:
+                return None
+
+            if row is None:
+                return None
+
+            return row[0], row[1], row[2], json.loads(row[3])
+
+        # ----------------------------------------------------------------------
+        def Set(
+            self,
+            commit_id: str,
+            user: str,
+            date: str,
+            summary: str,
+            files: List[str],                   # Relative to the repository root
+        ) -> None:
+            try:
+                with self._lock:
+                    with self._connection:
+                        self._connection.execute(
+                            "INSERT OR REPLACE INTO change_info VALUES (?, ?, ?, ?, ?)",
+                            (commit_id, user, date, summary, json.dumps(files)),
+                        )
+            except sqlite3.Error:
+                pass
+
+        # ----------------------------------------------------------------------
+        def Close(self) -> None:
+            with self._lock:
+                self._connection.close()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CloseResources(
+        cat_file_processes: Dict[Tuple[Path, bool], "GitSourceControlManager._CatFileProcess"],
+        cat_file_processes_lock: threading.Lock,
+        change_info_caches: Dict[Path, Optional["GitSourceControlManager._ChangeInfoCache"]],
+        change_info_caches_lock: threading.Lock,
+    ) -> None:
+        # This method doesn't take `self` so that it can be invoked after the object has been
+        # garbage collected.
+
+        with cat_file_processes_lock:
+            processes = list(cat_file_processes.values())
+            cat_file_processes.clear()
+
+        for process in processes:
+            process.Close()
+
+        with change_info_caches_lock:
+            caches = list(change_info_caches.values())
+            change_info_caches.clear()
+
+        for cache in caches:
+            if cache is not None:
+                cache.Close()
+
+    # ----------------------------------------------------------------------
+    def _GetCatFileProcess(
+        self,
+        repo_root: Path,
+        *,
+        include_content: bool,
+    ) -> "GitSourceControlManager._CatFileProcess":
+        key = (repo_root, include_content)
+
+        with self._cat_file_processes_lock:
+            process = self._cat_file_processes.get(key, None)
+
+            if process is None or not process.is_alive:
+                process = self.__class__._CatFileProcess(repo_root, include_content)
+                self._cat_file_processes[key] = process
+
+        return process
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _IsRootDirectory(
+        cls,
+        directory: Path,
+    ) -> bool:
+        """Returns True if the directory contains a '.git' directory or a '.git' file that refers to one"""
+
+        return cls._GetGitDirectory(directory) is not None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetGitDirectory(
+        directory: Path,
+    ) -> Optional[Path]:
+        """Returns the git directory associated with a repository root"""
+
+        git_path = directory / ".git"
+
+        if git_path.is_file():
+            # Worktrees and submodules use a file with the content "gitdir: <path>"
+            try:
+                content = git_path.read_text(encoding="utf-8").strip()
+            except (OSError, UnicodeDecodeError):
+                return None
+
+            if not content.startswith("gitdir: "):
+                return None
+
+            git_path = directory / content[len("gitdir: "):]
+
+        if not (git_path / "HEAD").is_file():
+            return None
+
+        return git_path
+
+    # ----------------------------------------------------------------------
+    def _HasDefaultChangeInfoFormat(
+        self,
+        repo_root: Path,
+    ) -> bool:
+        """\
+        Returns True if GetChangeInfo output isn't customized by a mailmap or configuration settings,
+        meaning that it can be produced from raw commit objects (and cached).
+        """
+
+        if (repo_root / ".mailmap").is_file():
+            return False
+
+        with self._default_change_info_formats_lock:
+            result = self._default_change_info_formats.get(repo_root, None)
+
+            if result is None:
+                execute_result = self.__class__.Execute(
+                    'git -C "{}" config --get-regexp "{}"'.format(
+                        str(repo_root),
+                        self.__class__._CHANGE_INFO_FORMAT_CONFIG_REGEX,
+                    ),
+                )
+
+                result = True
+
+                # `git config` returns 1 when there aren't any matches
+                if execute_result.returncode != 1:
+                    for line in execute_result.output.split("\n"):
+                        key, _, value = line.strip().partition(" ")
+
+                        if key.lower() == "i18n.logoutputencoding" and value.lower() in ["utf-8", "utf8"]:
+                            continue
+
+                        result = False
+                        break
+
+                self._default_change_info_formats[repo_root] = result
+
+            return result
+
+    # ----------------------------------------------------------------------
+    def _GetChangeInfoCache(
+        self,
+        repo_root: Path,
+    ) -> Optional["GitSourceControlManager._ChangeInfoCache"]:
+        if not self._use_change_info_cache:
+            return None
+
+        with self._change_info_caches_lock:
+            if repo_root not in self._change_info_caches:
+                cache: Optional[GitSourceControlManager._ChangeInfoCache] = None
+
+                filename = self._GetChangeInfoCacheFilename(repo_root)
+
+                if filename is not None:
+                    try:
+                        cache = self.__class__._ChangeInfoCache(filename)
+                    except sqlite3.Error:
+                        cache = None
+
+                self._change_info_caches[repo_root] = cache
+
+            return self._change_info_caches[repo_root]
+
+    # ----------------------------------------------------------------------
+    def _GetChangeInfoCacheFilename(
+        self,
+        repo_root: Path,
+    ) -> Optional[Path]:
+        git_dir = repo_root / ".git"
+
+        if not git_dir.is_dir():
+            # Worktrees and submodules use a '.git' file that points to the actual directory
+            result = self.__class__.Execute(
+                'git -C "{}" rev-parse --git-common-dir'.format(str(repo_root)),
+                strip=True,
+            )
+
+            if result.returncode == 0:
+                git_dir = repo_root / result.output
+
+        if not git_dir.is_dir():
+            return None
+
+        return git_dir / self.__class__._ChangeInfoCache.FILENAME
+
 
 # ----------------------------------------------------------------------
 class Repository(DistributedRepositoryBase):
@@ -597,6 +1085,19 @@ class Repository(DistributedRepositoryBase):
             if match and match.group("type") != "??":
                 yield self.repo_root / match.group("filename")
 
+    # ----------------------------------------------------------------------
+    def GetGetChangeStatusCommandLine(self) -> str:
+        return self._GetCommandLine(self.__class__._STATUS_COMMAND_LINE)
+
+    # ----------------------------------------------------------------------
+    def GetChangeStatus(self) -> DistributedRepositoryBase.GetChangeStatusResult:
+        result = GitSourceControlManager.Execute(self.GetGetChangeStatusCommandLine())
+        assert result.returncode == 0, result.output
+
+        has_untracked_changes, has_working_changes, _ = self.__class__._ParseStatusOutput(result.output)
+
+        return DistributedRepositoryBase.GetChangeStatusResult(has_untracked_changes, has_working_changes)
+
     # ----------------------------------------------------------------------
     def GetGetChangeInfoCommandLine(
         self,
@@ -614,6 +1115,46 @@ class Repository(DistributedRepositoryBase):
         self,
         change: str,
     ) -> Dict[str, Any]:
+        # Mailmaps and some configuration settings customize the output, which isn't reflected in
+        # the raw commit object (or cached results).
+        scm = self._GetScm()
+
+        if scm._HasDefaultChangeInfoFormat(self.repo_root):  # pylint: disable=protected-access
+            commit_info = scm.GetObjectInfo(self.repo_root, "{}^{{commit}}".format(change))
+            if commit_info is not None:
+                cache = scm._GetChangeInfoCache(self.repo_root)  # pylint: disable=protected-access
+
+                cached_result = cache.Get(commit_info.id) if cache is not None else None
+
+                if cached_result is None:
+                    commit = scm.ReadObject(self.repo_root, commit_info.id)
+                    assert commit is not None and commit.content is not None
+
+                    decoded_result = self.__class__._DecodeCommitObject(commit.content)
+
+                    if decoded_result is not None:
+                        user, date, summary = decoded_result
+
+                        files = [
+                            filename.relative_to(self.repo_root).as_posix()
+                            for filename in self.EnumChangedFiles(commit.id)
+                        ]
+
+                        cached_result = (user, date, summary, files)
+
+                        if cache is not None:
+                            cache.Set(commit_info.id, user, date, summary, files)
+
+                if cached_result is not None:
+                    user, date, summary, files = cached_result
+
+                    return {
+                        "user": user,
+                        "date": date,
+                        "summary": summary,
+                        "files": [self.repo_root / filename for filename in files],
+                    }
+
         result = GitSourceControlManager.Execute(self.GetGetChangeInfoCommandLine(change))
         assert result.returncode == 0, result.output
 
@@ -627,6 +1168,122 @@ class Repository(DistributedRepositoryBase):
             "files": list(self.EnumChangedFiles(change)),
         }
 
+    # ----------------------------------------------------------------------
+    def GetGetChangeInfosCommandLine(
+        self,
+        changes: List[str],
+    ) -> str:
+        return " && ".join(self._GetChangeInfosCommandLines(changes))
+
+    # ----------------------------------------------------------------------
+    def GetChangeInfos(
+        self,
+        changes: List[str],
+    ) -> List[Dict[str, Any]]:
+        if not changes:
+            return []
+
+        scm = self._GetScm()
+
+        # Resolve the changes so that results can be associated with the commits that git reports
+        commit_ids: List[str] = []
+
+        for change in changes:
+            commit_info = scm.GetObjectInfo(self.repo_root, "{}^{{commit}}".format(change))
+            commit_ids.append(commit_info.id if commit_info is not None else change)
+
+        # Mailmaps and some configuration settings customize the output, which isn't reflected in cached results
+        if scm._HasDefaultChangeInfoFormat(self.repo_root):  # pylint: disable=protected-access
+            cache = scm._GetChangeInfoCache(self.repo_root)  # pylint: disable=protected-access
+        else:
+            cache = None
+
+        results: Dict[str, Tuple[str, str, str, List[str]]] = {}
+
+        if cache is not None:
+            for commit_id in commit_ids:
+                cached_result = cache.Get(commit_id)
+                if cached_result is not None:
+                    results[commit_id] = cached_result
+
+        uncached_commit_ids = list(dict.fromkeys(commit_id for commit_id in commit_ids if commit_id not in results))
+
+        if uncached_commit_ids:
+            # ----------------------------------------------------------------------
+            def CommitResult(
+                lines: List[str],
+            ) -> None:
+                assert len(lines) >= 5, lines
+                commit_id, parents, user, date, summary = lines[:5]
+
+                # Be consistent with GetChangeInfo
+                user = user.lstrip()
+                date = date.lstrip()
+                summary = summary.lstrip()
+
+                files: List[str] = []
+
+                # Be consistent with EnumChangedFiles, which doesn't report files for root commits
+                if parents:
+                    for line in lines[5:]:
+                        if not line:
+                            continue
+
+                        assert "\t" in line, line
+                        files.append(line.split("\t", maxsplit=1)[1])
+
+                results[commit_id] = (user, date, summary, files)
+
+                if cache is not None:
+                    cache.Set(commit_id, user, date, summary, files)
+
+            # ----------------------------------------------------------------------
+
+            # A single invocation is used for as many commits as the command line length allows
+            for command_line in self._GetChangeInfosCommandLines(uncached_commit_ids):
+                log_generator = SubprocessEx.StreamLines(command_line)
+
+                commit_lines: Optional[List[str]] = None
+
+                while True:
+                    try:
+                        line = next(log_generator)
+                    except StopIteration as ex:
+                        ex.value.RaiseOnError()
+                        break
+
+                    if line == self.__class__._CHANGE_INFOS_DELIMITER:
+                        if commit_lines is not None:
+                            CommitResult(commit_lines)
+
+                        commit_lines = []
+                        continue
+
+                    assert commit_lines is not None, line
+                    commit_lines.append(line)
+
+                if commit_lines is not None:
+                    CommitResult(commit_lines)
+
+        change_infos: List[Dict[str, Any]] = []
+
+        for change, commit_id in zip(changes, commit_ids):
+            if commit_id not in results:
+                raise Exception("The change '{}' could not be found.".format(change))
+
+            user, date, summary, files = results[commit_id]
+
+            change_infos.append(
+                {
+                    "user": user,
+                    "date": date,
+                    "summary": summary,
+                    "files": [self.repo_root / filename for filename in files],
+                },
+            )
+
+        return change_infos
+
     # ----------------------------------------------------------------------
     def GetAddFilesCommandLine(
         self,
@@ -740,6 +1397,7 @@ class Repository(DistributedRepositoryBase):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         return self._CreateLoggerInfo(
             *self._GetEnumChangesSinceMergeCommandLineParts(
@@ -747,6 +1405,7 @@ class Repository(DistributedRepositoryBase):
                 source_merge_arg,
             ),
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
         )[0]
 
     # ----------------------------------------------------------------------
@@ -762,6 +1421,7 @@ class Repository(DistributedRepositoryBase):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[str, None, None]:
         yield from self._CreateLoggerInfo(
             *self._GetEnumChangesSinceMergeCommandLineParts(
@@ -769,6 +1429,7 @@ class Repository(DistributedRepositoryBase):
                 source_merge_arg,
             ),
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
         )[1]()
 
     # ----------------------------------------------------------------------
@@ -785,6 +1446,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         return self._CreateLoggerExInfo(
             *self._GetEnumChangesSinceMergeCommandLineParts(
@@ -792,6 +1454,7 @@ class Repository(DistributedRepositoryBase):
                 source_merge_arg,
             ),
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
             rename_is_modification=rename_is_modification,
         )[0]
 
@@ -809,6 +1472,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[DistributedRepositoryBase.ChangeInfo, None, None]:
         yield from self._CreateLoggerExInfo(
             *self._GetEnumChangesSinceMergeCommandLineParts(
@@ -816,6 +1480,7 @@ class Repository(DistributedRepositoryBase):
                 source_merge_arg,
             ),
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
             rename_is_modification=rename_is_modification,
         )[1]()
 
@@ -845,6 +1510,80 @@ class Repository(DistributedRepositoryBase):
 
             yield self.repo_root / line
 
+    # ----------------------------------------------------------------------
+    def GetEnumChangedFilesInRangeCommandLine(
+        self,
+        start_change: Optional[str],
+        end_change: str="HEAD",
+    ) -> str:
+        return self._GetCommandLine(
+            'git --no-pager log --no-renames --name-status -z --no-color "--format={}" "{}"'.format(
+                self.__class__._CHANGED_FILES_FORMAT,
+                end_change if start_change is None else "{}..{}".format(start_change, end_change),
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def EnumChangedFilesInRange(
+        self,
+        start_change: Optional[str],
+        end_change: str="HEAD",
+    ) -> Generator[Tuple[str, List[Path]], None, None]:
+        """Enumerates (commit id, changed files) for each commit in 'start_change..end_change' (or all ancestors of end_change when start_change is None)"""
+
+        # The output has the form:
+        #
+        #     <delimiter>\n<commit id>\n<parent ids>\0\n<status>\0<filename>\0<status>\0<filename>\0...
+        #
+        # where the filenames are not quoted and can contain any character other than NUL.
+        log_generator = SubprocessEx.StreamLines(
+            self.GetEnumChangedFilesInRangeCommandLine(start_change, end_change),
+            separator="\0",
+        )
+
+        header_prefix = "{}\n".format(self.__class__._CHANGED_FILES_DELIMITER)
+
+        commit_id: Optional[str] = None
+        is_root_commit = False
+        filenames: List[Path] = []
+        expect_filename = False
+
+        while True:
+            try:
+                item = next(log_generator)
+            except StopIteration as ex:
+                ex.value.RaiseOnError()
+                break
+
+            if expect_filename:
+                # Be consistent with EnumChangedFiles, which doesn't report files for root commits
+                if not is_root_commit:
+                    filenames.append(self.repo_root / item)
+
+                expect_filename = False
+                continue
+
+            item = item.lstrip("\n")
+            if not item:
+                continue
+
+            if item.startswith(header_prefix):
+                if commit_id is not None:
+                    yield commit_id, filenames
+
+                commit_id, _, parents = item[len(header_prefix):].partition("\n")
+
+                is_root_commit = not parents.strip()
+                filenames = []
+
+                continue
+
+            assert commit_id is not None, item
+            expect_filename = True
+
+        if commit_id is not None:
+            yield commit_id, filenames
+
     # ----------------------------------------------------------------------
     def GetEnumBlameInfoCommandLine(
         self,
@@ -887,10 +1626,22 @@ class Repository(DistributedRepositoryBase):
 
     # ----------------------------------------------------------------------
     def GetEnumTrackedFilesCommandLine(self) -> str:
-        return self._GetCommandLine("git ls-files")
+        # Don't quote non-ASCII filenames, consistent with names read from the index
+        return self._GetCommandLine("git -c core.quotePath=false ls-files")
 
     # ----------------------------------------------------------------------
     def EnumTrackedFiles(self) -> Generator[Path, None, None]:
+        # Reading the index directly is much faster than invoking git
+        if not os.getenv("GIT_INDEX_FILE"):
+            git_dir = GitSourceControlManager._GetGitDirectory(self.repo_root)  # pylint: disable=protected-access
+            if git_dir is not None:
+                filenames = self.__class__._ReadIndexFilenames(git_dir / "index")
+                if filenames is not None:
+                    for filename in filenames:
+                        yield self.repo_root / filename
+
+                    return
+
         temp_filename = CurrentShell.CreateTempFilename()
 
         result = GitSourceControlManager.Execute(
@@ -901,7 +1652,7 @@ class Repository(DistributedRepositoryBase):
         assert temp_filename.is_file(), temp_filename
 
         with ExitStack(temp_filename.unlink):
-            with temp_filename.open() as f:
+            with temp_filename.open(encoding="utf-8") as f:
                 for line in f.readlines():
                     line = line.strip()
                     if line:
@@ -948,11 +1699,13 @@ class Repository(DistributedRepositoryBase):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         return self._CreateLoggerInfo(
             "HEAD",
             [],
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
         )[0]
 
     # ----------------------------------------------------------------------
@@ -960,11 +1713,13 @@ class Repository(DistributedRepositoryBase):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[str, None, None]:
         yield from self._CreateLoggerInfo(
             "HEAD",
             [],
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
         )[1]()
 
     # ----------------------------------------------------------------------
@@ -973,11 +1728,13 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         return self._CreateLoggerExInfo(
             "HEAD",
             [],
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
             rename_is_modification=rename_is_modification,
         )[0]
 
@@ -987,11 +1744,13 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[DistributedRepositoryBase.ChangeInfo, None, None]:
         yield from self._CreateLoggerExInfo(
             "HEAD",
             [],
             include_working_changes=include_working_changes,
+            pathspecs=pathspecs,
             rename_is_modification=rename_is_modification,
         )[1]()
 
@@ -1148,6 +1907,63 @@ class Repository(DistributedRepositoryBase):
             for line in result.output.split("\n"):
                 yield line
 
+    # ----------------------------------------------------------------------
+    def GetGetDistributedChangeStatusCommandLine(self) -> str:
+        return self._GetCommandLine(
+            " && ".join(
+                [
+                    "git remote update origin",
+                    "{} --branch".format(self.__class__._STATUS_COMMAND_LINE),
+                    'git for-each-ref --count=1 --sort=-committerdate --format="%(refname)"',
+                ],
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def GetDistributedChangeStatus(self) -> DistributedRepositoryBase.GetDistributedChangeStatusResult:
+        result = GitSourceControlManager.Execute(self.GetGetDistributedChangeStatusCommandLine())
+        assert result.returncode == 0, result.output
+
+        has_untracked_changes, has_working_changes, branch_info = self.__class__._ParseStatusOutput(result.output)
+
+        # The branch header information is relative to the upstream branch, while local and remote
+        # changes are relative to the branch of the same name on origin. Use the header information
+        # when those are the same and fall back to the individual queries when they are not (or when
+        # the head is detached).
+        branch_name = branch_info.get("branch.head", "(detached)")
+        ahead_behind = branch_info.get("branch.ab", None)
+
+        if (
+            branch_name != "(detached)"
+            and branch_info.get("branch.upstream", None) == "origin/{}".format(branch_name)
+            and ahead_behind is not None
+        ):
+            ahead, behind = ahead_behind.split(" ")
+
+            has_local_changes = ahead != "+0"
+            has_remote_changes = behind != "-0"
+        else:
+            has_local_changes = self.HasLocalChanges()
+            has_remote_changes = self.HasRemoteChanges()
+
+        most_recent_branch: Optional[str] = None
+
+        for line in result.output.split("\n"):
+            if line.startswith("refs/"):
+                most_recent_branch = line.split("/")[-1]
+                break
+
+        assert most_recent_branch is not None, result.output
+
+        return DistributedRepositoryBase.GetDistributedChangeStatusResult(
+            has_untracked_changes,
+            has_working_changes,
+            has_local_changes,
+            has_remote_changes,
+            branch_name == "(detached)",
+            most_recent_branch,
+        )
+
     # ----------------------------------------------------------------------
     def GetPushCommandLine(
         self,
@@ -1194,6 +2010,26 @@ class Repository(DistributedRepositoryBase):
 
         return self._GetCommandLine(" && ".join(commands))
 
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Data
+    # |
+    # ----------------------------------------------------------------------
+    _CHANGE_INFOS_DELIMITER                 = "2f7b3c1d5e9a4b6f8c0d1e2f3a4b5c6d"
+    _CHANGE_INFOS_MAX_COMMAND_LINE_LENGTH   = 8000      # cmd.exe limits command lines to 8191 characters
+    _CHANGE_INFOS_FORMAT                    = "{}%n%H%n%P%n %aN <%ae> %n %cd %n %s".format(_CHANGE_INFOS_DELIMITER)  # Whitespace is consistent with GetGetChangeInfoCommandLine
+
+    _CHANGED_FILES_DELIMITER                = "6d0c8e5a9b2f4e7c8a1d3f5b7e9c0a2d"
+    _CHANGED_FILES_FORMAT                   = "{}%n%H%n%P".format(_CHANGED_FILES_DELIMITER)
+
+    # Untracked files are listed explicitly to be consistent with `git ls-files --others`, which
+    # ignores the 'status.showUntrackedFiles' setting.
+    _STATUS_COMMAND_LINE                    = "git status --porcelain=v2 --untracked-files=normal"
+
+    # The branch referenced by HEAD, keyed by HEAD's filename and validated by its (inode, mtime, size)
+    _head_branch_cache: ClassVar[Dict[Path, Tuple[Tuple[int, int, int], Optional[str]]]]    = {}
+    _head_branch_cache_lock: ClassVar[threading.Lock]                                       = threading.Lock()
+
     # ----------------------------------------------------------------------
     # |
     # |  Private Types
@@ -1217,6 +2053,50 @@ class Repository(DistributedRepositoryBase):
     def _Execute(self, *args, **kwargs) -> SubprocessEx.RunResult:
         return GitSourceControlManager.Execute(*args, **kwargs)
 
+    # ----------------------------------------------------------------------
+    def _GetChangeInfosCommandLines(
+        self,
+        changes: List[str],
+    ) -> List[str]:
+        """Returns the command lines used to query the changes, none of which exceed the maximum command line length"""
+
+        # ----------------------------------------------------------------------
+        def CreateCommandLine(
+            changes: List[str],
+        ) -> str:
+            return self._GetCommandLine(
+                'git --no-pager log --no-walk=unsorted --no-renames --name-status --no-color "--format={}"{}'.format(
+                    self.__class__._CHANGE_INFOS_FORMAT,
+                    "".join(' "{}"'.format(change) for change in changes),
+                ),
+            )
+
+        # ----------------------------------------------------------------------
+
+        command_lines: List[str] = []
+
+        base_length = len(CreateCommandLine([]))
+
+        chunk: List[str] = []
+        chunk_length = base_length
+
+        for change in changes:
+            change_length = len(change) + 3     # Leading space and quotes
+
+            if chunk and chunk_length + change_length > self.__class__._CHANGE_INFOS_MAX_COMMAND_LINE_LENGTH:
+                command_lines.append(CreateCommandLine(chunk))
+
+                chunk = []
+                chunk_length = base_length
+
+            chunk.append(change)
+            chunk_length += change_length
+
+        if chunk:
+            command_lines.append(CreateCommandLine(chunk))
+
+        return command_lines
+
     # ----------------------------------------------------------------------
     def _GetCommandLine(
         self,
@@ -1224,6 +2104,212 @@ class Repository(DistributedRepositoryBase):
     ) -> str:
         return command_line.replace("git ", 'git -C "{}" '.format(str(self.repo_root)))
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _ParseStatusOutput(
+        output: str,
+    ) -> Tuple[bool, bool, Dict[str, str]]:
+        """Returns (has_untracked_changes, has_working_changes, branch_info) from `git status --porcelain=v2` output"""
+
+        # See https://git-scm.com/docs/git-status#_porcelain_format_version_2 for more information
+        has_untracked_changes = False
+        has_working_changes = False
+        branch_info: Dict[str, str] = {}
+
+        for line in output.split("\n"):
+            if line.startswith("? "):
+                has_untracked_changes = True
+            elif line.startswith(("1 ", "2 ", "u ")):
+                has_working_changes = True
+            elif line.startswith("# branch."):
+                key, _, value = line[len("# "):].partition(" ")
+                branch_info[key] = value
+
+        return has_untracked_changes, has_working_changes, branch_info
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _ReadIndexFilenames(
+        index_filename: Path,
+    ) -> Optional[List[str]]:
+        """Returns the filenames in a git index (versions 2 - 4), or None if the index can't be processed here"""
+
+        # See https://git-scm.com/docs/index-format for more information on the index format
+        try:
+            content = index_filename.read_bytes()
+        except OSError:
+            return None
+
+        if len(content) < 12 + 20 or content[:4] != b"DIRC":
+            return None
+
+        version, num_entries = struct.unpack_from(">II", content, 4)
+        if version not in [2, 3, 4]:
+            return None
+
+        # The content is followed by a SHA-1 checksum (which is all zeros when 'index.skipHash' is
+        # set). Validating it also rejects repositories that use SHA-256 object ids.
+        data_end = len(content) - 20
+
+        checksum = content[data_end:]
+        if checksum != bytes(20) and hashlib.sha1(content[:data_end]).digest() != checksum:
+            return None
+
+        filenames: List[str] = []
+
+        prev_name = b""
+        offset = 12
+
+        for _ in range(num_entries):
+            # ctime, mtime, dev, ino, mode, uid, gid, size (40 bytes), object id (20 bytes), flags (2 bytes)
+            if offset + 62 > data_end:
+                return None
+
+            flags = struct.unpack_from(">H", content, offset + 60)[0]
+
+            name_offset = offset + 62
+
+            if flags & 0x4000:
+                # Extended flags (2 bytes)
+                if version < 3:
+                    return None
+
+                name_offset += 2
+
+            if version == 4:
+                # The name is prefix-compressed: a varint with the number of bytes to remove from the
+                # previous name, followed by the NUL-terminated suffix.
+                if name_offset >= data_end:
+                    return None
+
+                byte = content[name_offset]
+                name_offset += 1
+
+                strip_length = byte & 0x7F
+
+                while byte & 0x80:
+                    if name_offset >= data_end:
+                        return None
+
+                    byte = content[name_offset]
+                    name_offset += 1
+
+                    strip_length = ((strip_length + 1) << 7) | (byte & 0x7F)
+
+                name_end = content.find(b"\0", name_offset, data_end)
+                if name_end == -1 or strip_length > len(prev_name):
+                    return None
+
+                name = prev_name[:len(prev_name) - strip_length] + content[name_offset:name_end]
+
+                offset = name_end + 1
+
+            else:
+                name_end = content.find(b"\0", name_offset, data_end)
+                if name_end == -1:
+                    return None
+
+                name = content[name_offset:name_end]
+
+                # Entries are padded with 1 - 8 NUL bytes to a multiple of 8 bytes
+                offset += (name_end - offset + 8) & ~7
+
+            filenames.append(os.fsdecode(name))
+            prev_name = name
+
+        # Extensions with signatures that begin with an uppercase letter are optional and can be
+        # ignored; others (for example, the split index ("link") or sparse directory entries ("sdir"))
+        # change the meaning of the entries and can't be handled here.
+        while offset < data_end:
+            if offset + 8 > data_end or not (ord("A") <= content[offset] <= ord("Z")):
+                return None
+
+            offset += 8 + struct.unpack_from(">I", content, offset + 4)[0]
+
+        if offset != data_end:
+            return None
+
+        return filenames
+
+    # ----------------------------------------------------------------------
+    def _GetScm(self) -> GitSourceControlManager:
+        return cast(GitSourceControlManager, self.scm)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _DecodeCommitObject(
+        content: bytes,
+    ) -> Optional[Tuple[str, str, str]]:
+        """\
+        Returns the same (user, date, summary) values produced by GetGetChangeInfoCommandLine, or
+        None if the commit can't be decoded without git (for example, it uses a custom encoding).
+
+        This assumes that `_HasDefaultChangeInfoFormat` is True for the repository.
+        """
+
+        try:
+            decoded_content = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+        headers, _, message = decoded_content.partition("\n\n")
+
+        author: Optional[str] = None
+        committer: Optional[str] = None
+
+        for header in headers.split("\n"):
+            if header.startswith("author "):
+                author = header[len("author "):]
+            elif header.startswith("committer "):
+                committer = header[len("committer "):]
+            elif header.startswith("encoding "):
+                if header[len("encoding "):].strip().lower() not in ["utf-8", "utf8"]:
+                    return None
+
+        if author is None or committer is None:
+            return None
+
+        # "<name> <<email>> <timestamp> <offset>"
+        user = author.rsplit(" ", 2)[0]
+
+        _, timestamp, offset = committer.rsplit(" ", 2)
+
+        if len(offset) != 5 or offset[0] not in "+-" or not offset[1:].isdigit():
+            return None
+
+        offset_seconds = (int(offset[1:3]) * 60 + int(offset[3:5])) * 60
+        if offset.startswith("-"):
+            offset_seconds = -offset_seconds
+
+        date_value = datetime.fromtimestamp(int(timestamp), timezone(timedelta(seconds=offset_seconds)))
+
+        # Format the same way as git's default date format (which is not locale-dependent)
+        date = "{} {} {} {} {}".format(
+            ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")[date_value.weekday()],
+            ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")[date_value.month - 1],
+            date_value.day,
+            date_value.strftime("%H:%M:%S %Y"),
+            offset,
+        )
+
+        # `%s` is the first paragraph of the message (after any leading blank lines), with trailing
+        # whitespace removed from each line, joined into a single line.
+        summary_lines: List[str] = []
+
+        for line in message.split("\n"):
+            line = line.rstrip()
+            if not line:
+                if summary_lines:
+                    break
+
+                continue
+
+            summary_lines.append(line)
+
+        # Match the whitespace produced by the command line (" %aN <%ae> %n %cd %n %s") after the
+        # leading whitespace has been removed from each line.
+        return "{} ".format(user), "{} ".format(date), " ".join(summary_lines).lstrip()
+
     # ----------------------------------------------------------------------
     def _GetCurrentBranchEx(
         self,
@@ -1232,6 +2318,12 @@ class Repository(DistributedRepositoryBase):
         detached_is_error: bool=False,
         detached_error_template: str="The requested operation is not valid on a branch in the 'DETACHED HEAD' state ({}).",
     ) -> Tuple["Repository._BranchType", str]:
+        # Read the branch directly from HEAD when possible; the branch listing is only needed to
+        # process a detached head.
+        branch_name = self._GetHeadBranchName()
+        if branch_name is not None:
+            return Repository._BranchType.Standard, branch_name
+
         # Get the branch name
         result = GitSourceControlManager.Execute(self._GetCommandLine("git branch --all --no-color --verbose"))
         assert result.returncode == 0, result.output
@@ -1361,6 +2453,47 @@ class Repository(DistributedRepositoryBase):
 
         return branch_type, resolved_branch.name
 
+    # ----------------------------------------------------------------------
+    def _GetHeadBranchName(self) -> Optional[str]:
+        """Returns the branch referenced by HEAD, or None if HEAD is detached or can't be read directly"""
+
+        if any(os.getenv(var) for var in GitSourceControlManager._GIT_DISCOVERY_ENVIRONMENT_VARS):  # pylint: disable=protected-access
+            return None
+
+        git_dir = GitSourceControlManager._GetGitDirectory(self.repo_root)  # pylint: disable=protected-access
+        if git_dir is None:
+            return None
+
+        head_filename = git_dir / "HEAD"
+
+        try:
+            stat_result = head_filename.stat()
+        except OSError:
+            return None
+
+        # git replaces HEAD (rather than modifying it in place) when it changes
+        cache_key = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+        with Repository._head_branch_cache_lock:
+            cache_value = Repository._head_branch_cache.get(head_filename, None)
+
+        if cache_value is not None and cache_value[0] == cache_key:
+            return cache_value[1]
+
+        try:
+            content = head_filename.read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        branch_prefix = "ref: refs/heads/"
+
+        branch_name = content[len(branch_prefix):] if content.startswith(branch_prefix) else None
+
+        with Repository._head_branch_cache_lock:
+            Repository._head_branch_cache[head_filename] = (cache_key, branch_name)
+
+        return branch_name
+
     # ----------------------------------------------------------------------
     def _GetUpdateMergeArgCommandLine(
         self,
@@ -1412,6 +2545,10 @@ class Repository(DistributedRepositoryBase):
             return ""
 
         if isinstance(update_arg, UpdateMergeArgs.Change):
+            object_info = self._GetScm().GetObjectInfo(self.repo_root, "{}^{{commit}}".format(update_arg.change))
+            if object_info is not None:
+                return object_info.id
+
             result = GitSourceControlManager.Execute(
                 self._GetCommandLine(
                     'git --no-pager log {} -n 1 --format="%H"'.format(update_arg.change),
@@ -1516,6 +2653,17 @@ class Repository(DistributedRepositoryBase):
 
         return source_branch, additional_filters
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetPathspecsCommandLineArgs(
+        pathspecs: Optional[List[str]],
+    ) -> str:
+        if not pathspecs:
+            return ""
+
+        # Pathspecs are relative to the repository root, as commands are invoked with '-C <root>'
+        return ' -- {}'.format(" ".join('"{}"'.format(pathspec) for pathspec in pathspecs))
+
     # ----------------------------------------------------------------------
     def _CreateLoggerInfo(
         self,
@@ -1523,9 +2671,12 @@ class Repository(DistributedRepositoryBase):
         additional_command_line_parts: list[str],
         *,
         include_working_changes: bool,
+        pathspecs: Optional[List[str]],
     ) -> tuple[str, Callable[[], Generator[str, None, None]]]:
         if include_working_changes:
-            working_command_line = self._GetCommandLine("git status --porcelain=1")
+            working_command_line = self._GetCommandLine(
+                "git status --porcelain=1{}".format(self.__class__._GetPathspecsCommandLineArgs(pathspecs)),
+            )
         else:
             working_command_line = None
 
@@ -1543,7 +2694,7 @@ class Repository(DistributedRepositoryBase):
                     ],
                     additional_command_line_parts,
                 ),
-            ),
+            ) + self.__class__._GetPathspecsCommandLineArgs(pathspecs),
         )
 
         # ----------------------------------------------------------------------
@@ -1555,30 +2706,20 @@ class Repository(DistributedRepositoryBase):
                 if result.output:
                     yield DistributedRepositoryBase.ChangeInfo.WORKING_CHANGES_COMMIT_ID
 
-            offset = 0
+            # Stream the history from a single invocation rather than paging through it, as each
+            # page would re-walk all of the commits that came before it.
+            log_generator = SubprocessEx.StreamLines(log_command_line)
 
             while True:
-                result = self._Execute(
-                    '{} -n 10 --skip {}'.format(log_command_line, offset),
-                    add_newline=True,
-                )
-
-                result.RaiseOnError()
-
-                if (
-                    not result.output
-                    or result.output.isspace()
-                    or "does not have any commits yet" in result.output
-                ):
+                try:
+                    line = next(log_generator)
+                except StopIteration as ex:
+                    ex.value.RaiseOnError()
                     break
 
-                for line in result.output.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-
+                line = line.strip()
+                if line:
                     yield line
-                    offset += 1
 
         # ----------------------------------------------------------------------
 
@@ -1599,9 +2740,12 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool,
         rename_is_modification: bool,
+        pathspecs: Optional[List[str]],
     ) -> tuple[str, Callable[[], Generator[DistributedRepositoryBase.ChangeInfo, None, None]]]:
         if include_working_changes:
-            working_command_line = self._GetCommandLine("git status --porcelain=1")
+            working_command_line = self._GetCommandLine(
+                "git status --porcelain=1{}".format(self.__class__._GetPathspecsCommandLineArgs(pathspecs)),
+            )
         else:
             working_command_line = None
 
@@ -1673,7 +2817,7 @@ class Repository(DistributedRepositoryBase):
                     ],
                     additional_command_line_parts,
                 ),
-            ),
+            ) + self.__class__._GetPathspecsCommandLineArgs(pathspecs),
         )
 
         # ----------------------------------------------------------------------
@@ -1726,88 +2870,89 @@ class Repository(DistributedRepositoryBase):
                 re.DOTALL | re.MULTILINE,
             )
 
-            # Parse the content
-            split_token = "{}\n".format(commit_delimiter)
+            # ----------------------------------------------------------------------
+            def EnumCommits() -> Generator[str, None, None]:
+                # Stream the history from a single invocation rather than paging through it, as
+                # each page would re-walk all of the commits that came before it.
+                log_generator = SubprocessEx.StreamLines(log_command_line)
 
-            offset = 0
+                commit_lines: list[str] = []
 
-            # Merges will not include files, but tags are often applied to merges.
-            # If we detect a merge, don't send it but keep the tags around for the
-            # next commit (which will be the parent of the merge).
-            prev_tags: list[str] = []
+                while True:
+                    try:
+                        line = next(log_generator)
+                    except StopIteration as ex:
+                        ex.value.RaiseOnError()
+                        break
 
-            while True:
-                result = self._Execute(
-                    '{} -n 10 --skip {}'.format(log_command_line, offset),
-                    add_newline=True,
-                )
-
-                result.RaiseOnError()
+                    if line == commit_delimiter:
+                        if commit_lines:
+                            yield "{}\n".format("\n".join(commit_lines))
+                            commit_lines = []
 
-                if (
-                    not result.output
-                    or result.output.isspace()
-                    or "does not have any commits yet" in result.output
-                ):
-                    break
+                        continue
 
-                commits = result.output.split(split_token)
+                    # Empty lines are not significant
+                    if line and not line.isspace():
+                        commit_lines.append(line)
 
-                assert commits
+                if commit_lines:
+                    yield "{}\n".format("\n".join(commit_lines))
 
-                # We can ignore the first commit, as the split will produce an empty
-                # string as the first element in the array.
-                assert not commits[0] or commits[0].isspace(), commits[0]
+            # ----------------------------------------------------------------------
 
-                for commit in commits[1:]:
-                    match = commit_regex.match(commit)
-                    if match is None:
-                        raise Exception("Unexpected git output:\n\n{}\n\n".format(commit))
+            # Merges will not include files, but tags are often applied to merges.
+            # If we detect a merge, don't send it but keep the tags around for the
+            # next commit (which will be the parent of the merge).
+            prev_tags: list[str] = []
 
-                    offset += 1
+            for commit in EnumCommits():
+                match = commit_regex.match(commit)
+                if match is None:
+                    raise Exception("Unexpected git output:\n\n{}\n\n".format(commit))
 
-                    # Extract the tag data
-                    tag_content = match.group("tags")
+                # Extract the tag data
+                tag_content = match.group("tags")
 
-                    tags: list[str] = []
+                tags: list[str] = []
 
-                    if tag_content:
-                        for potential_tag in tag_content.split(", "):
-                            potential_tag = potential_tag.strip()
+                if tag_content:
+                    for potential_tag in tag_content.split(", "):
+                        potential_tag = potential_tag.strip()
 
-                            if potential_tag.startswith("tag: "):
-                                tags.append(potential_tag[len("tag: "):])
+                        if potential_tag.startswith("tag: "):
+                            tags.append(potential_tag[len("tag: "):])
 
-                    # Extract the file data
-                    file_content = match.group("files")
+                # Extract the file data
+                file_content = match.group("files")
 
-                    if not file_content:
-                        # We are looking at a merge commit
-                        assert not prev_tags
-                        prev_tags = tags
+                if not file_content:
+                    # We are looking at a merge commit
+                    assert not prev_tags
+                    prev_tags = tags
 
-                        continue
+                    continue
 
-                    file_info = self.__class__.FileInfo.Extract(
-                        self.repo_root,
-                        file_content,
-                        rename_is_modification=rename_is_modification,
-                    )
-                    assert not file_info.ignored
+                file_info = self.__class__.FileInfo.Extract(
+                    self.repo_root,
+                    file_content,
+                    rename_is_modification=rename_is_modification,
+                )
+                assert not file_info.ignored
 
-                    yield DistributedRepositoryBase.ChangeInfo(
-                        match.group("commit_id"),
-                        match.group("description"),
-                        prev_tags + tags,
-                        match.group("author"),
-                        datetime.strptime(match.group("date"), "%Y-%m-%d %H:%M:%S %z"),
-                        file_info.added,
-                        file_info.removed,
-                        file_info.modified,
-                        file_info.working,
-                    )
+                yield DistributedRepositoryBase.ChangeInfo(
+                    match.group("commit_id"),
+                    match.group("description"),
+                    prev_tags + tags,
+                    match.group("author"),
+                    datetime.strptime(match.group("date"), "%Y-%m-%d %H:%M:%S %z"),
+                    file_info.added,
+                    file_info.removed,
+                    file_info.modified,
+                    file_info.working,
+                )
 
-                    prev_tags = []
+                prev_tags = []
 
             assert not prev_tags, prev_tags
 
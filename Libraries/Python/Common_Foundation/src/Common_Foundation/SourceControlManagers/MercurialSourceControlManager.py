@@ -577,6 +577,7 @@ class Repository(DistributedRepositoryBase):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         # ----------------------------------------------------------------------
         def GetDateOperator(
@@ -636,9 +637,10 @@ class Repository(DistributedRepositoryBase):
             query_filter += " and {}".format(" and ".join(additional_filters))
 
         return self._GetCommandLine(
-            r'hg log --branch "{source_branch}" --rev "{filter}" --template "{{rev}}\n"'.format(
+            r'hg log --branch "{source_branch}" --rev "{filter}" --template "{{rev}}\n"{pathspecs}'.format(
                 source_branch=source_branch,
                 filter=query_filter,
+                pathspecs="".join(' "{}"'.format(pathspec) for pathspec in (pathspecs or [])),
             ),
         )
 
@@ -655,12 +657,14 @@ class Repository(DistributedRepositoryBase):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[str, None, None]:
         result = self._Execute(
             self.GetEnumChangesSinceMergeCommandLine(
                 dest_branch,
                 source_merge_arg,
                 include_working_changes=include_working_changes,
+                pathspecs=pathspecs,
             ),
         )
         assert result.returncode == 0, result.output
@@ -684,6 +688,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         raise Exception("This functionality is not yet implemented.")
 
@@ -701,6 +706,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[DistributedRepositoryBase.ChangeInfo, None, None]:
         raise Exception("This functionality is not yet implemented.")
 
@@ -831,6 +837,7 @@ class Repository(DistributedRepositoryBase):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         raise Exception("This functionality is not yet implemented.")
 
@@ -839,6 +846,7 @@ class Repository(DistributedRepositoryBase):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[str, None, None]:
         raise Exception("This functionality is not yet implemented.")
 
@@ -848,6 +856,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> str:
         raise Exception("This functionality is not yet implemented.")
 
@@ -857,6 +866,7 @@ class Repository(DistributedRepositoryBase):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,
     ) -> Generator[DistributedRepositoryBase.ChangeInfo, None, None]:
         raise Exception("This functionality is not yet implemented.")
 
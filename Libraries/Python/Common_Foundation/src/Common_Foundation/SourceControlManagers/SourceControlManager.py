@@ -20,10 +20,11 @@ import sys
 import textwrap
 
 from abc import abstractmethod, ABC
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Generator, Optional, Union
+from typing import Any, ClassVar, Dict, List, Generator, Optional, Tuple, Union
 
 from . import UpdateMergeArgs
 
@@ -510,6 +511,22 @@ class Repository(ABC):
         """Returns information about a specific change."""
         raise Exception("Abstract method")  # pragma: no cover
 
+    # ----------------------------------------------------------------------
+    def GetGetChangeInfosCommandLine(
+        self,
+        changes: List[str],
+    ) -> str:
+        """Returns the command line used to implement Repository.GetChangeInfos"""
+        return " && ".join(self.GetGetChangeInfoCommandLine(change) for change in changes)
+
+    # ----------------------------------------------------------------------
+    def GetChangeInfos(
+        self,
+        changes: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Returns information about multiple changes; derived classes may override this to query them in bulk."""
+        return [self.GetChangeInfo(change) for change in changes]
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def GetAddFilesCommandLine(
@@ -627,6 +644,7 @@ class Repository(ABC):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> str:
         """Returns the command line used to implement Repository.EnumChangesSinceMerge"""
         raise Exception("Abstract method")  # pragma: no cover
@@ -645,6 +663,7 @@ class Repository(ABC):
         ],
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> Generator[str, None, None]:
         """Enumerates changes since the specified merge."""
         raise Exception("Abstract method")  # pragma: no cover
@@ -664,6 +683,7 @@ class Repository(ABC):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> str:
         """Returns the command line to implement Repository.EnumChangesSinceMergeEx"""
         raise Exception("Abstract method")  # pragma: no cover
@@ -683,6 +703,7 @@ class Repository(ABC):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> Generator["Repository.ChangeInfo", None, None]:
         """Enumerates changes since the specified merge."""
         raise Exception("Abstract method")  # pragma: no cover
@@ -729,6 +750,45 @@ class Repository(ABC):
 
         raise Exception("Abstract method")  # pragma: no cover
 
+    # ----------------------------------------------------------------------
+    def GetEnumBlameInfosCommandLine(
+        self,
+        filenames: List[Path],
+    ) -> str:
+        """Returns the command line used to implement Repository.EnumBlameInfos"""
+        return " && ".join(self.GetEnumBlameInfoCommandLine(filename) for filename in filenames)
+
+    # ----------------------------------------------------------------------
+    def EnumBlameInfos(
+        self,
+        filenames: List[Path],
+        *,
+        max_num_threads: Optional[int]=None,
+    ) -> Generator[Tuple[Path, List["Repository.EnumBlameInfoResult"]], None, None]:
+        """Enumerates blame information for multiple files concurrently; results are yielded as they complete."""
+
+        if max_num_threads == 1 or len(filenames) <= 1:
+            for filename in filenames:
+                yield filename, list(self.EnumBlameInfo(filename))
+
+            return
+
+        executor = ThreadPoolExecutor(max_num_threads)
+
+        try:
+            futures = {
+                executor.submit(lambda filename: list(self.EnumBlameInfo(filename)), filename): filename
+                for filename in filenames
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+        finally:
+            # Cancel pending work if the caller stops consuming results early; work that is already
+            # running is allowed to complete.
+            executor.shutdown(wait=True, cancel_futures=True)
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def GetEnumTrackedFilesCommandLine(self) -> str:
@@ -791,6 +851,7 @@ class Repository(ABC):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> str:
         """Returns the command line used to implement Repository.EnumChanges"""
         raise Exception("Abstract method")  # pragma: no cover
@@ -801,6 +862,7 @@ class Repository(ABC):
         self,
         *,
         include_working_changes: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> Generator[str, None, None]:
         """Enumerates changes on the local branch, starting with the most recent and working backwards in time."""
         raise Exception("Abstract method")  # pragma: no cover
@@ -812,6 +874,7 @@ class Repository(ABC):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> str:
         """Returns the command line used to implement Repository.EnumChangesEx"""
         raise Exception("Abstract method")  # pragma: no cover
@@ -823,6 +886,7 @@ class Repository(ABC):
         *,
         include_working_changes: bool=False,
         rename_is_modification: bool=False,
+        pathspecs: Optional[List[str]]=None,          # Limit the changes to those that modify these paths
     ) -> Generator["Repository.ChangeInfo", None, None]:
         """Enumerates changes on the local branch, starting with the most recent and working backwards in time."""
         raise Exception("Abstract method")  # pragma: no cover
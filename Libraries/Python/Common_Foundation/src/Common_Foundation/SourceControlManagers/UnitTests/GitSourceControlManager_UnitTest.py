@@ -0,0 +1,367 @@
+# ----------------------------------------------------------------------
+# |
+# |  GitSourceControlManager_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 22:00:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for GitSourceControlManager"""
+
+import gc
+import os
+import sqlite3
+import subprocess
+import weakref
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from ..GitSourceControlManager import GitSourceControlManager, Repository
+
+
+# ----------------------------------------------------------------------
+if not GitSourceControlManager().IsAvailable():
+    pytest.skip("git is not available", allow_module_level=True)
+
+
+# ----------------------------------------------------------------------
+def test_GetChangeInfoFastPath(tmp_path, monkeypatch):
+    repo = _CreateRepository(tmp_path)
+
+    changes = [
+        _Commit(repo, "one.txt", "Single line", date="1700000000 +0000"),
+        _Commit(repo, "two.txt", "  Leading whitespace  \nsecond line\t\n\nBody", date="1700000100 -0730"),
+        _Commit(repo, "three.txt", "\n\nLeading blank lines", date="1700000200 +0545"),
+        _Commit(repo, "four.txt", "Non-UTF8 encoding: \u00e9", date="1700000300 +0100", encoding="iso-8859-1"),
+    ]
+
+    expected_results = [_GetExpectedChangeInfo(repo, change) for change in changes]
+
+    # Commits that use a custom encoding are processed by git
+    assert repo.GetChangeInfo(changes[-1]) == expected_results[-1]
+
+    # Other commits are decoded without invoking the command line
+    with monkeypatch.context() as m:
+        m.setattr(Repository, "GetGetChangeInfoCommandLine", _RaiseUnexpectedCall)
+
+        for change, expected_result in zip(changes[:-1], expected_results[:-1]):
+            assert repo.GetChangeInfo(change) == expected_result
+
+    # Customized output isn't produced from the commit object
+    _Git(tmp_path, "config", "log.date", "iso")
+
+    scm = GitSourceControlManager()
+    repo = scm.Open(tmp_path)
+
+    for change in changes:
+        change_info = repo.GetChangeInfo(change)
+
+        assert change_info == _GetExpectedChangeInfo(repo, change)
+        assert change_info["date"].startswith("20")
+
+
+# ----------------------------------------------------------------------
+def test_ChangeInfoCache(tmp_path, monkeypatch):
+    monkeypatch.delenv(GitSourceControlManager.DISABLE_CHANGE_INFO_CACHE_ENV_VAR, raising=False)
+
+    cache_filename = tmp_path / ".git" / GitSourceControlManager._ChangeInfoCache.FILENAME  # pylint: disable=protected-access
+
+    repo = _CreateRepository(tmp_path)
+
+    changes = [
+        _Commit(repo, "one.txt", "First", date="1700000000 +0000"),
+        _Commit(repo, "two.txt", "Second\n\nBody", date="1700000100 -0730"),
+        _Commit(repo, "three.txt", "Third", date="1700000200 +0545"),
+    ]
+
+    # Uncached results
+    repo = GitSourceControlManager(use_change_info_cache=False).Open(tmp_path)
+
+    expected_results = [repo.GetChangeInfo(change) for change in changes]
+
+    assert repo.GetChangeInfos(changes) == expected_results
+    assert not cache_filename.exists()
+
+    # Populate the cache
+    scm = GitSourceControlManager()
+    repo = scm.Open(tmp_path)
+
+    assert repo.GetChangeInfos(changes[:1]) == expected_results[:1]
+    assert repo.GetChangeInfo(changes[1]) == expected_results[1]
+
+    scm.Close()
+
+    assert cache_filename.is_file()
+
+    # Cache hits in a new instance don't read commits or invoke git log
+    scm = GitSourceControlManager()
+    repo = scm.Open(tmp_path)
+
+    with monkeypatch.context() as m:
+        m.setattr(GitSourceControlManager, "ReadObject", _RaiseUnexpectedCall)
+        m.setattr(Repository, "GetGetChangeInfosCommandLine", _RaiseUnexpectedCall)
+
+        assert [repo.GetChangeInfo(change) for change in changes[:2]] == expected_results[:2]
+        assert repo.GetChangeInfos(list(reversed(changes[:2]))) == list(reversed(expected_results[:2]))
+
+    # Cached and uncached results are combined
+    assert repo.GetChangeInfos(changes) == expected_results
+
+    scm.ClearChangeInfoCache(tmp_path)
+    assert not cache_filename.exists()
+
+    # The cache can be disabled via the environment
+    monkeypatch.setenv(GitSourceControlManager.DISABLE_CHANGE_INFO_CACHE_ENV_VAR, "1")
+
+    repo = GitSourceControlManager().Open(tmp_path)
+
+    assert repo.GetChangeInfos(changes) == expected_results
+    assert not cache_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_ReleaseResourcesWhenCollected(tmp_path, monkeypatch):
+    monkeypatch.delenv(GitSourceControlManager.DISABLE_CHANGE_INFO_CACHE_ENV_VAR, raising=False)
+
+    change = _Commit(_CreateRepository(tmp_path), "one.txt", "First")
+
+    scm = GitSourceControlManager()
+    repo = scm.Open(tmp_path)
+
+    assert repo.GetChangeInfo(change)
+    assert scm.GetObjectInfo(tmp_path, change) is not None
+
+    processes = [
+        process._process  # pylint: disable=protected-access
+        for process in scm._cat_file_processes.values()  # pylint: disable=protected-access
+    ]
+
+    caches = [
+        cache
+        for cache in scm._change_info_caches.values()  # pylint: disable=protected-access
+        if cache is not None
+    ]
+
+    assert processes
+    assert all(process.poll() is None for process in processes)
+    assert caches
+
+    # The resources don't keep the object alive, and they are released when it is collected
+    scm_ref = weakref.ref(scm)
+
+    del repo
+    del scm
+    gc.collect()
+
+    assert scm_ref() is None
+
+    assert all(process.poll() is not None for process in processes)
+
+    for cache in caches:
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache._connection.execute("SELECT 1")  # pylint: disable=protected-access
+
+
+# ----------------------------------------------------------------------
+def test_GetChangeInfosCommandLineLength(tmp_path, monkeypatch):
+    repo = _CreateRepository(tmp_path)
+
+    changes = [
+        _Commit(repo, "{}.txt".format(index), "Commit {}".format(index), date="{} +0000".format(1700000000 + index))
+        for index in range(7)
+    ]
+
+    repo = GitSourceControlManager(use_change_info_cache=False).Open(tmp_path)
+
+    expected_results = [repo.GetChangeInfo(change) for change in changes]
+
+    # Limit the command line to (roughly) 2 commits
+    max_length = len(repo._GetChangeInfosCommandLines(changes[:2])[0]) + 10  # pylint: disable=protected-access
+
+    monkeypatch.setattr(Repository, "_CHANGE_INFOS_MAX_COMMAND_LINE_LENGTH", max_length)
+
+    command_lines = repo._GetChangeInfosCommandLines(list(reversed(changes)))  # pylint: disable=protected-access
+
+    assert len(command_lines) == 4
+    assert all(len(command_line) <= max_length for command_line in command_lines)
+
+    assert repo.GetChangeInfos(list(reversed(changes))) == list(reversed(expected_results))
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("index_version", [2, 3, 4])
+def test_ReadIndexFilenames(tmp_path, index_version):
+    repo = _CreateRepository(tmp_path)
+
+    filenames = [
+        "one.txt",
+        "dir/two.txt",
+        "dir/sub/three.txt",
+        "dir/sub_dir/four.txt",
+        "name with spaces.txt",
+        "caf\u00e9/\u00fcber.txt",
+    ]
+
+    for filename in filenames:
+        (tmp_path / filename).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / filename).write_text(filename, encoding="utf-8")
+
+    _Git(tmp_path, "add", ".")
+    _Git(tmp_path, "commit", "--quiet", "-m", "Initial")
+
+    # Entries with extended flags require version 3 or later
+    if index_version >= 3:
+        (tmp_path / "dir" / "intent_to_add.txt").write_text("intent to add")
+        _Git(tmp_path, "add", "--intent-to-add", "dir/intent_to_add.txt")
+
+    # Optional extensions are skipped
+    _Git(tmp_path, "update-index", "--untracked-cache")
+    _Git(tmp_path, "update-index", "--index-version", str(index_version))
+
+    index_filename = tmp_path / ".git" / "index"
+
+    assert index_filename.read_bytes()[4:8] == index_version.to_bytes(4, "big")
+
+    expected_filenames = _Git(tmp_path, "-c", "core.quotePath=false", "ls-files", "-z").rstrip("\0").split("\0")
+
+    assert "caf\u00e9/\u00fcber.txt" in expected_filenames
+
+    assert Repository._ReadIndexFilenames(index_filename) == expected_filenames  # pylint: disable=protected-access
+    assert list(repo.EnumTrackedFiles()) == [tmp_path / filename for filename in expected_filenames]
+
+
+# ----------------------------------------------------------------------
+def test_ReadIndexFilenamesUnsupported(tmp_path, monkeypatch):
+    repo = _CreateRepository(tmp_path)
+
+    for filename in ["one.txt", "caf\u00e9.txt"]:
+        (tmp_path / filename).write_text(filename, encoding="utf-8")
+
+    _Git(tmp_path, "add", ".")
+
+    # Split indexes aren't processed directly
+    _Git(tmp_path, "update-index", "--split-index")
+
+    index_filename = tmp_path / ".git" / "index"
+
+    assert Repository._ReadIndexFilenames(index_filename) is None  # pylint: disable=protected-access
+    assert list(repo.EnumTrackedFiles()) == [tmp_path / "caf\u00e9.txt", tmp_path / "one.txt"]
+
+    # Neither are corrupt indexes
+    _Git(tmp_path, "update-index", "--no-split-index")
+
+    content = bytearray(index_filename.read_bytes())
+    assert Repository._ReadIndexFilenames(index_filename) == ["caf\u00e9.txt", "one.txt"]  # pylint: disable=protected-access
+
+    content[20] ^= 0xFF
+    index_filename.write_bytes(bytes(content))
+
+    assert Repository._ReadIndexFilenames(index_filename) is None  # pylint: disable=protected-access
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Git(
+    repo_root: Path,
+    *args: str,
+    env: Optional[Dict[str, str]]=None,
+) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo_root), *args],
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            **{
+                "GIT_AUTHOR_NAME": "Test User",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "Test User",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+            **(env or {}),
+        },
+    ).stdout.decode("utf-8", errors="replace").strip()
+
+
+# ----------------------------------------------------------------------
+def _CreateRepository(
+    repo_root: Path,
+) -> Repository:
+    _Git(repo_root, "init", "--quiet")
+
+    return GitSourceControlManager().Open(repo_root)
+
+
+# ----------------------------------------------------------------------
+def _Commit(
+    repo: Repository,
+    filename: str,
+    message: str,
+    *,
+    date: str="1700000000 +0000",
+    encoding: Optional[str]=None,
+) -> str:
+    (repo.repo_root / filename).write_text(filename)
+
+    _Git(repo.repo_root, "add", filename)
+
+    commit_args = ["commit", "--quiet", "--cleanup=verbatim", "-F", "-"]
+
+    if encoding is not None:
+        commit_args = ["-c", "i18n.commitEncoding={}".format(encoding)] + commit_args
+
+    subprocess.run(
+        ["git", "-C", str(repo.repo_root), *commit_args],
+        check=True,
+        capture_output=True,
+        input=message.encode(encoding or "utf-8"),
+        env={
+            **os.environ,
+            **{
+                "GIT_AUTHOR_NAME": "Test User",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_AUTHOR_DATE": date,
+                "GIT_COMMITTER_NAME": "Test User",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+                "GIT_COMMITTER_DATE": date,
+            },
+        },
+    )
+
+    return _Git(repo.repo_root, "rev-parse", "HEAD")
+
+
+# ----------------------------------------------------------------------
+def _RaiseUnexpectedCall(*args, **kwargs):  # pylint: disable=unused-argument
+    raise Exception("Unexpected call")
+
+
+# ----------------------------------------------------------------------
+def _GetExpectedChangeInfo(
+    repo: Repository,
+    change: str,
+) -> dict:
+    """Returns the results produced by the command line (without any optimizations)"""
+
+    result = GitSourceControlManager.Execute(repo.GetGetChangeInfoCommandLine(change))
+    assert result.returncode == 0, result.output
+
+    lines = result.output.split("\n")
+
+    return {
+        "user": lines[0].lstrip(),
+        "date": lines[1].lstrip(),
+        "summary": lines[2].lstrip(),
+        "files": list(repo.EnumChangedFiles(change)),
+    }
@@ -25,6 +25,8 @@ class TextWriter(ABC):
     for functionality in this module; this is mostly for documentation purposes.
     """
 
+    __slots__ = ()
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def isatty(self) -> bool:
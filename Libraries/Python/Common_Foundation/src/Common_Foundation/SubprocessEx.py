@@ -18,13 +18,15 @@
 import os
 import copy
 import ctypes
+import io
 import subprocess
 import sys
+import tempfile
 import textwrap
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, cast, Dict, IO, List, Optional, TextIO, Union
+from typing import Any, Callable, cast, Dict, Generator, IO, List, Optional, TextIO, Union
 
 from .ContextlibEx import ExitStack
 from .Streams.Capabilities import Capabilities
@@ -237,6 +239,80 @@ def Stream(
         return _PostprocessReturnCode(result)
 
 
+# ----------------------------------------------------------------------
+def StreamLines(
+    command_line: str,
+    cwd: Optional[Path]=None,
+    env: Optional[Dict[str, str]]=None,
+    *,
+    separator: Optional[str]=None,                      # Split output on this value rather than on lines
+) -> Generator[str, None, RunResult]:
+    """Yields stdout lines as they are produced; the RunResult returned contains stderr output"""
+
+    with tempfile.TemporaryFile() as stderr:
+        with subprocess.Popen(
+            command_line,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            stdin=subprocess.DEVNULL,
+            cwd=cwd,
+            env=_SetEnvironment(
+                env,
+                **{
+                    Capabilities.SIMULATE_TERMINAL_INTERACTIVE_ENV_VAR: "0",
+                    Capabilities.SIMULATE_TERMINAL_HEADLESS_ENV_VAR: "1",
+                },
+            ),
+        ) as process:
+            assert process.stdout is not None
+
+            is_complete = False
+
+            try:
+                if separator is None:
+                    for line in process.stdout:
+                        yield line.decode("utf-8").rstrip("\r\n")
+
+                else:
+                    encoded_separator = separator.encode("utf-8")
+                    buffer = b""
+
+                    while True:
+                        data = cast(io.BufferedReader, process.stdout).read1(64 * 1024)
+                        if not data:
+                            break
+
+                        items = (buffer + data).split(encoded_separator)
+                        buffer = items.pop()
+
+                        for item in items:
+                            yield item.decode("utf-8")
+
+                    if buffer:
+                        yield buffer.decode("utf-8")
+
+                is_complete = True
+
+            finally:
+                # Terminate the process if the caller stopped consuming output early
+                if not is_complete:
+                    process.kill()
+
+            returncode = process.wait()
+
+        stderr.seek(0)
+        content = stderr.read().decode("utf-8")
+
+    returncode = _PostprocessReturnCode(returncode)
+
+    return RunResult(
+        returncode,
+        content,
+        command_line if returncode != 0 else None,
+    )
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Private Types
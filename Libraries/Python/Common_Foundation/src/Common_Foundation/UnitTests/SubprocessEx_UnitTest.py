@@ -0,0 +1,176 @@
+# ----------------------------------------------------------------------
+# |
+# |  SubprocessEx_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 23:00:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for SubprocessEx"""
+
+import sys
+import textwrap
+import time
+
+from pathlib import Path
+from typing import Generator, List, Tuple
+
+import pytest
+
+from ..SubprocessEx import RunResult, StreamLines
+
+
+# ----------------------------------------------------------------------
+def test_StreamLines(tmp_path):
+    command_line = _CreateCommandLine(
+        tmp_path,
+        """\
+        sys.stdout.buffer.write(b"one\\ntwo\\r\\n\\nthree")
+        sys.stderr.write("stderr content")
+        """,
+    )
+
+    items, result = _Consume(StreamLines(command_line))
+
+    assert items == ["one", "two", "", "three"]
+    assert result.returncode == 0
+    assert result.output == "stderr content"
+    assert result.error_command_line is None
+
+    result.RaiseOnError()
+
+
+# ----------------------------------------------------------------------
+def test_StreamLinesError(tmp_path):
+    command_line = _CreateCommandLine(
+        tmp_path,
+        """\
+        sys.stdout.write("line\\n")
+        sys.stderr.write("an error")
+        sys.exit(3)
+        """,
+    )
+
+    items, result = _Consume(StreamLines(command_line))
+
+    assert items == ["line"]
+    assert result.returncode == 3
+    assert result.output == "an error"
+    assert result.error_command_line == command_line
+
+    with pytest.raises(Exception, match="an error"):
+        result.RaiseOnError()
+
+
+# ----------------------------------------------------------------------
+def test_StreamLinesSeparator(tmp_path):
+    # Items larger than a single read ensure that items span multiple chunks
+    large_item = "x" * (200 * 1024)
+
+    command_line = _CreateCommandLine(
+        tmp_path,
+        """\
+        Write(b"first--SEP--")
+        Write(b"second--S")
+        Write(b"EP--")
+        Write(b"--SEP--")
+        Write("{large_item}--SEP--".encode("utf-8"))
+        Write("caf\\u00e9".encode("utf-8")[:-1])
+        Write("caf\\u00e9".encode("utf-8")[-1:])
+        Write(b"--SEP--trailing")
+        """.format(large_item=large_item),
+    )
+
+    items, result = _Consume(StreamLines(command_line, separator="--SEP--"))
+
+    assert items == ["first", "second", "", large_item, "café", "trailing"]
+    assert result.returncode == 0
+    assert result.output == ""
+
+
+# ----------------------------------------------------------------------
+def test_StreamLinesSeparatorNoTrailingItem(tmp_path):
+    command_line = _CreateCommandLine(
+        tmp_path,
+        """\
+        Write(b"one\\0two\\0")
+        """,
+    )
+
+    items, result = _Consume(StreamLines(command_line, separator="\0"))
+
+    assert items == ["one", "two"]
+    assert result.returncode == 0
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("separator", [None, "\n"])
+def test_StreamLinesEarlyClose(tmp_path, separator):
+    command_line = _CreateCommandLine(
+        tmp_path,
+        """\
+        while True:
+            Write(b"line\\n")
+        """,
+    )
+
+    generator = StreamLines(command_line, separator=separator)
+
+    assert [next(generator) for _ in range(3)] == ["line", "line", "line"]
+
+    start = time.perf_counter()
+    generator.close()
+
+    # The process is terminated rather than run to completion
+    assert time.perf_counter() - start < 10
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateCommandLine(
+    temp_directory: Path,
+    script_content: str,
+) -> str:
+    script_filename = temp_directory / "script.py"
+
+    script_filename.write_text(
+        textwrap.dedent(
+            """\
+            import sys
+            import time
+
+            def Write(content):
+                sys.stdout.buffer.write(content)
+                sys.stdout.buffer.flush()
+
+                # Give the reader a chance to consume the content written so far
+                time.sleep(0.05)
+
+            {}
+            """,
+        ).format(textwrap.dedent(script_content)),
+        encoding="utf-8",
+    )
+
+    return '"{}" "{}"'.format(sys.executable, script_filename)
+
+
+# ----------------------------------------------------------------------
+def _Consume(
+    generator: Generator[str, None, RunResult],
+) -> Tuple[List[str], RunResult]:
+    items: List[str] = []
+
+    while True:
+        try:
+            items.append(next(generator))
+        except StopIteration as ex:
+            return items, ex.value
@@ -45,6 +45,8 @@ class CodeGenerator(
         input_processor: IInputProcessor,
         output_processor: IOutputProcessor,
         *args,
+        use_content_hashes: bool=False,
+        only_write_changed_outputs: bool=False,
         **kwargs,
     ):
         CompilerImpl.__init__(
@@ -56,11 +58,17 @@ class CodeGenerator(
                 **kwargs,
                 **{
                     "requires_output_dir": True,
+                    "only_write_changed_outputs": only_write_changed_outputs,
                 },
             },
         )
 
-        ConditionalInvocationQueryMixin.__init__(self, input_processor, output_processor)
+        ConditionalInvocationQueryMixin.__init__(
+            self,
+            input_processor,
+            output_processor,
+            use_content_hashes=use_content_hashes,
+        )
 
     # ----------------------------------------------------------------------
     @overridemethod
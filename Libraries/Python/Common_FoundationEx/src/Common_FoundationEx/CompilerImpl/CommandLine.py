@@ -323,6 +323,7 @@ class _ContextInfo(object):
         plugin_args: dict[str, Any],
         plugin_help: bool,
         single_task: bool,
+        single_threaded: bool,
     ) -> "_ContextInfo":
         result = compiler.ValidateEnvironment()
         if result is not None:
@@ -356,6 +357,7 @@ class _ContextInfo(object):
                     inputs,
                     metadata,
                     do_not_decorate_output_dir_with_index=single_task,
+                    parallel=compiler.can_generate_contexts_in_parallel and not single_threaded,
                 )
             except DoneManagerException:
                 generate_dm.result = -1
@@ -464,6 +466,7 @@ def _InvokeImpl(
         plugin_args=plugin_args,
         plugin_help=plugin_help,
         single_task=single_task,
+        single_threaded=single_threaded,
     )
 
     if not context_info.contexts:
@@ -813,6 +816,7 @@ def _CleanImpl(
         plugin_args=plugin_args,
         plugin_help=plugin_help,
         single_task=False,
+        single_threaded=False,
     )
 
     if not context_info.contexts:
@@ -862,6 +866,7 @@ def _ListImpl(
             plugin_args=plugin_args,
             plugin_help=plugin_help,
             single_task=False,
+            single_threaded=False,
         )
 
         with dm.YieldStream() as stream:
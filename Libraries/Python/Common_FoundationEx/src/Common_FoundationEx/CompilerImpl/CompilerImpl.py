@@ -15,10 +15,12 @@
 # ----------------------------------------------------------------------
 """Contains the CompilerImpl object"""
 
+import io
 import re
 import textwrap
 
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import auto, Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional, Pattern, TextIO, Tuple, Union
@@ -28,6 +30,7 @@ from rich import box
 from rich.panel import Panel
 
 from Common_Foundation.EnumSource import EnumSource
+from Common_Foundation.Streams.Capabilities import Capabilities
 from Common_Foundation.Streams.DoneManager import DoneManager, DoneManagerFlags
 from Common_Foundation import TextwrapEx
 from Common_Foundation.Types import extensionmethod
@@ -100,7 +103,9 @@ class CompilerImpl(
         *,
         requires_output_dir: bool,
         can_execute_in_parallel: bool=True,
+        can_generate_contexts_in_parallel: bool=False,  # True if `_CreateContext` and `_EnumerateGeneratorFiles` are thread-safe
         potential_test_item_separators: Optional[List[str]]=None,
+        only_write_changed_outputs: bool=False,         # Leave output files (and their modification times) untouched when generated content is identical
     ):
         self.invocation_method_name         = invocation_method_name
         self.name                           = name
@@ -108,6 +113,8 @@ class CompilerImpl(
         self.input_type                     = input_type
         self.requires_output_dir            = requires_output_dir
         self.can_execute_in_parallel        = can_execute_in_parallel
+        self.can_generate_contexts_in_parallel          = can_generate_contexts_in_parallel
+        self.only_write_changed_outputs     = only_write_changed_outputs
 
         self._invocation_description        = invocation_description
 
@@ -288,6 +295,7 @@ class CompilerImpl(
         metadata: Dict[str, Any],
         *,
         do_not_decorate_output_dir_with_index: bool=False,
+        parallel: bool=False,
     ) -> Generator[Dict[str, Any], None, None]:
         """\
         Generates one or more context items based on the provided metadata input.
@@ -296,6 +304,10 @@ class CompilerImpl(
         the input to determine if compilation is necessary.
 
         Context objects must support pickling.
+
+        When `parallel` is True, input directories are walked and contexts are created on
+        a thread pool; contexts are yielded in the same order as they would be otherwise.
+        This should only be used with compilers that set `can_generate_contexts_in_parallel`.
         """
 
         if isinstance(input_or_inputs, list):
@@ -320,29 +332,7 @@ class CompilerImpl(
                 if self.IsSupported(input_item):
                     all_input_items[input_item] = [input_item, ]
                 else:
-                    these_inputs: List[Path] = []
-
-                    for root, directories, filenames in EnumSource(input_item):
-                        if self.IsIgnoredDirectory(root):
-                            directories[:] = []
-                            continue
-
-                        if self.input_type == InputType.Files:
-                            for filename in filenames:
-                                fullpath = root / filename
-
-                                if self.IsSupported(fullpath):
-                                    these_inputs.append(fullpath)
-
-                        elif self.input_type == InputType.Directories:
-                            for directory in directories:
-                                fullpath = root / directory
-
-                                if self.IsSupported(fullpath):
-                                    these_inputs.append(fullpath)
-
-                        else:
-                            assert False, self.input_type  # pragma: no cover
+                    these_inputs = self._CollectInputItems(input_item, parallel=parallel)
 
                     if these_inputs:
                         all_input_items[input_item] = these_inputs
@@ -367,7 +357,9 @@ class CompilerImpl(
         required_metadata_names = self._GetRequiredMetadataNames()
         required_context_names = self._GetRequiredContextNames()
 
-        # Generate the context items
+        # Generate the metadata items
+        all_generated_metadata: List[Dict[str, Any]] = []
+
         for index, (item_root, input_items) in enumerate(all_input_items.items()):
             if (
                 self.requires_output_dir
@@ -418,11 +410,37 @@ class CompilerImpl(
                 if display_name:
                     generated_metadata["display_name"] = display_name
 
+                all_generated_metadata.append(generated_metadata)
+
+        # Generate the context items
+        futures: List[Optional[Future]] = [None, ] * len(all_generated_metadata)
+        executor: Optional[ThreadPoolExecutor] = None
+
+        if parallel and len(all_generated_metadata) > 1:
+            executor = ThreadPoolExecutor()
+
+            futures = [
+                executor.submit(self._CreateBufferedContext, dm, generated_metadata)
+                for generated_metadata in all_generated_metadata
+            ]
+
+        try:
+            for generated_metadata, future in zip(all_generated_metadata, futures):
                 # Create the context
                 with dm.Nested(
                     "Creating context for '{}'...".format(generated_metadata["display_name"]),
                 ) as this_dm:
-                    context = self._CreateContext(this_dm, generated_metadata)
+                    if future is None:
+                        context = self._CreateContext(this_dm, generated_metadata)
+                    else:
+                        context, result, output = future.result()
+
+                        if output:
+                            with this_dm.YieldStream() as stream:
+                                stream.write(output)
+
+                        this_dm.result = result
+
                     if not context or this_dm.result != 0:
                         continue
 
@@ -439,6 +457,12 @@ class CompilerImpl(
 
                 yield context
 
+        finally:
+            if executor is not None:
+                # Cancel pending work if the caller stops consuming results early; work that is
+                # already running is allowed to complete.
+                executor.shutdown(wait=True, cancel_futures=True)
+
     # ----------------------------------------------------------------------
     def GetSingleContextItem(
         self,
@@ -592,6 +616,41 @@ class CompilerImpl(
 
                 return invoke_dm.result
 
+    # ----------------------------------------------------------------------
+    def _WriteOutputFile(
+        self,
+        filename: Path,
+        content: str,
+        *,
+        encoding: Optional[str]=None,
+        only_write_changed_outputs: Optional[bool]=None,    # Overrides the value provided when the object was created
+    ) -> bool:
+        """\
+        Writes content to an output file, returning True if the file was written or False if
+        `only_write_changed_outputs` is set and the file already contains the content.
+        """
+
+        if only_write_changed_outputs is None:
+            only_write_changed_outputs = self.only_write_changed_outputs
+
+        # Encode the content in the same way that `open(filename, "w")` would
+        buffer = io.BytesIO()
+
+        with io.TextIOWrapper(buffer, encoding=encoding) as wrapper:
+            wrapper.write(content)
+            wrapper.flush()
+
+            data = buffer.getvalue()
+
+        if only_write_changed_outputs and filename.is_file():
+            if filename.stat().st_size == len(data) and filename.read_bytes() == data:
+                return False
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        filename.write_bytes(data)
+
+        return True
+
     # ----------------------------------------------------------------------
     # |
     # |  Private Types
@@ -633,3 +692,89 @@ class CompilerImpl(
                 )
 
         return "{} {}".format(description, status_suffix)
+
+    # ----------------------------------------------------------------------
+    def _CollectInputItems(
+        self,
+        input_dir: Path,
+        *,
+        parallel: bool,
+    ) -> List[Path]:
+        """Returns the supported inputs within the directory, walking its subtrees concurrently when requested"""
+
+        input_items: List[Path] = []
+        subdirectories: List[Path] = []
+
+        for root, directories, filenames in EnumSource(input_dir):
+            if self.IsIgnoredDirectory(root):
+                directories[:] = []
+                continue
+
+            if self.input_type == InputType.Files:
+                for filename in filenames:
+                    fullpath = root / filename
+
+                    if self.IsSupported(fullpath):
+                        input_items.append(fullpath)
+
+            elif self.input_type == InputType.Directories:
+                for directory in directories:
+                    fullpath = root / directory
+
+                    if self.IsSupported(fullpath):
+                        input_items.append(fullpath)
+
+            else:
+                assert False, self.input_type  # pragma: no cover
+
+            if parallel:
+                # Walk each subtree on its own thread (os.walk doesn't follow links, so neither do we)
+                subdirectories += [
+                    root / directory
+                    for directory in directories
+                    if not (root / directory).is_symlink()
+                ]
+
+                directories[:] = []
+
+        if len(subdirectories) == 1:
+            input_items += self._CollectInputItems(subdirectories[0], parallel=False)
+        elif subdirectories:
+            with ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(self._CollectInputItems, subdirectory, parallel=False)
+                    for subdirectory in subdirectories
+                ]
+
+                for future in futures:
+                    input_items += future.result()
+
+        return input_items
+
+    # ----------------------------------------------------------------------
+    def _CreateBufferedContext(
+        self,
+        dm: DoneManager,
+        metadata: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], int, str]:
+        """Creates a context on a worker thread, capturing output so that it can be written in order by the caller"""
+
+        sink = io.StringIO()
+
+        Capabilities.Create(
+            sink,
+            is_interactive=False,
+            supports_colors=dm.capabilities.supports_colors,
+            is_headless=True,
+        )
+
+        with DoneManager.Create(
+            sink,
+            "",
+            output_flags=dm.output_flags,
+            display=False,
+            display_exceptions=False,
+        ) as this_dm:
+            context = self._CreateContext(this_dm, metadata)
+
+        return context, this_dm.result, sink.getvalue()
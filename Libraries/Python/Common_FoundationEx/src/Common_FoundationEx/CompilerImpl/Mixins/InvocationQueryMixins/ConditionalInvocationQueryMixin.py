@@ -16,16 +16,18 @@
 """Contains the ConditionalInvocationQueryMixin object"""
 
 import base64
+import hashlib
 import inspect
+import itertools
+import os
 import pickle
 import textwrap
 import traceback
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Set, Tuple
 
-from Common_Foundation import RegularExpression
 from Common_Foundation.Streams.DoneManager import DoneManager
 from Common_Foundation.Types import extensionmethod, overridemethod
 
@@ -59,10 +61,12 @@ class ConditionalInvocationQueryMixin(
         output_processor: IOutputProcessor,
         *,
         always_generate: bool=False,
+        use_content_hashes: bool=False,     # Detect modified files by content rather than by modification time
     ):
         self._input_processor               = input_processor
         self._output_processor              = output_processor
         self._always_generate               = always_generate
+        self._use_content_hashes            = use_content_hashes
 
     # ----------------------------------------------------------------------
     # |
@@ -114,10 +118,42 @@ class ConditionalInvocationQueryMixin(
             context,
         )
 
+        # Files whose modification time changed but whose content did not
+        updated_file_hashes: Dict[Path, Tuple[int, int, str]] = {}
+
+        # ----------------------------------------------------------------------
+        def HasFileBeenModified(
+            filename: Path,
+        ) -> bool:
+            stat_result = filename.stat()
+
+            file_hash_info = None
+
+            if self._use_content_hashes and prev_info.file_hashes is not None:
+                file_hash_info = prev_info.file_hashes.get(filename, None)
+
+            if file_hash_info is None:
+                return stat_result.st_mtime > prev_modified_time
+
+            prev_size, prev_mtime_ns, prev_hash = file_hash_info
+
+            if stat_result.st_size != prev_size:
+                return True
+
+            # Only calculate the hash if the modification time has changed
+            if stat_result.st_mtime_ns == prev_mtime_ns:
+                return False
+
+            if _PersistedInfo.CalculateHash(filename) != prev_hash:
+                return True
+
+            updated_file_hashes[filename] = (prev_size, stat_result.st_mtime_ns, prev_hash)
+            return False
+
         # ----------------------------------------------------------------------
         def HaveGeneratorFilesBeenModified() -> Optional[Path]:
             for filename in self._EnumerateGeneratorFiles(context):
-                if filename.stat().st_mtime > prev_modified_time:
+                if HasFileBeenModified(filename):
                     return filename
 
             return None
@@ -136,18 +172,8 @@ class ConditionalInvocationQueryMixin(
 
         # ----------------------------------------------------------------------
         def HaveInputsBeenModified() -> Optional[Path]:
-            input_filenames: List[Path] = []
-
-            for input_item in self._input_processor.GetInputItems(context):
-                if input_item.is_file():
-                    input_filenames.append(input_item)
-                elif input_item.is_dir():
-                    for item in input_item.iterdir():
-                        if item.is_file():
-                            input_filenames.append(item)
-
-            for input_filename in input_filenames:
-                if input_filename.stat().st_mtime > prev_modified_time:
+            for input_filename in self._GetInputFilenames(context):
+                if HasFileBeenModified(input_filename):
                     return input_filename
 
             return None
@@ -205,6 +231,15 @@ class ConditionalInvocationQueryMixin(
                 dm.WriteInfo("Invoking because {}.\n\n".format(desc_template.format(result=str(result))))
                 return invoke_reason
 
+        # Persist the new modification times so that the files aren't hashed again during subsequent
+        # invocations. The modification time of the persisted file is preserved, as it is compared to
+        # the modification times of files without hashes.
+        if updated_file_hashes:
+            assert prev_info.file_hashes is not None
+            prev_info.file_hashes.update(updated_file_hashes)
+
+            prev_info.Save(preserve_modified_time=True)
+
         return None
 
     # ----------------------------------------------------------------------
@@ -213,10 +248,29 @@ class ConditionalInvocationQueryMixin(
         self,
         context: Dict[str, Any],  # pylint: disable=unused-argument
     ) -> None:
+        file_hashes: Optional[Dict[Path, Tuple[int, int, str]]] = None
+
+        if self._use_content_hashes:
+            file_hashes = {}
+
+            for filename in itertools.chain(
+                self._GetInputFilenames(context),
+                self._EnumerateGeneratorFiles(context),
+            ):
+                if filename not in file_hashes:
+                    stat_result = filename.stat()
+
+                    file_hashes[filename] = (
+                        stat_result.st_size,
+                        stat_result.st_mtime_ns,
+                        _PersistedInfo.CalculateHash(filename),
+                    )
+
         _PersistedInfo.Create(
             self._input_processor,
             self._output_processor,
             context,
+            file_hashes,
         ).Save()
 
     # ----------------------------------------------------------------------
@@ -251,6 +305,23 @@ class ConditionalInvocationQueryMixin(
 
         return super(ConditionalInvocationQueryMixin, self)._CreateContext(dm, metadata)
 
+    # ----------------------------------------------------------------------
+    def _GetInputFilenames(
+        self,
+        context: Dict[str, Any],
+    ) -> List[Path]:
+        input_filenames: List[Path] = []
+
+        for input_item in self._input_processor.GetInputItems(context):
+            if input_item.is_file():
+                input_filenames.append(input_item)
+            elif input_item.is_dir():
+                for item in input_item.iterdir():
+                    if item.is_file():
+                        input_filenames.append(item)
+
+        return input_filenames
+
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -268,11 +339,19 @@ class _PersistedInfo(object):
         """,
     )
 
+    # The template is split into its prefix and suffix rather than being converted into a regular
+    # expression, as matching the (potentially large) data with a regular expression is slow.
+    TEMPLATE_PREFIX, TEMPLATE_SUFFIX        = TEMPLATE.split("{data}")
+
     # ----------------------------------------------------------------------
     context: Dict[str, Any]
     input_items: List[Path]
     output_items: List[Path]
 
+    # Populated when content hashes are used: {filename: (st_size, st_mtime_ns, hash)}. Note that
+    # the default value is also used when loading content persisted before this member existed.
+    file_hashes: Optional[Dict[Path, Tuple[int, int, str]]]             = field(default=None)
+
     # ----------------------------------------------------------------------
     @classmethod
     def GetPersistedFilename(
@@ -291,13 +370,32 @@ class _PersistedInfo(object):
         input_processor: IInputProcessor,
         output_processor: IOutputProcessor,
         context: Dict[str, Any],
+        file_hashes: Optional[Dict[Path, Tuple[int, int, str]]]=None,
     ) -> "_PersistedInfo":
         return cls(
             context,
             input_processor.GetInputItems(context),
             output_processor.GetOutputItems(context),
+            file_hashes,
         )
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CalculateHash(
+        filename: Path,
+    ) -> str:
+        hasher = hashlib.blake2b()
+
+        with filename.open("rb") as f:
+            while True:
+                data = f.read(1024 * 1024)
+                if not data:
+                    break
+
+                hasher.update(data)
+
+        return hasher.hexdigest()
+
     # ----------------------------------------------------------------------
     @classmethod
     def Load(
@@ -311,10 +409,16 @@ class _PersistedInfo(object):
 
         if filename.exists():
             try:
-                match = RegularExpression.TemplateStringToRegex(cls.TEMPLATE).match(filename.open().read())
-                if match:
-                    data = base64.b64decode(match.group("data"))
-                    return pickle.loads(bytearray(data)), filename.stat().st_mtime
+                with filename.open() as f:
+                    content = f.read()
+
+                if (
+                    len(content) > len(cls.TEMPLATE_PREFIX) + len(cls.TEMPLATE_SUFFIX)
+                    and content.startswith(cls.TEMPLATE_PREFIX)
+                    and content.endswith(cls.TEMPLATE_SUFFIX)
+                ):
+                    data = base64.b64decode(content[len(cls.TEMPLATE_PREFIX):-len(cls.TEMPLATE_SUFFIX)])
+                    return pickle.loads(data), filename.stat().st_mtime
 
             except Exception as ex:
                 if dm.is_debug:
@@ -336,7 +440,11 @@ class _PersistedInfo(object):
         return cls.Create(input_processor, output_processor, context), 0.0
 
     # ----------------------------------------------------------------------
-    def Save(self) -> None:
+    def Save(
+        self,
+        *,
+        preserve_modified_time: bool=False,
+    ) -> None:
         data = pickle.dumps(self)
         data = base64.b64encode(data)
         data = data.decode("utf-8")
@@ -345,5 +453,10 @@ class _PersistedInfo(object):
 
         filename.parent.mkdir(parents=True, exist_ok=True)
 
+        prev_stat_result = filename.stat() if preserve_modified_time and filename.is_file() else None
+
         with filename.open("w") as f:
             f.write(self.__class__.TEMPLATE.format(data=data))
+
+        if prev_stat_result is not None:
+            os.utime(filename, ns=(prev_stat_result.st_atime_ns, prev_stat_result.st_mtime_ns))
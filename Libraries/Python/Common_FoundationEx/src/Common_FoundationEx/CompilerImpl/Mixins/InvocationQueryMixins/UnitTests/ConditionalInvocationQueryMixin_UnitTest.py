@@ -0,0 +1,162 @@
+# ----------------------------------------------------------------------
+# |
+# |  ConditionalInvocationQueryMixin_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 23:45:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ConditionalInvocationQueryMixin"""
+
+import os
+
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.Streams.StreamDecorator import StreamDecorator
+
+from ..ConditionalInvocationQueryMixin import ConditionalInvocationQueryMixin, _PersistedInfo
+from ....Interfaces.IInvocationQuery import InvokeReason
+
+
+# ----------------------------------------------------------------------
+def test_ContentHashesModifiedTime(tmp_path, monkeypatch):
+    input_filename = tmp_path / "input.txt"
+    output_filename = tmp_path / "output" / "output.txt"
+
+    input_filename.write_text("abc")
+
+    output_filename.parent.mkdir()
+    output_filename.write_text("output")
+
+    query = _InvocationQuery(input_filename, output_filename)
+
+    context: Dict[str, Any] = {
+        ConditionalInvocationQueryMixin.OUTPUT_DIR_ATTRIBUTE_NAME: output_filename.parent,
+        ConditionalInvocationQueryMixin.OUTPUT_DATA_FILENAME_PREFIX_ATTRIBUTE_NAME: "",
+    }
+
+    query._PersistContext(dict(context))  # pylint: disable=protected-access
+
+    persisted_filename = _PersistedInfo.GetPersistedFilename(context)
+    persisted_mtime_ns = persisted_filename.stat().st_mtime_ns
+
+    num_hash_calls = 0
+
+    original_calculate_hash_func = _PersistedInfo.CalculateHash
+
+    # ----------------------------------------------------------------------
+    def CalculateHash(filename: Path) -> str:
+        nonlocal num_hash_calls
+        num_hash_calls += 1
+
+        return original_calculate_hash_func(filename)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(_PersistedInfo, "CalculateHash", staticmethod(CalculateHash))
+
+    with DoneManager.Create(StreamDecorator(None), "") as dm:
+        # Unchanged
+        assert query._GetInvokeReason(dm, dict(context)) is None  # pylint: disable=protected-access
+        assert num_hash_calls == 0
+
+        # Modification time changed, content did not
+        _SetModifiedTime(input_filename, 1)
+
+        assert query._GetInvokeReason(dm, dict(context)) is None  # pylint: disable=protected-access
+        assert num_hash_calls == 1
+
+        # The new modification time was persisted, so the file isn't hashed again
+        assert query._GetInvokeReason(dm, dict(context)) is None  # pylint: disable=protected-access
+        assert num_hash_calls == 1
+
+        assert persisted_filename.stat().st_mtime_ns == persisted_mtime_ns
+
+        # Content changed (without changing the size)
+        input_filename.write_text("abd")
+        _SetModifiedTime(input_filename, 2)
+
+        assert query._GetInvokeReason(dm, dict(context)) == InvokeReason.NewerInput  # pylint: disable=protected-access
+        assert num_hash_calls == 2
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _InputProcessor(object):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        input_filename: Path,
+    ):
+        self._input_filename                = input_filename
+
+    # ----------------------------------------------------------------------
+    def GetInputItems(
+        self,
+        context: Dict[str, Any],  # pylint: disable=unused-argument
+    ) -> List[Path]:
+        return [self._input_filename, ]
+
+
+# ----------------------------------------------------------------------
+class _OutputProcessor(object):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        output_filename: Path,
+    ):
+        self._output_filename               = output_filename
+
+    # ----------------------------------------------------------------------
+    def GetOutputItems(
+        self,
+        context: Dict[str, Any],  # pylint: disable=unused-argument
+    ) -> List[Path]:
+        return [self._output_filename, ]
+
+
+# ----------------------------------------------------------------------
+class _InvocationQuery(ConditionalInvocationQueryMixin):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        input_filename: Path,
+        output_filename: Path,
+    ):
+        super(_InvocationQuery, self).__init__(
+            _InputProcessor(input_filename),  # type: ignore
+            _OutputProcessor(output_filename),  # type: ignore
+            use_content_hashes=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def _EnumerateGeneratorFiles(
+        self,
+        context: Dict[str, Any],  # pylint: disable=unused-argument
+    ) -> Generator[Path, None, None]:
+        # Generator files aren't relevant for these tests
+        if False:  # pylint: disable=using-constant-test
+            yield
+
+
+# ----------------------------------------------------------------------
+def _SetModifiedTime(
+    filename: Path,
+    offset_seconds: int,
+) -> None:
+    stat_result = filename.stat()
+
+    os.utime(
+        filename,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + offset_seconds * 1_000_000_000),
+    )
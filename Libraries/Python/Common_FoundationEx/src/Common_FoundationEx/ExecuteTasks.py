@@ -16,6 +16,7 @@
 """Contains functionality to execute multiple tasks in parallel."""
 
 import datetime
+import io
 import multiprocessing
 import sys
 import threading
@@ -23,20 +24,23 @@ import time
 import traceback
 
 from abc import abstractmethod, ABC
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, cast, Iterator, Optional, Protocol, TypeVar, Union
+from typing import Any, Callable, cast, Iterator, Optional, Protocol, TextIO, TypeVar, Union
 from unittest.mock import MagicMock
 
 from rich.progress import Progress, TaskID, TimeElapsedColumn
 
 from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import JsonEx
 from Common_Foundation import PathEx
 from Common_Foundation.Shell.All import CurrentShell
 from Common_Foundation.Streams.Capabilities import Capabilities
 from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.Streams.TextWriter import TextWriter
 from Common_Foundation import TextwrapEx
 from Common_Foundation.Types import overridemethod
 
@@ -53,6 +57,10 @@ CATASTROPHIC_TASK_FAILURE_RESULT            = -123
 DISPLAY_COLUMN_WIDTH                        = 110
 STATUS_COLUMN_WIDTH                         = 50
 
+DEFAULT_LOG_BUFFER_SIZE                     = 64 * 1024
+
+DEFAULT_PROFILE_SAMPLE_INTERVAL             = 0.005         # seconds
+
 
 # ----------------------------------------------------------------------
 class TransformException(Exception):
@@ -61,7 +69,136 @@ class TransformException(Exception):
 
 
 # ----------------------------------------------------------------------
-@dataclass
+class TaskLog(TextWriter):
+    """\
+    Log for a single task that is buffered in memory and only written to disk when its content
+    exceeds a size threshold or when the task does not succeed.
+
+    Return an instance of this class (rather than a Path) from `ExecuteTasksTypes.Init1FuncType`
+    to avoid creating log files for tasks that succeed with little output; the buffered content
+    of a successful task is discarded once the task completes.
+    """
+
+    __slots__ = (
+        "filename",
+        "max_buffer_size",
+        "_buffer",
+        "_file",
+        "_is_persisted",
+        "_is_closed",
+    )
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        max_buffer_size: int=DEFAULT_LOG_BUFFER_SIZE,
+    ):
+        self.filename                       = filename
+        self.max_buffer_size                = max_buffer_size
+
+        self._buffer: Optional[io.StringIO] = io.StringIO()
+        self._file: Optional[TextIO]        = None
+
+        self._is_persisted                  = False
+        self._is_closed                     = False
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_persisted(self) -> bool:
+        return self._is_persisted
+
+    # ----------------------------------------------------------------------
+    def GetContent(self) -> str:
+        if self._is_persisted:
+            self.flush()
+            return self.filename.read_text()
+
+        return "" if self._buffer is None else self._buffer.getvalue()
+
+    # ----------------------------------------------------------------------
+    def Persist(self) -> None:
+        """Writes the buffered content to disk; content written after this call is written directly to the file."""
+
+        if self._is_persisted:
+            return
+
+        assert self._buffer is not None, "The buffered content has been discarded"
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = self.filename.open("w")
+        self._file.write(self._buffer.getvalue())
+
+        self._buffer = None
+        self._is_persisted = True
+
+        if self._is_closed:
+            self._file.close()
+            self._file = None
+
+    # ----------------------------------------------------------------------
+    def Finalize(
+        self,
+        persist: bool,
+    ) -> None:
+        """Closes the log and either writes its content to disk or discards it."""
+
+        if persist:
+            self.Persist()
+
+        if not self._is_closed:
+            self.close()
+
+        # Release the memory associated with content that will never be written
+        self._buffer = None
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def isatty(self) -> bool:
+        return False
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def write(
+        self,
+        content: str,
+    ) -> int:
+        if self._is_closed:
+            raise Exception("Instance is closed.")
+
+        if self._file is not None:
+            return self._file.write(content)
+
+        assert self._buffer is not None
+        result = self._buffer.write(content)
+
+        if self._buffer.tell() > self.max_buffer_size:
+            self.Persist()
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def close(self) -> None:
+        if self._is_closed:
+            raise Exception("Instance is closed.")
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._is_closed = True
+
+
+# ----------------------------------------------------------------------
+@dataclass(slots=True)
 class TaskData(object):
     display: str
     context: Any
@@ -75,11 +212,16 @@ class TaskData(object):
     short_desc: Optional[str]               = field(init=False)
 
     execution_time: datetime.timedelta      = field(init=False)
+
+    # Note that this file will not exist if the task was initialized with a `TaskLog` and the
+    # task succeeded without its log content exceeding the buffer threshold.
     log_filename: Path                      = field(init=False)
 
 
 # ----------------------------------------------------------------------
 class Status(ABC):
+    __slots__ = ()
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def SetTitle(
@@ -120,7 +262,10 @@ class ExecuteTasksTypes(object):
             self,
             context: Any,                   # TaskData.context
         ) -> tuple[
-            Path,                           # Log filename
+            Union[
+                Path,                       # Log filename
+                TaskLog,                    # Log buffered in memory
+            ],
             "ExecuteTasksTypes.Init2FuncType",
         ]:
             ...
@@ -179,58 +324,77 @@ def ExecuteTasks(
     quiet: bool=False,
     max_num_threads: Optional[int]=None,
     refresh_per_second: Optional[float]=None,
+    events_output: Union[None, Path, int]=None,         # Filename or file descriptor that receives JSON Lines lifecycle events
+    profile_output: Optional[Path]=None,                # Filename that receives collapsed stacks sampled from the worker threads
+    profile_sample_interval: float=DEFAULT_PROFILE_SAMPLE_INTERVAL,
+    release_contexts: bool=False,                       # Set `TaskData.context` to None as soon as each task completes
 ) -> None:
     """Executes tasks that output to individual log files"""
 
-    with _GenerateStatusInfo(
-        len(tasks),
-        dm,
-        desc,
-        tasks,
-        quiet=quiet,
-        refresh_per_second=refresh_per_second,
-    ) as (status_factories, on_task_complete_func):
-        if max_num_threads == 1 or len(tasks) == 1:
-            for task_data, status_factory in zip(tasks, status_factories):
-                with ExitStack(status_factory.Stop):
-                    _ExecuteTask(
-                        desc,
-                        task_data,
-                        init_func,
-                        status_factory,
-                        on_task_complete_func,
-                        is_debug=dm.is_debug,
-                    )
+    with _YieldEventWriter(events_output) as event_writer:
+        with _YieldSampler(profile_output, profile_sample_interval) as sampler:
+            with _GenerateStatusInfo(
+                len(tasks),
+                dm,
+                desc,
+                tasks,
+                quiet=quiet,
+                refresh_per_second=refresh_per_second,
+            ) as (yielded_status_factories, on_task_complete_func):
+                # Entries are released as tasks complete (the list is updated in place, as it is
+                # also referenced by the status info generator).
+                status_factories = cast(list[Optional[_StatusFactory]], yielded_status_factories)
+
+                if event_writer is not None:
+                    for task_index, task_data in enumerate(tasks):
+                        event_writer.Write("queued", task_index, task_data)
 
-            return
+                # ----------------------------------------------------------------------
+                def Impl(
+                    task_index: int,
+                    task_data: TaskData,
+                    status_factory: Optional["_StatusFactory"],
+                ):
+                    assert status_factory is not None
+
+                    with ExitStack(status_factory.Stop) as exit_stack:
+                        if sampler is not None:
+                            exit_stack.enter_context(sampler.YieldTask(task_data))
+
+                        _ExecuteTask(
+                            desc,
+                            task_data,
+                            init_func,
+                            status_factory,
+                            on_task_complete_func,
+                            is_debug=dm.is_debug,
+                            task_events=None if event_writer is None else _TaskEvents(event_writer, task_index, task_data),
+                        )
 
-        with ThreadPoolExecutor(
-            max_workers=max_num_threads,
-        ) as executor:
-            # ----------------------------------------------------------------------
-            def Impl(
-                task_data: TaskData,
-                status_factory: "_StatusFactory",
-            ):
-                with ExitStack(status_factory.Stop):
-                    _ExecuteTask(
-                        desc,
-                        task_data,
-                        init_func,
-                        status_factory,
-                        on_task_complete_func,
-                        is_debug=dm.is_debug,
-                    )
+                    # Release the per-task state that isn't needed once the task has completed
+                    status_factories[task_index] = None
 
-            # ----------------------------------------------------------------------
+                    if release_contexts:
+                        task_data.context = None
 
-            futures = [
-                executor.submit(Impl, task_data, status_factory)
-                for task_data, status_factory in zip(tasks, status_factories)
-            ]
+                # ----------------------------------------------------------------------
 
-            for future in futures:
-                future.result()
+                if max_num_threads == 1 or len(tasks) == 1:
+                    for task_index, (task_data, status_factory) in enumerate(zip(tasks, status_factories)):
+                        Impl(task_index, task_data, status_factory)
+
+                    return
+
+                with ThreadPoolExecutor(
+                    max_workers=max_num_threads,
+                ) as executor:
+                    futures = [
+                        executor.submit(Impl, task_index, task_data, status_factory)
+                        for task_index, (task_data, status_factory) in enumerate(zip(tasks, status_factories))
+                    ]
+
+                    for future in futures:
+                        future.result()
 
 
 # ----------------------------------------------------------------------
@@ -416,6 +580,8 @@ def YieldQueueExecutor(
             queue: list[tuple[str, QueueExecutorTypes.InitFuncType]] = []
             queue_lock = threading.Lock()
 
+            task_index = 0
+
             queue_semaphore = threading.Semaphore(0)
             quit_event = threading.Event()
 
@@ -432,7 +598,8 @@ def YieldQueueExecutor(
             def Impl(
                 thread_index: int,
             ) -> None:
-                log_filename = temp_directory / "{:06}.log".format(thread_index)
+                nonlocal task_index
+
                 status_factory = status_factories[thread_index]
 
                 with ExitStack(status_factory.Stop):
@@ -445,9 +612,12 @@ def YieldQueueExecutor(
 
                                 task_desc, init_func = queue.pop(0)
 
+                                this_task_index = task_index
+                                task_index += 1
+
                             # ----------------------------------------------------------------------
-                            def Init1(*args, **kwargs) -> tuple[Path, ExecuteTasksTypes.Init2FuncType]:  # pylint: disable=unused-argument
-                                return log_filename, Init2
+                            def Init1(*args, **kwargs) -> tuple[TaskLog, ExecuteTasksTypes.Init2FuncType]:  # pylint: disable=unused-argument
+                                return TaskLog(temp_directory / "{:06}.log".format(this_task_index)), Init2
 
                             # ----------------------------------------------------------------------
                             def Init2(
@@ -511,6 +681,8 @@ def YieldQueueExecutor(
 # |
 # ----------------------------------------------------------------------
 class _InternalStatus(Status):
+    __slots__ = ()
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def SetNumSteps(
@@ -522,6 +694,8 @@ class _InternalStatus(Status):
 
 # ----------------------------------------------------------------------
 class _StatusFactory(ABC):
+    __slots__ = ()
+
     # ----------------------------------------------------------------------
     @abstractmethod
     @contextmanager
@@ -537,10 +711,283 @@ class _StatusFactory(ABC):
         raise Exception("Abstract method")
 
 
+# ----------------------------------------------------------------------
+class _EventWriter(object):
+    """Writes task lifecycle events as JSON Lines"""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        stream: TextIO,
+    ):
+        self._stream                        = stream
+        self._lock                          = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def Write(
+        self,
+        event: str,
+        task_index: int,
+        task_data: TaskData,
+        **kwargs,
+    ) -> None:
+        content = JsonEx.DumpToString(
+            {
+                "event": event,
+                "timestamp": time.time(),
+                "thread_id": threading.get_ident(),
+                "task_index": task_index,
+                "display": task_data.display,
+                **kwargs,
+            },
+        )
+
+        with self._lock:
+            self._stream.write(content)
+            self._stream.write("\n")
+            self._stream.flush()
+
+
+# ----------------------------------------------------------------------
+class _TaskEvents(object):
+    """Writes lifecycle events for a single task"""
+
+    __slots__ = ("_event_writer", "_task_index", "_task_data")
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        event_writer: _EventWriter,
+        task_index: int,
+        task_data: TaskData,
+    ):
+        self._event_writer                  = event_writer
+        self._task_index                    = task_index
+        self._task_data                     = task_data
+
+    # ----------------------------------------------------------------------
+    def OnStarted(self) -> None:
+        self._event_writer.Write("started", self._task_index, self._task_data)
+
+    # ----------------------------------------------------------------------
+    def OnStatus(
+        self,
+        zero_based_step: Optional[int],
+        status: Optional[str],
+    ) -> None:
+        self._event_writer.Write(
+            "status",
+            self._task_index,
+            self._task_data,
+            step=zero_based_step,
+            status=status,
+        )
+
+    # ----------------------------------------------------------------------
+    def OnFinished(self) -> None:
+        self._event_writer.Write(
+            "finished",
+            self._task_index,
+            self._task_data,
+            result=self._task_data.result,
+            short_desc=self._task_data.short_desc,
+            duration=self._task_data.execution_time.total_seconds(),
+            log_filename=self._task_data.log_filename,
+        )
+
+
+# ----------------------------------------------------------------------
+class _EventStatus(_InternalStatus):
+    """Status that writes status events before forwarding to the decorated status"""
+
+    __slots__ = ("_status", "_task_events")
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        status: _InternalStatus,
+        task_events: _TaskEvents,
+    ):
+        self._status                        = status
+        self._task_events                   = task_events
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def SetNumSteps(
+        self,
+        num_steps: int,
+    ) -> None:
+        self._status.SetNumSteps(num_steps)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def SetTitle(
+        self,
+        title: str,
+    ) -> None:
+        self._status.SetTitle(title)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def OnProgress(
+        self,
+        zero_based_step: Optional[int],
+        status: Optional[str],
+    ) -> bool:
+        self._task_events.OnStatus(zero_based_step, status)
+        return self._status.OnProgress(zero_based_step, status)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def OnInfo(
+        self,
+        value: str,
+        *,
+        verbose: bool=False,
+    ) -> None:
+        self._status.OnInfo(value, verbose=verbose)
+
+
+# ----------------------------------------------------------------------
+class _Sampler(object):
+    """\
+    Low-overhead sampling profiler that periodically captures the stacks of threads executing tasks
+    and aggregates them per task in the collapsed-stack format used by flame graph tools.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        sample_interval: float,
+    ):
+        assert sample_interval > 0, sample_interval
+
+        self._sample_interval               = sample_interval
+
+        self._active_tasks: dict[int, TaskData]         = {}
+        self._active_tasks_lock                         = threading.Lock()
+
+        self._stacks: Counter[str]                      = Counter()
+
+        self._quit_event                    = threading.Event()
+        self._thread                        = threading.Thread(target=self._Execute, daemon=True)
+
+    # ----------------------------------------------------------------------
+    def Start(self) -> None:
+        self._thread.start()
+
+    # ----------------------------------------------------------------------
+    def Stop(self) -> None:
+        self._quit_event.set()
+        self._thread.join()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldTask(
+        self,
+        task_data: TaskData,
+    ) -> Iterator[None]:
+        thread_id = threading.get_ident()
+
+        with self._active_tasks_lock:
+            self._active_tasks[thread_id] = task_data
+
+        try:
+            yield
+        finally:
+            with self._active_tasks_lock:
+                del self._active_tasks[thread_id]
+
+    # ----------------------------------------------------------------------
+    def Save(
+        self,
+        filename: Path,
+    ) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        with filename.open("w") as f:
+            for stack, count in sorted(self._stacks.items()):
+                f.write("{} {}\n".format(stack, count))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Execute(self) -> None:
+        while not self._quit_event.wait(self._sample_interval):
+            with self._active_tasks_lock:
+                active_tasks = list(self._active_tasks.items())
+
+            if not active_tasks:
+                continue
+
+            frames = sys._current_frames()  # pylint: disable=protected-access
+
+            for thread_id, task_data in active_tasks:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+
+                stack: list[str] = []
+
+                while frame is not None:
+                    stack.append(
+                        "{} ({}:{})".format(
+                            frame.f_code.co_name,
+                            frame.f_code.co_filename,
+                            frame.f_code.co_firstlineno,
+                        ),
+                    )
+
+                    frame = frame.f_back
+
+                stack.append(task_data.display)
+                stack.reverse()
+
+                # ';' delimits frames in the collapsed-stack format
+                self._stacks[";".join(item.replace(";", ":") for item in stack)] += 1
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Private Functions
 # |
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldSampler(
+    profile_output: Optional[Path],
+    sample_interval: float,
+) -> Iterator[Optional[_Sampler]]:
+    if profile_output is None:
+        yield None
+        return
+
+    sampler = _Sampler(sample_interval)
+
+    sampler.Start()
+    with ExitStack(lambda: sampler.Save(profile_output)):
+        with ExitStack(sampler.Stop):
+            yield sampler
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldEventWriter(
+    events_output: Union[None, Path, int],
+) -> Iterator[Optional[_EventWriter]]:
+    if events_output is None:
+        yield None
+        return
+
+    if isinstance(events_output, Path):
+        events_output.parent.mkdir(parents=True, exist_ok=True)
+        stream = events_output.open("w")
+    else:
+        stream = open(events_output, "w", closefd=False)  # pylint: disable=consider-using-with
+
+    with stream:
+        yield _EventWriter(stream)
+
+
 # ----------------------------------------------------------------------
 @contextmanager
 def _GenerateStatusInfo(
@@ -672,12 +1119,14 @@ def _GenerateProgressStatusInfo(
 
         # ----------------------------------------------------------------------
         class StatusFactory(_StatusFactory):
+            # Progress bar tasks are created when the task starts and removed when it is stopped
+            # so that the memory associated with them isn't retained for the lifetime of the
+            # executor.
+            __slots__ = ("_task_id", )
+
             # ----------------------------------------------------------------------
-            def __init__(
-                self,
-                task_id: TaskID,
-            ):
-                self._task_id               = task_id
+            def __init__(self):
+                self._task_id: Optional[TaskID]         = None
 
             # ----------------------------------------------------------------------
             @contextmanager
@@ -686,31 +1135,44 @@ def _GenerateProgressStatusInfo(
                 self,
                 display: str,
             ) -> Iterator[Status]:
-                progress_bar.update(
-                    self._task_id,
-                    completed=0,
-                    description=CreateDescription(display),
-                    refresh=False,
-                    status="",
-                    total=None,
-                    visible=not quiet,
-                )
+                if self._task_id is None:
+                    self._task_id = progress_bar.add_task(
+                        CreateDescription(display),
+                        start=False,
+                        status="",
+                        total=None,
+                        visible=not quiet,
+                    )
+                else:
+                    progress_bar.update(
+                        self._task_id,
+                        completed=0,
+                        description=CreateDescription(display),
+                        refresh=False,
+                        status="",
+                        total=None,
+                        visible=not quiet,
+                    )
+
+                task_id = self._task_id
 
-                progress_bar.start_task(self._task_id)
-                with ExitStack(lambda: progress_bar.stop_task(self._task_id)):
-                    yield StatusImpl(self._task_id)
+                progress_bar.start_task(task_id)
+                with ExitStack(lambda: progress_bar.stop_task(task_id)):
+                    yield StatusImpl(task_id)
 
             # ----------------------------------------------------------------------
             @overridemethod
             def Stop(self) -> None:
-                progress_bar.update(
-                    self._task_id,
-                    refresh=False,
-                    visible=False,
-                )
+                if self._task_id is None:
+                    return
+
+                progress_bar.remove_task(self._task_id)
+                self._task_id = None
 
         # ----------------------------------------------------------------------
         class StatusImpl(_InternalStatus):
+            __slots__ = ("_task_id", "_num_steps", "_current_step")
+
             # ----------------------------------------------------------------------
             def __init__(
                 self,
@@ -886,20 +1348,7 @@ def _GenerateProgressStatusInfo(
         stdout_context.stream.write(enqueueing_status)
         stdout_context.stream.flush()
 
-        status_factories: list[_StatusFactory] = []
-
-        for task in tasks:
-            status_factories.append(
-                StatusFactory(
-                    progress_bar.add_task(
-                        CreateDescription(task.display),
-                        start=False,
-                        status="",
-                        total=None,
-                        visible=False,
-                    ),
-                ),
-            )
+        status_factories: list[_StatusFactory] = [StatusFactory() for _ in tasks]
 
         stdout_context.stream.write("\r{}\r".format(" " * len(enqueueing_status)))
         stdout_context.stream.flush()
@@ -922,6 +1371,8 @@ def _GenerateNoopStatusInfo(
 ) -> Iterator[tuple[list[_StatusFactory], Callable[[TaskData], None]]]:
     # ----------------------------------------------------------------------
     class StatusFactory(_StatusFactory):
+        __slots__ = ()
+
         # ----------------------------------------------------------------------
         @contextmanager
         @overridemethod
@@ -935,6 +1386,8 @@ def _GenerateNoopStatusInfo(
 
     # ----------------------------------------------------------------------
     class StatusImpl(_InternalStatus):
+        __slots__ = ()
+
         # ----------------------------------------------------------------------
         @overridemethod
         def SetNumSteps(self, *args, **kwargs) -> None:  # pylint: disable=unused-argument
@@ -990,8 +1443,11 @@ def _GenerateNoopStatusInfo(
 
     # ----------------------------------------------------------------------
 
+    # These objects are stateless, so a single instance can be shared by all tasks
+    status_factory = StatusFactory()
+
     yield (
-        cast(list[_StatusFactory], [StatusFactory() for task in tasks]),
+        cast(list[_StatusFactory], [status_factory] * len(tasks)),
         OnTaskDataComplete,
     )
 
@@ -1005,13 +1461,28 @@ def _ExecuteTask(
     on_task_complete_func: Callable[[TaskData], None],
     *,
     is_debug: bool,
+    task_events: Optional[_TaskEvents]=None,
 ) -> None:
     with ExitStack(lambda: on_task_complete_func(task_data)):
+        if task_events is not None:
+            task_events.OnStarted()
+
         start_time = time.perf_counter()
 
+        task_log: Optional[TaskLog] = None
+
         try:
             with status_factory.CreateStatus(task_data.display) as status:
-                task_data.log_filename, init2_func = init_func(task_data.context)
+                if task_events is not None:
+                    status = _EventStatus(status, task_events)
+
+                log_filename_or_task_log, init2_func = init_func(task_data.context)
+
+                if isinstance(log_filename_or_task_log, TaskLog):
+                    task_log = log_filename_or_task_log
+                    task_data.log_filename = task_log.filename
+                else:
+                    task_data.log_filename = log_filename_or_task_log
 
                 # ----------------------------------------------------------------------
                 def OnSimpleStatus(
@@ -1081,6 +1552,11 @@ def _ExecuteTask(
                     f.write(error)
 
             else:
+                if task_log is not None:
+                    # Write the buffered content so that the error information is appended to it
+                    task_log.Persist()
+                    task_log.flush()
+
                 with task_data.log_filename.open("a+") as f:
                     f.write("\n\n{}\n".format(error))
 
@@ -1099,8 +1575,14 @@ def _ExecuteTask(
             assert hasattr(task_data, "short_desc")
             assert hasattr(task_data, "log_filename")
 
+            if task_log is not None:
+                task_log.Finalize(persist=task_data.result != 0)
+
             task_data.execution_time = datetime.timedelta(seconds=time.perf_counter() - start_time)
 
+            if task_events is not None:
+                task_events.OnFinished()
+
 
 # ----------------------------------------------------------------------
 def _TransformStandard(
@@ -1144,11 +1626,9 @@ def _TransformStandard(
         # ----------------------------------------------------------------------
         def Init1(
             context_info: tuple[int, Any],
-        ) -> tuple[Path, ExecuteTasksTypes.Init2FuncType]:
+        ) -> tuple[TaskLog, ExecuteTasksTypes.Init2FuncType]:
             task_index, context = context_info
 
-            log_filename = temp_directory / "{:06}.log".format(task_index)
-
             # ----------------------------------------------------------------------
             def Init2(
                 on_simple_status_func: Callable[[str], None],
@@ -1195,7 +1675,7 @@ def _TransformStandard(
 
             # ----------------------------------------------------------------------
 
-            return log_filename, Init2
+            return TaskLog(temp_directory / "{:06}.log".format(task_index)), Init2
 
         # ----------------------------------------------------------------------
 
@@ -1261,7 +1741,6 @@ def _TransformCompressed(
         ) -> None:
             nonlocal task_index
 
-            log_filename = temp_directory / "{:06}.log".format(thread_index)
             status_factory = status_factories[thread_index]
 
             with ExitStack(status_factory.Stop):
@@ -1276,8 +1755,8 @@ def _TransformCompressed(
                     task_data = tasks[this_task_index]
 
                     # ----------------------------------------------------------------------
-                    def Init1(*args, **kwargs) -> tuple[Path, ExecuteTasksTypes.Init2FuncType]:  # pylint: disable=unused-argument
-                        return log_filename, Init2
+                    def Init1(*args, **kwargs) -> tuple[TaskLog, ExecuteTasksTypes.Init2FuncType]:  # pylint: disable=unused-argument
+                        return TaskLog(temp_directory / "{:06}.log".format(this_task_index)), Init2
 
                     # ----------------------------------------------------------------------
                     def Init2(
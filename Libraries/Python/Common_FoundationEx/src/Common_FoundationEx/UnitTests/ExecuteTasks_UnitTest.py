@@ -0,0 +1,406 @@
+# ----------------------------------------------------------------------
+# |
+# |  ExecuteTasks_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-19 00:15:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ExecuteTasks"""
+
+import io
+import json
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import pytest
+
+from Common_Foundation.Shell.All import CurrentShell
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.Streams.StreamDecorator import StreamDecorator
+
+from .. import ExecuteTasks as ExecuteTasksModule
+from ..ExecuteTasks import ExecuteTasks, Status, TaskData, TaskLog, Transform, YieldQueueExecutor
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def log_filenames(tmp_path, monkeypatch) -> list[Path]:
+    """Returns the filenames of all `TaskLog` objects created by the executors"""
+
+    temp_directory = tmp_path / "temp"
+    temp_directory.mkdir()
+
+    # Temporary directories are preserved when tasks fail
+    monkeypatch.setattr(CurrentShell, "CreateTempDirectory", lambda *args, **kwargs: temp_directory)
+
+    filenames: list[Path] = []
+
+    original_init_func = TaskLog.__init__
+
+    # ----------------------------------------------------------------------
+    def Init(self, filename: Path, *args, **kwargs):
+        filenames.append(filename)
+        original_init_func(self, filename, *args, **kwargs)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(TaskLog, "__init__", Init)
+
+    return filenames
+
+
+# ----------------------------------------------------------------------
+def test_TaskLogBuffering(tmp_path):
+    log_filename = tmp_path / "task.log"
+
+    task_log = TaskLog(log_filename)
+
+    task_log.write("one\n")
+    task_log.write("two\n")
+
+    assert task_log.GetContent() == "one\ntwo\n"
+    assert task_log.is_persisted is False
+    assert not log_filename.exists()
+
+    task_log.Finalize(persist=False)
+
+    assert task_log.is_persisted is False
+    assert not log_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_TaskLogSpillOver(tmp_path):
+    log_filename = tmp_path / "task.log"
+
+    task_log = TaskLog(log_filename, max_buffer_size=10)
+
+    task_log.write("12345")
+    assert not log_filename.exists()
+
+    # Content is written to disk once it exceeds the threshold...
+    task_log.write("678901")
+    assert task_log.is_persisted is True
+    assert log_filename.is_file()
+
+    # ...and content written after that goes directly to the file
+    task_log.write("more")
+    assert task_log.GetContent() == "12345678901more"
+
+    task_log.Finalize(persist=False)
+
+    assert log_filename.read_text() == "12345678901more"
+
+
+# ----------------------------------------------------------------------
+def test_TaskLogPersistOnFailure(tmp_path):
+    tasks = [TaskData(str(index), index) for index in range(3)]
+
+    # ----------------------------------------------------------------------
+    def Init(
+        context: Any,
+    ) -> tuple[TaskLog, Callable]:
+        task_log = TaskLog(tmp_path / "{}.log".format(context))
+
+        task_log.write("Task {}\n".format(context))
+
+        # ----------------------------------------------------------------------
+        def Execute(
+            status: Status,  # pylint: disable=unused-argument
+        ) -> int:
+            if context == 1:
+                raise Exception("Task {} failed".format(context))
+
+            return 0
+
+        # ----------------------------------------------------------------------
+
+        return task_log, lambda on_simple_status_func: Execute
+
+    # ----------------------------------------------------------------------
+
+    with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+        ExecuteTasks(dm, "Testing", tasks, Init, quiet=True)
+
+        assert dm.result != 0
+
+    assert [task.result for task in tasks] == [0, ExecuteTasksModule.CATASTROPHIC_TASK_FAILURE_RESULT, 0]
+
+    # Only the log of the failed task was written, and it contains the buffered content
+    assert not tasks[0].log_filename.exists()
+    assert not tasks[2].log_filename.exists()
+
+    assert tasks[1].log_filename.read_text() == "Task 1\n\n\nTask 1 failed\n"
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("no_compress_tasks", [True, False])
+def test_TransformLogs(log_filenames, monkeypatch, no_compress_tasks):
+    # Ensure that the compressed implementation is used when requested, regardless of the number of
+    # cores on the current machine.
+    monkeypatch.setattr(ExecuteTasksModule.multiprocessing, "cpu_count", lambda: 2)
+
+    tasks = [TaskData(str(index), index) for index in range(4)]
+
+    # ----------------------------------------------------------------------
+    def Init(
+        context: Any,
+        on_simple_status_func: Callable[[str], None],  # pylint: disable=unused-argument
+    ) -> Callable[[Status], Optional[int]]:
+        # ----------------------------------------------------------------------
+        def Execute(
+            status: Status,  # pylint: disable=unused-argument
+        ) -> Optional[int]:
+            if context == 2:
+                raise Exception("Task {} failed".format(context))
+
+            return context * 10
+
+        # ----------------------------------------------------------------------
+
+        return Execute
+
+    # ----------------------------------------------------------------------
+
+    with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+        results = Transform(dm, "Testing", tasks, Init, quiet=True, no_compress_tasks=no_compress_tasks)
+
+        assert dm.result != 0
+
+    assert results == [0, 10, None, 30]
+
+    # Each task has its own log, and only the log of the failed task was written
+    assert sorted(log_filenames) == sorted(task.log_filename for task in tasks)
+
+    assert [task.result for task in tasks] == [0, 0, ExecuteTasksModule.CATASTROPHIC_TASK_FAILURE_RESULT, 0]
+    assert [task.log_filename.exists() for task in tasks] == [False, False, True, False]
+
+    assert "Task 2 failed" in tasks[2].log_filename.read_text()
+
+
+# ----------------------------------------------------------------------
+def test_YieldQueueExecutorLogs(log_filenames):
+    # ----------------------------------------------------------------------
+    def CreateInit(
+        index: int,
+    ) -> Callable:
+        # ----------------------------------------------------------------------
+        def Execute(
+            status: Status,  # pylint: disable=unused-argument
+        ) -> Optional[str]:
+            if index in [1, 2]:
+                raise Exception("Task {} failed".format(index))
+
+            return None
+
+        # ----------------------------------------------------------------------
+
+        return lambda on_simple_status_func: Execute
+
+    # ----------------------------------------------------------------------
+
+    with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+        with YieldQueueExecutor(dm, "Testing", quiet=True, max_num_threads=1) as enqueue_func:
+            for index in range(4):
+                enqueue_func(str(index), CreateInit(index))
+
+        assert dm.result != 0
+
+    # Each task has its own log, so the failures don't overwrite each other
+    assert len(set(log_filenames)) == 4
+    assert [log_filename.exists() for log_filename in log_filenames] == [False, True, True, False]
+
+    assert "Task 1 failed" in log_filenames[1].read_text()
+    assert "Task 2 failed" in log_filenames[2].read_text()
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_file_descriptor", [False, True])
+def test_Events(tmp_path, use_file_descriptor):
+    events_filename = tmp_path / "events.jsonl"
+
+    tasks = [TaskData(str(index), index) for index in range(3)]
+
+    # ----------------------------------------------------------------------
+    def Init(
+        context: Any,
+    ) -> tuple[TaskLog, Callable]:
+        # ----------------------------------------------------------------------
+        def Execute(
+            status: Status,
+        ) -> tuple[int, Optional[str]]:
+            status.OnProgress(0, "Working on {}".format(context))
+
+            if context == 1:
+                raise Exception("Task {} failed".format(context))
+
+            return 0, "Task {} succeeded".format(context)
+
+        # ----------------------------------------------------------------------
+
+        return TaskLog(tmp_path / "{}.log".format(context)), lambda on_simple_status_func: (1, Execute)
+
+    # ----------------------------------------------------------------------
+    def Impl(
+        events_output: Union[Path, int],
+    ) -> None:
+        with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+            ExecuteTasks(dm, "Testing", tasks, Init, quiet=True, max_num_threads=1, events_output=events_output)
+
+    # ----------------------------------------------------------------------
+
+    if use_file_descriptor:
+        with events_filename.open("w") as f:
+            Impl(f.fileno())
+    else:
+        Impl(events_filename)
+
+    events = [json.loads(line) for line in events_filename.read_text().splitlines()]
+
+    assert [(event["event"], event["task_index"]) for event in events] == [
+        ("queued", 0),
+        ("queued", 1),
+        ("queued", 2),
+        ("started", 0),
+        ("status", 0),
+        ("finished", 0),
+        ("started", 1),
+        ("status", 1),
+        ("finished", 1),
+        ("started", 2),
+        ("status", 2),
+        ("finished", 2),
+    ]
+
+    # Fields common to all events
+    for event in events:
+        assert event["display"] == str(event["task_index"])
+        assert isinstance(event["thread_id"], int)
+
+    timestamps = [event["timestamp"] for event in events]
+    assert timestamps == sorted(timestamps)
+
+    # Status events
+    for event in (event for event in events if event["event"] == "status"):
+        assert event["step"] == 0
+        assert event["status"] == "Working on {}".format(event["task_index"])
+
+    # Finished events
+    finished_events = [event for event in events if event["event"] == "finished"]
+
+    assert [event["result"] for event in finished_events] == [0, ExecuteTasksModule.CATASTROPHIC_TASK_FAILURE_RESULT, 0]
+    assert [event["short_desc"] for event in finished_events] == ["Task 0 succeeded", "Testing failed", "Task 2 succeeded"]
+    assert [event["log_filename"] for event in finished_events] == [str(task.log_filename) for task in tasks]
+    assert [event["duration"] for event in finished_events] == [task.execution_time.total_seconds() for task in tasks]
+
+    started_events = [event for event in events if event["event"] == "started"]
+
+    for started_event, finished_event in zip(started_events, finished_events):
+        assert started_event["thread_id"] == finished_event["thread_id"]
+
+
+# ----------------------------------------------------------------------
+def test_Profile(tmp_path):
+    profile_filename = tmp_path / "profile.txt"
+
+    tasks = [TaskData("Task{}".format(index), index) for index in range(2)]
+
+    # ----------------------------------------------------------------------
+    def SleepingTask(
+        status: Status,  # pylint: disable=unused-argument
+    ) -> int:
+        time.sleep(0.2)
+        return 0
+
+    # ----------------------------------------------------------------------
+    def Init(
+        context: Any,
+    ) -> tuple[TaskLog, Callable]:
+        return TaskLog(tmp_path / "{}.log".format(context)), lambda on_simple_status_func: SleepingTask
+
+    # ----------------------------------------------------------------------
+
+    threads = set(threading.enumerate())
+
+    with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+        ExecuteTasks(
+            dm,
+            "Testing",
+            tasks,
+            Init,
+            quiet=True,
+            max_num_threads=1,
+            profile_output=profile_filename,
+            profile_sample_interval=0.01,
+        )
+
+        assert dm.result == 0
+
+    # The sampler thread has stopped
+    assert set(threading.enumerate()) == threads
+
+    # Each line is in the collapsed-stack format: "<frame>;<frame>;... <count>"
+    lines = profile_filename.read_text().splitlines()
+    assert lines
+
+    sleeping_displays: set[str] = set()
+
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+
+        assert int(count) > 0
+
+        frames = stack.split(";")
+        assert all(frames)
+
+        # The first frame is the task, followed by the frames from the outermost to the innermost
+        assert frames[0] in ["Task0", "Task1"]
+
+        if frames[-1].startswith("SleepingTask ("):
+            sleeping_displays.add(frames[0])
+
+    assert sleeping_displays == {"Task0", "Task1"}
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("release_contexts", [False, True])
+def test_ReleaseContexts(tmp_path, release_contexts):
+    tasks = [TaskData(str(index), index) for index in range(3)]
+
+    previous_contexts: list[list[Any]] = []
+
+    # ----------------------------------------------------------------------
+    def Init(
+        context: Any,
+    ) -> tuple[TaskLog, Callable]:
+        # Capture the contexts of the tasks that completed before this one
+        previous_contexts.append([task.context for task in tasks[:context]])
+
+        return TaskLog(tmp_path / "{}.log".format(context)), lambda on_simple_status_func: lambda status: 0
+
+    # ----------------------------------------------------------------------
+
+    with DoneManager.Create(StreamDecorator(io.StringIO()), "") as dm:
+        ExecuteTasks(dm, "Testing", tasks, Init, quiet=True, max_num_threads=1, release_contexts=release_contexts)
+
+        assert dm.result == 0
+
+    assert [task.result for task in tasks] == [0, 0, 0]
+
+    if release_contexts:
+        # Contexts are released as soon as each task completes
+        assert previous_contexts == [[], [None], [None, None]]
+        assert [task.context for task in tasks] == [None, None, None]
+    else:
+        assert previous_contexts == [[], [0], [0, 1]]
+        assert [task.context for task in tasks] == [0, 1, 2]
@@ -598,6 +598,33 @@ class _ValidatePythonLibraryVersions(SCMPlugin):
 
                 python_libraries.append(child)
 
+        # Calculate the versions of all libraries at once, as this only walks the repository history
+        # once.
+        versioned_libraries = [
+            python_library
+            for python_library in python_libraries
+            if (python_library / "src" / "__version__.py").is_file()
+        ]
+
+        calculated_versions: dict[Path, AutoSemVerLib.GetSemanticVersionResult] = {}
+
+        if versioned_libraries:
+            with dm.Nested(
+                "Calculating actual versions...",
+                suffix="\n",
+            ) as version_dm:
+                calculated_versions = dict(
+                    zip(
+                        versioned_libraries,
+                        AutoSemVerLib.GetSemanticVersions(
+                            version_dm,
+                            versioned_libraries,
+                            include_branch_name_when_necessary=False,
+                            no_metadata=True,
+                        ),
+                    ),
+                )
+
         with dm.Nested("Processing {}...".format(inflect.no("library", len(python_libraries)))) as processing_dm:
             for python_library_index, python_library in enumerate(python_libraries):
                 with processing_dm.Nested(
@@ -631,22 +658,10 @@ class _ValidatePythonLibraryVersions(SCMPlugin):
                                     version_dm.WriteError("'VERSION' was not defined in '{}'.".format(version_filename))
                                     continue
 
-                    # Calculate the version
-                    calculated_version: Optional[AutoSemVerLib.GetSemanticVersionResult] = None
-
-                    with library_dm.Nested(
-                        "Calculating actual version...",
-                        lambda: calculated_version.version if calculated_version is not None else "errors were encountered",
-                    ) as version_dm:
-                        calculated_version = AutoSemVerLib.GetSemanticVersion(
-                            version_dm,
-                            path=python_library,
-                            include_branch_name_when_necessary=False,
-                            no_metadata=True,
-                        )
+                    # Get the calculated version
+                    calculated_version = calculated_versions[python_library]
 
                     assert specified_version is not None
-                    assert calculated_version is not None
 
                     # Python libraries are only defined in terms of major/minor/patch, so we need
                     # to compare as a semver string.
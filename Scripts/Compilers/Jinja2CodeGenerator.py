@@ -15,16 +15,20 @@
 # ----------------------------------------------------------------------
 """Compiles Jinja2 template files."""
 
+import hashlib
+import json
 import os
 import textwrap
+import threading
 import uuid
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List as ListType, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, cast, Dict, Generator, Iterator, List as ListType, Optional, Sequence, Tuple, Union
 
 import typer
 
-from jinja2 import Environment, exceptions, FileSystemLoader, StrictUndefined, Undefined
+from jinja2 import Environment, exceptions, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined, Template, Undefined
 from jinja2.defaults import BLOCK_START_STRING, BLOCK_END_STRING, COMMENT_START_STRING, COMMENT_END_STRING, VARIABLE_START_STRING, VARIABLE_END_STRING
 
 from typer.core import TyperGroup
@@ -78,6 +82,7 @@ class CodeGenerator(
             "Compiles Jinja2 template files.",
             InputType.Files,
             can_execute_in_parallel=True,
+            can_generate_contexts_in_parallel=True,
         )
 
         AtomicInputProcessorMixin.__init__(self)
@@ -94,6 +99,7 @@ class CodeGenerator(
         # Ensure that these bool values are the expected values, as the flag names will
         # need to change if the default values change.
         assert default_metadata["force"] is False
+        assert default_metadata["only_write_changed_outputs"] is False
         assert default_metadata["preserve_dir_structure"] is True
         assert default_metadata["trim_blocks"] is True
         assert default_metadata["lstrip_blocks"] is True
@@ -108,6 +114,7 @@ class CodeGenerator(
             "list_variables": (bool, typer.Option(default_metadata["list_variables"], "--list-variables", help="Lists all variables in the Jinja2 templates.")),
             "force": (bool, typer.Option(default_metadata["force"], "--force", help="Force the generation of content, even when no changes are detected.")),
             "ignore_errors": (bool, typer.Option(default_metadata["ignore_errors"], "--ignore-errors", help="Continue even when errors are encountered.")),
+            "only_write_changed_outputs": (bool, typer.Option(default_metadata["only_write_changed_outputs"], "--only-write-changed-outputs", help="Do not write output files whose content is unchanged. The modification times of these files are preserved, so they may be older than the templates used to generate them.")),
             "jinja2_context": (
                 ListType[str],
                 TyperEx.TypeDictOption(None, {}, "--jinja2-context", allow_any__=True, help="Additional information to pass to the Jinja2 code generator."),
@@ -152,6 +159,7 @@ class CodeGenerator(
 
         yield "list_variables", False
         yield "ignore_errors", False
+        yield "only_write_changed_outputs", False
         yield "jinja2_context", {}
         yield "preserve_dir_structure", True
 
@@ -278,66 +286,6 @@ class CodeGenerator(
         ],
     ) -> Optional[str]:                     # Optional short description that provides input about the result
 
-        env: Optional[Environment] = None
-
-        # ----------------------------------------------------------------------
-        class RelativeFileSystemLoader(FileSystemLoader):
-            # ----------------------------------------------------------------------
-            def __init__(
-                self,
-                input_filename: Path,
-                searchpath: Union[str, Path, Sequence[Union[str, Path]]],
-                *args,
-                **kwargs,
-            ):
-                super(RelativeFileSystemLoader, self).__init__(
-                    searchpath=[input_filename.parent] + (searchpath if isinstance(searchpath, list) else []),
-                    *args,
-                    **kwargs,
-                )
-
-            # ----------------------------------------------------------------------
-            def get_source(
-                self,
-                environment: Environment,
-                template: str,
-            ) -> Tuple[str, str, Callable[[], bool]]:
-                method = super(RelativeFileSystemLoader, self).get_source
-
-                first_exception: Optional[Exception] = None
-
-                # ----------------------------------------------------------------------
-                # Jinja2 does not populate variables in templates, so we need to do that for it here.
-                def RenderTemplate() -> str:
-                    assert env is not None
-
-                    template_template = env.from_string(template)
-                    return template_template.render(**context["jinja2_context"])
-
-                # ----------------------------------------------------------------------
-
-                for template_decorator_func in [lambda: template, RenderTemplate]:
-                    this_template = template_decorator_func()
-
-                    try:
-                        return method(environment, this_template)
-
-                    except exceptions.TemplateNotFound as ex:
-                        if first_exception is None:
-                            first_exception = ex
-
-                        for searchpath in reversed(self.searchpath):
-                            potential_template = Path(searchpath) / this_template
-                            if potential_template.is_file():
-                                self.searchpath.append(str(potential_template.parent.resolve()))
-
-                                return method(environment, potential_template.name)
-
-                assert first_exception is not None
-                raise first_exception
-
-        # ----------------------------------------------------------------------
-
         standard_env_args = {
             "variable_start_string": context["variable_start"],
             "variable_end_string": context["variable_end"],
@@ -369,14 +317,7 @@ class CodeGenerator(
             ) as this_dm:
                 on_progress_func(index, str(Path(*input_filename.parts[input_root_parts_len:])))
 
-                env = Environment(
-                    **{
-                        **standard_env_args,
-                        **{
-                            "loader": RelativeFileSystemLoader(input_filename, Path.cwd()),
-                        }
-                    },
-                )
+                env = _GetEnvironment(input_filename.parent, standard_env_args, context["jinja2_context"])
 
                 if context["list_variables"]:
                     from jinja2 import meta
@@ -397,12 +338,6 @@ class CodeGenerator(
 
                     continue
 
-                env.tests["valid_file"] = lambda value: (input_filename.parent / value).is_file()
-
-                env.filters["doubleslash"] = lambda value: value.replace("\\", "\\\\")
-                env.filters["env"] = lambda value: os.getenv(value)
-                env.filters["format_and_reduce"] = lambda items, template, join_str: join_str.join(template.format(item) for item in items)
-
                 # ----------------------------------------------------------------------
                 cached_guids: Dict[str, str] = {}
 
@@ -420,8 +355,6 @@ class CodeGenerator(
 
                 # ----------------------------------------------------------------------
 
-                env.globals["guid"] = CreateGuid
-
                 try:
                     with input_filename.open() as f:
                         template_content = f.read()
@@ -457,17 +390,21 @@ class CodeGenerator(
                             template_content=template_content.rstrip(),
                         )
 
-                    template = env.from_string(template_content)
+                    # The environment is shared, so provide the guid function as a template global
+                    template = _CreateTemplate(env, input_filename, template_content, {"guid": CreateGuid})
 
-                    content = template.render(**context["jinja2_context"])
+                    with cast(_RelativeFileSystemLoader, env.loader).RenderScope():
+                        content = template.render(**context["jinja2_context"])
                 except Exception as ex:
                     this_dm.WriteError("{}: {}".format(type(ex).__name__, str(ex)))
                     continue
 
-                output_filename.parent.mkdir(parents=True, exist_ok=True)
-
-                with output_filename.open("w") as f:
-                    f.write(content)
+                if not self._WriteOutputFile(
+                    output_filename,
+                    content,
+                    only_write_changed_outputs=context["only_write_changed_outputs"],
+                ):
+                    this_dm.WriteVerbose("'{}' is unchanged.\n".format(output_filename))
 
 
 # ----------------------------------------------------------------------
@@ -482,6 +419,216 @@ Clean                                       = CreateCleanCommandLineFunc(app, _c
 List                                        = CreateListCommandLineFunc(app, _code_generator)
 
 
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _RelativeFileSystemLoader(FileSystemLoader):
+    """\
+    Loads templates from the template root and the current working directory. Templates that can't be
+    loaded by name (for example, names that include '..') are found relative to the search path, and
+    their directories are searched for the remainder of the render.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        template_root: Path,
+        searchpath: Union[str, Path, Sequence[Union[str, Path]]],
+        jinja2_context: Dict[str, Any],
+        *args,
+        **kwargs,
+    ):
+        super(_RelativeFileSystemLoader, self).__init__(
+            searchpath=[template_root] + (searchpath if isinstance(searchpath, list) else []),
+            *args,
+            **kwargs,
+        )
+
+        self._jinja2_context                = jinja2_context
+
+        # The loader is shared by all renders (across threads), so `self.searchpath` is never
+        # modified; directories added during a render are stored here instead.
+        self._render_data                   = threading.local()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def RenderScope(self) -> Iterator[None]:
+        """Directories added to the search path while rendering are discarded when the render is complete"""
+
+        self._render_data.searchpath = list(self.searchpath)
+
+        try:
+            yield
+        finally:
+            del self._render_data.searchpath
+
+    # ----------------------------------------------------------------------
+    def get_source(
+        self,
+        environment: Environment,
+        template: str,
+    ) -> Tuple[str, str, Callable[[], bool]]:
+        searchpath = self._GetSearchpath()
+
+        # Templates are cached by name, and the template associated with a name depends on the
+        # search path at the time that it was loaded.
+        original_searchpath = list(searchpath)
+
+        # ----------------------------------------------------------------------
+        def Load(
+            name: str,
+            load_searchpath: ListType[str],
+        ) -> Tuple[str, str, Callable[[], bool]]:
+            source, filename, uptodate = FileSystemLoader(
+                load_searchpath,
+                self.encoding,
+                self.followlinks,
+            ).get_source(environment, name)
+
+            return (
+                source,
+                filename,
+                lambda: self._GetSearchpath() == original_searchpath and uptodate(),
+            )
+
+        # ----------------------------------------------------------------------
+
+        first_exception: Optional[Exception] = None
+
+        # ----------------------------------------------------------------------
+        # Jinja2 does not populate variables in templates, so we need to do that for it here.
+        def RenderTemplate() -> str:
+            template_template = environment.from_string(template)
+            return template_template.render(**self._jinja2_context)
+
+        # ----------------------------------------------------------------------
+
+        for template_decorator_func in [lambda: template, RenderTemplate]:
+            this_template = template_decorator_func()
+
+            try:
+                return Load(this_template, searchpath)
+
+            except exceptions.TemplateNotFound as ex:
+                if first_exception is None:
+                    first_exception = ex
+
+                for this_searchpath in reversed(searchpath):
+                    potential_template = Path(this_searchpath) / this_template
+                    if potential_template.is_file():
+                        template_dir = str(potential_template.parent.resolve())
+
+                        if template_dir not in searchpath:
+                            searchpath.append(template_dir)
+
+                        source, filename, _ = Load(potential_template.name, [template_dir, ])
+
+                        # The directory must be added to the search path each time that the template
+                        # is used, so the environment can't use its cached template (the bytecode cache
+                        # prevents the template from being compiled again).
+                        return source, filename, lambda: False
+
+        assert first_exception is not None
+        raise first_exception
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetSearchpath(self) -> ListType[str]:
+        """Returns the search path for the current render (or a copy of the search path when not rendering)"""
+
+        searchpath = getattr(self._render_data, "searchpath", None)
+        if searchpath is None:
+            searchpath = list(self.searchpath)
+
+        return searchpath
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+# Environments created by _GetEnvironment, keyed by (template root, environment args, jinja2 context)
+_environments: Dict[Tuple[Path, Tuple[Tuple[str, Any], ...], str], Environment]    = {}
+_environments_lock                          = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+def _GetEnvironment(
+    template_root: Path,
+    standard_env_args: Dict[str, Any],
+    jinja2_context: Dict[str, Any],
+) -> Environment:
+    """Returns the Environment shared by all templates in the root with these settings, creating it if necessary"""
+
+    env_args_key = tuple(sorted(standard_env_args.items()))
+
+    key = (
+        template_root,
+        env_args_key,
+        json.dumps(jinja2_context, sort_keys=True, default=str),
+    )
+
+    with _environments_lock:
+        env = _environments.get(key, None)
+        if env is not None:
+            return env
+
+        # Compiled bytecode doesn't encode the environment settings, so use a distinct
+        # cache file pattern for each combination of settings.
+        settings_hash = hashlib.sha256(
+            repr([(k, getattr(v, "__name__", v)) for k, v in env_args_key]).encode("utf-8"),
+        ).hexdigest()[:16]
+
+        env = Environment(
+            **{
+                **standard_env_args,
+                **{
+                    "loader": _RelativeFileSystemLoader(template_root, Path.cwd(), jinja2_context),
+                    "bytecode_cache": FileSystemBytecodeCache(
+                        pattern="__jinja2_{}_%s.cache".format(settings_hash),
+                    ),
+                },
+            },
+        )
+
+        env.tests["valid_file"] = lambda value: (template_root / value).is_file()
+
+        env.filters["doubleslash"] = lambda value: value.replace("\\", "\\\\")
+        env.filters["env"] = lambda value: os.getenv(value)
+        env.filters["format_and_reduce"] = lambda items, template, join_str: join_str.join(template.format(item) for item in items)
+
+        _environments[key] = env
+
+        return env
+
+
+# ----------------------------------------------------------------------
+def _CreateTemplate(
+    env: Environment,
+    input_filename: Path,
+    template_content: str,
+    template_globals: Dict[str, Any],
+) -> Template:
+    """Creates a template from content, using the environment's bytecode cache to avoid recompilation"""
+
+    name = str(input_filename)
+
+    bytecode_cache = env.bytecode_cache
+    assert bytecode_cache is not None
+
+    bucket = bytecode_cache.get_bucket(env, name, name, template_content)
+
+    if bucket.code is None:
+        bucket.code = env.compile(template_content, name, name)
+        bytecode_cache.set_bucket(bucket)
+
+    return env.template_class.from_code(env, bucket.code, env.make_globals(template_globals))
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
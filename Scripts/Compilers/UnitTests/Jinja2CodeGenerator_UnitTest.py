@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------
+# |
+# |  Jinja2CodeGenerator_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 23:55:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022-23
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Jinja2CodeGenerator"""
+
+import io
+import os
+import sys
+
+from pathlib import Path
+from typing import Any, Dict
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.Streams.StreamDecorator import StreamDecorator
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+with ExitStack(lambda: sys.path.pop(0)):
+    import Jinja2CodeGenerator  # pylint: disable=import-error
+
+
+# ----------------------------------------------------------------------
+def test_RelativeIncludes(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+
+    for name in ["shared1", "shared2"]:
+        shared_dir = tmp_path / name
+        shared_dir.mkdir()
+
+        (shared_dir / "inc.j2").write_text('{} {{% include "common.j2" %}}'.format(name))
+        (shared_dir / "common.j2").write_text("from {}".format(name))
+
+    (input_dir / "a.txt.jinja2").write_text('a: {% include "../shared1/inc.j2" %}')
+    (input_dir / "b.txt.jinja2").write_text('b: {% include "../shared2/inc.j2" %}')
+
+    expected = {
+        "a.txt": "a: shared1 from shared1",
+        "b.txt": "b: shared2 from shared2",
+    }
+
+    # Includes resolved while rendering one file don't impact the includes of other files
+    assert _Generate(input_dir, tmp_path / "output1") == expected
+
+    # Generate again with the shared environment and its cached templates
+    assert _Generate(input_dir, tmp_path / "output2") == expected
+
+    # The loader's search path is not modified
+    loaders = [
+        env.loader
+        for (template_root, _, _), env in Jinja2CodeGenerator._environments.items()  # pylint: disable=protected-access
+        if template_root == input_dir
+    ]
+
+    assert len(loaders) == 1
+    assert loaders[0].searchpath == [str(input_dir)]  # type: ignore
+
+
+# ----------------------------------------------------------------------
+def test_OnlyWriteChangedOutputs(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+
+    (input_dir / "a.txt.jinja2").write_text("a: {{ value }}")
+
+    output_dir = tmp_path / "output"
+
+    # ----------------------------------------------------------------------
+    def Generate(
+        value: str,
+        **metadata: Any,
+    ) -> None:
+        assert _Generate(input_dir, output_dir, jinja2_context={"value": value}, **metadata) == {
+            "a.txt": "a: {}".format(value),
+        }
+
+    # ----------------------------------------------------------------------
+
+    Generate("one")
+
+    output_filename = next(output_dir.rglob("a.txt"))
+
+    # ----------------------------------------------------------------------
+    def Backdate() -> int:
+        modified_time = 1_000_000_000_000_000_000
+
+        os.utime(output_filename, ns=(modified_time, modified_time))
+        return modified_time
+
+    # ----------------------------------------------------------------------
+
+    # Outputs are written by default, even when their content is unchanged
+    modified_time = Backdate()
+    Generate("one")
+    assert output_filename.stat().st_mtime_ns != modified_time
+
+    # Unchanged outputs aren't written when requested
+    modified_time = Backdate()
+    Generate("one", only_write_changed_outputs=True)
+    assert output_filename.stat().st_mtime_ns == modified_time
+
+    # Changed outputs are always written
+    Generate("two", only_write_changed_outputs=True)
+    assert output_filename.stat().st_mtime_ns != modified_time
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Generate(
+    input_dir: Path,
+    output_dir: Path,
+    **metadata: Any,
+) -> Dict[str, str]:
+    generator = Jinja2CodeGenerator.CodeGenerator()
+
+    with DoneManager.Create(StreamDecorator(None), "") as dm:
+        for context in generator.GenerateContextItems(
+            dm,
+            input_dir,
+            {
+                "output_dir": output_dir,
+                "jinja2_context": {},
+                "force": True,
+                **metadata,
+            },
+        ):
+            result = generator.Generate(context, io.StringIO(), lambda *args: True, verbose=False, debug=False)
+            assert not result, result
+
+    return {
+        filename.name: filename.read_text()
+        for filename in sorted(output_dir.rglob("*.txt"))
+    }
@@ -16,11 +16,13 @@
 """Contains functionality used to generate a semantic version based on recent changes in an active repository."""
 
 import datetime
+import hashlib
 import itertools
 import json
 import os
 import platform
 import re
+import threading
 
 from dataclasses import dataclass, field
 from enum import Enum
@@ -33,7 +35,9 @@ from jsonschema import Draft202012Validator, validators
 from semantic_version import Version as SemVer
 
 from Common_Foundation import PathEx
+from Common_Foundation import SubprocessEx
 from Common_Foundation.SourceControlManagers.All import ALL_SCMS
+from Common_Foundation.SourceControlManagers.GitSourceControlManager import Repository as GitRepository
 from Common_Foundation.SourceControlManagers.SourceControlManager import Repository
 from Common_Foundation.Streams.DoneManager import DoneManager
 from Common_Foundation import Types
@@ -89,6 +93,12 @@ class GetSemanticVersionResult(object):
     semantic_version: SemVer
     version: str
 
+    # Information about how the version was calculated
+    has_working_changes: bool                           = field(kw_only=True)
+    changes_processed: int                              = field(kw_only=True)   # Changes enumerated in the repository
+    changes_applied: int                                = field(kw_only=True)   # Enumerated changes that impacted this version (cached changes are not included)
+    used_cache: bool                                    = field(kw_only=True)   # Information cached by a previous invocation was used
+
 
 # ----------------------------------------------------------------------
 # |
@@ -105,102 +115,337 @@ def GetSemanticVersion(
     include_computer_name_when_necessary: bool=True,
     no_prefix: bool=False,
     no_metadata: bool=False,
+    no_cache: bool=False,
     configuration_filenames: Optional[list[str]]=None,
     style: GenerateStyle=GenerateStyle.Standard,
 ) -> GetSemanticVersionResult:
+    return GetSemanticVersions(
+        dm,
+        [path, ],
+        prerelease_name=prerelease_name,
+        include_branch_name_when_necessary=include_branch_name_when_necessary,
+        include_timestamp_when_necessary=include_timestamp_when_necessary,
+        include_computer_name_when_necessary=include_computer_name_when_necessary,
+        no_prefix=no_prefix,
+        no_metadata=no_metadata,
+        no_cache=no_cache,
+        configuration_filenames=configuration_filenames,
+        style=style,
+    )[0]
+
+
+# ----------------------------------------------------------------------
+def GetSemanticVersions(
+    dm: DoneManager,
+    paths: list[Path],
+    *,
+    prerelease_name: Optional[str]=None,
+    include_branch_name_when_necessary: bool=True,
+    include_timestamp_when_necessary: bool=True,
+    include_computer_name_when_necessary: bool=True,
+    no_prefix: bool=False,
+    no_metadata: bool=False,
+    no_cache: bool=False,
+    configuration_filenames: Optional[list[str]]=None,
+    style: GenerateStyle=GenerateStyle.Standard,
+) -> list[GetSemanticVersionResult]:
+    """Returns semantic versions for multiple paths, walking the history of each repository once."""
+
     configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
-    repository = _GetRepository(dm, path)
-    configuration: Optional[Configuration] = None
+    # Group the paths by repository
+    repository_infos: dict[Path, tuple[Repository, list[int]]] = {}
 
-    # ----------------------------------------------------------------------
-    def DisplayConfiguration() -> str:
-        if configuration is None:
-            return "configuration errors were encountered"
+    for path_index, path in enumerate(paths):
+        repository = _GetRepository(dm, path)
 
-        if configuration.filename is None:
-            return "default configuration info will be used"
+        repository_info = repository_infos.get(repository.repo_root, None)
+        if repository_info is None:
+            repository_info = (repository, [])
+            repository_infos[repository.repo_root] = repository_info
 
-        return "configuration info found at '{}'".format(configuration.filename)
+        repository_info[1].append(path_index)
 
-    # ----------------------------------------------------------------------
+    results: list[Optional[GetSemanticVersionResult]] = [None for _ in paths]
 
-    with dm.Nested(
-        "Loading AutoSemVer configuration...",
-        DisplayConfiguration,
-    ) as configuration_dm:
-        configuration = GetConfiguration(
-            path,
-            repository.repo_root,
+    for repository, path_indexes in repository_infos.values():
+        configurations: list[Configuration] = [
+            _LoadConfiguration(dm, paths[path_index], repository, configuration_filenames)
+            for path_index in path_indexes
+        ]
+
+        semantic_version_infos = _CalculateSemanticVersions(
+            dm,
+            repository,
+            configurations,
             configuration_filenames,
+            no_cache=no_cache,
         )
 
-        if configuration.filename is None:
-            configuration_dm.WriteVerbose("The default configuration will be used.")
-        else:
-            configuration_dm.WriteVerbose("Configuration information loaded from '{}'.".format(configuration.filename))
+        for path_index, configuration, semantic_version_info in zip(
+            path_indexes,
+            configurations,
+            semantic_version_infos,
+        ):
+            version_string = _CalculateVersionString(
+                dm,
+                repository,
+                configuration,
+                semantic_version_info.semantic_version,
+                semantic_version_info.has_working_changes,
+                prerelease_name=prerelease_name,
+                include_branch_name_when_necessary=include_branch_name_when_necessary,
+                include_timestamp_when_necessary=include_timestamp_when_necessary,
+                include_computer_name_when_necessary=include_computer_name_when_necessary,
+                no_prefix=no_prefix,
+                no_metadata=no_metadata,
+                style=style,
+            )
 
-    changes_processed = 0
-    changes_applied = 0
+            results[path_index] = GetSemanticVersionResult(
+                configuration.filename,
+                semantic_version_info.semantic_version,
+                version_string,
+                has_working_changes=semantic_version_info.has_working_changes,
+                changes_processed=semantic_version_info.changes_processed,
+                changes_applied=semantic_version_info.changes_applied,
+                used_cache=semantic_version_info.used_cache,
+            )
 
-    baseline_version: Optional[list[int]] = None
+    return [Types.EnsureValid(result) for result in results]
 
-    major_delta = 0
-    minor_delta = 0
-    patch_delta = 0
 
-    update_minor = True
-    update_patch = True
+# ----------------------------------------------------------------------
+def GetConfigurationFilename(
+    path: Path,
+    repository_root: Path,
+    configuration_filenames: Optional[list[str]]=None,
+) -> Optional[Path]:
+    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
-    has_working_changes = False
+    for parent in itertools.chain([path, ], path.parents):
+        for potential_configuration_filename in configuration_filenames:
+            potential_filename = parent / potential_configuration_filename
+            if potential_filename.is_file():
+                return potential_filename
 
-    with dm.Nested(
-        "Enumerating changes...",
-        [
-            lambda: "{} processed".format(inflect.no("change", changes_processed)),
-            lambda: "{} applied [{:.02f}%]".format(
-                inflect.no("change", changes_applied),
-                0 if changes_processed == 0 else ((changes_applied / changes_processed) * 100),
-            ),
-        ],
-    ) as enumerate_dm:
-        root_path = configuration.filename.parent if configuration.filename else repository.repo_root
-
-        # ----------------------------------------------------------------------
-        def GetConfigurationPathForFile(
-            filename: Path,
-        ) -> Path:
-            result = GetConfigurationFilename(
-                filename.parent,
-                repository.repo_root,
-                configuration_filenames,
-            )
+        if parent == repository_root:
+            break
 
-            if result is not None:
-                return result.parent
+    return None
 
-            return root_path
 
-        # ----------------------------------------------------------------------
-        def ShouldProcess(
-            change: Repository.ChangeInfo,
-        ) -> bool:
-            for filename in itertools.chain(
-                change.files_added,
-                change.files_modified,
-                change.files_removed,
-                change.working_files
-            ):
-                if (
-                    PathEx.IsDescendant(filename, root_path)
-                    and GetConfigurationPathForFile(filename) == root_path
-                ):
-                    return True
+# ----------------------------------------------------------------------
+def GetConfiguration(
+    path: Path,
+    repository_root: Path,
+    configuration_filenames: Optional[list[str]]=None,
+) -> Configuration:
+    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
-            return False
+    # Get the configuration filename
+    configuration_filename: Optional[Path] = GetConfigurationFilename(
+        path,
+        repository_root,
+        configuration_filenames,
+    )
+
+    # Use the cached configuration if the file hasn't changed since it was loaded
+    file_info: Optional[tuple[int, int]] = None
+
+    if configuration_filename is not None:
+        stat_result = configuration_filename.stat()
+        file_info = (stat_result.st_mtime_ns, stat_result.st_size)
 
-        # ----------------------------------------------------------------------
+    with _configuration_cache_lock:
+        cache_item = _configuration_cache.get(configuration_filename, None)
+
+    if cache_item is not None and cache_item[0] == file_info:
+        return cache_item[1]
+
+    # Get the configuration content
+    configuration_content: dict[str, Any] = {}
 
+    if configuration_filename:
+        with configuration_filename.open() as f:
+            if configuration_filename.suffix in [".yaml", ".yml"]:
+                configuration_content = cast(dict[str, Any], rtyaml.load(f))
+
+            elif configuration_filename.suffix == ".json":
+                configuration_content = json.load(f)
+
+            else:
+                raise Exception("'{}' is not a recognized configuration file type.".format(configuration_filename))
+
+    # Validate the configuration data
+    _GetConfigurationValidator().validate(configuration_content)
+
+    # Map the configuration data to a Configuration instance
+    configuration = Configuration(
+        configuration_filename,
+        configuration_content.get("version_prefix", None),
+        configuration_content["pre_release_environment_variable_name"],
+        SemVer.coerce(configuration_content["initial_version"]),
+        configuration_content["main_branch_names"],
+        include_branch_name_when_necessary=configuration_content["include_branch_name_when_necessary"],
+        include_timestamp_when_necessary=configuration_content["include_timestamp_when_necessary"],
+        include_computer_name_when_necessary=configuration_content["include_computer_name_when_necessary"],
+    )
+
+    with _configuration_cache_lock:
+        _configuration_cache[configuration_filename] = (file_info, configuration)
+
+    return configuration
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+def _DefaultValidatingValidatorFactory(
+    validator_class: PythonType,
+) -> PythonType:
+    # This code is based on https://python-jsonschema.readthedocs.io/en/latest/faq/
+    validate_properties = validator_class.VALIDATORS["properties"]
+
+    # ----------------------------------------------------------------------
+    def SetDefaults(validator, properties, instance, schema):
+        for prop, sub_schema in properties.items():
+            default_schema = sub_schema.get("default", None)
+            if default_schema is not None:
+                instance.setdefault(prop, default_schema)
+
+            for error in validate_properties(validator, properties, instance, schema):
+                yield error
+
+    # ----------------------------------------------------------------------
+
+    return validators.extend(validator_class, {"properties": SetDefaults})
+
+
+_DefaultValidatingValidator                 = _DefaultValidatingValidatorFactory(Draft202012Validator)
+
+del _DefaultValidatingValidatorFactory
+
+# Created on first use
+_configuration_validator: Optional[Any]     = None
+_configuration_validator_lock               = threading.Lock()
+
+# Configurations loaded by GetConfiguration, keyed by filename: ((st_mtime_ns, st_size), configuration)
+_configuration_cache: dict[Optional[Path], tuple[Optional[tuple[int, int]], Configuration]]  = {}
+_configuration_cache_lock                   = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+class _ConfigurationFilenameLookup(object):
+    """Memoized version of GetConfigurationFilename, used when looking up configurations for many files"""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        repository_root: Path,
+        configuration_filenames: list[str],
+    ):
+        self._repository_root               = repository_root
+        self._configuration_filenames       = configuration_filenames
+
+        self._cache: dict[Path, Optional[Path]]         = {}
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        path: Path,
+    ) -> Optional[Path]:
+        # Walk up the directory hierarchy until we find a directory that has already been
+        # looked up, a configuration file, or the repository root.
+        uncached_paths: list[Path] = []
+        result: Optional[Path] = None
+
+        for parent in itertools.chain([path, ], path.parents):
+            if parent in self._cache:
+                result = self._cache[parent]
+                break
+
+            uncached_paths.append(parent)
+
+            for potential_configuration_filename in self._configuration_filenames:
+                potential_filename = parent / potential_configuration_filename
+                if potential_filename.is_file():
+                    result = potential_filename
+                    break
+
+            if result is not None or parent == self._repository_root:
+                break
+
+        for uncached_path in uncached_paths:
+            self._cache[uncached_path] = result
+
+        return result
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _SemanticVersionInfo(object):
+    """Semantic version calculated for a configuration and information about how it was calculated"""
+
+    # ----------------------------------------------------------------------
+    semantic_version: SemVer
+    has_working_changes: bool
+    changes_processed: int
+    changes_applied: int
+    used_cache: bool
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _VersionState(object):
+    """Version information calculated for a contiguous range of changes (ordered from newest to oldest)"""
+
+    # ----------------------------------------------------------------------
+    baseline_version: Optional[list[int]]   = field(default=None)
+
+    major_delta: int                        = field(default=0)
+    minor_delta: int                        = field(default=0)
+    patch_delta: int                        = field(default=0)
+
+    update_minor: bool                      = field(default=True)
+    update_patch: bool                      = field(default=True)
+
+    # ----------------------------------------------------------------------
+    def Combine(
+        self,
+        older: "_VersionState",
+    ) -> "_VersionState":
+        """Returns the state for this range of changes followed by the older range of changes"""
+
+        if self.baseline_version is not None:
+            return self
+
+        return _VersionState(
+            older.baseline_version,
+            self.major_delta + older.major_delta,
+            self.minor_delta + (older.minor_delta if self.update_minor else 0),
+            self.patch_delta + (older.patch_delta if self.update_patch else 0),
+            self.update_minor and older.update_minor,
+            self.update_patch and older.update_patch,
+        )
+
+
+# ----------------------------------------------------------------------
+class _VersionCalculator(object):
+    """Calculates the semantic version for a configuration root by processing changes from newest to oldest"""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        dm: DoneManager,
+        configuration: Configuration,
+        root_path: Path,
+        configuration_filenames: list[str],
+        configuration_filename_lookup: _ConfigurationFilenameLookup,
+        version_cache: Optional["_VersionCache"],
+    ):
         version_regex = r"(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)"
 
         if configuration.version_prefix:
@@ -212,117 +457,169 @@ def GetSemanticVersion(
         else:
             version_regex = r"^v?{}$".format(version_regex)
 
-        version_regex = re.compile(version_regex)
+        cache_key = json.dumps(
+            [
+                str(root_path),
+                configuration.version_prefix,
+                configuration_filenames,
+            ],
+        )
+
+        self.changes_applied                = 0
+        self.has_working_changes            = False
+        self.used_cache                     = False
+        self.is_complete                    = False
 
-        # ----------------------------------------------------------------------
-        def HasExplicitVersion(
-            change: Repository.ChangeInfo,
-            *,
-            process_tags: bool=False,
-        ) -> bool:
-            nonlocal baseline_version
+        self._dm                            = dm
+        self._configuration                 = configuration
+        self._root_path                     = root_path
+        self._configuration_filenames       = configuration_filenames
+        self._configuration_filename_lookup = configuration_filename_lookup
+        self._version_regex                 = re.compile(version_regex)
 
-            queries = change.tags if process_tags else [change.description, ]
+        # Working changes are tracked separately from committed changes, as only the information
+        # associated with committed changes can be cached.
+        self._working_state                 = _VersionState()
+        self._committed_state               = _VersionState()
+        self._state                         = self._working_state
 
-            for query in queries:
-                match = version_regex.search(query)
-                if match is None:
-                    continue
+        self._version_cache                 = version_cache
+        self._cache_key                     = cache_key
+        self._persist_cache                 = version_cache is not None
 
-                baseline_version = [
-                    int(match.group("major")),
-                    int(match.group("minor")),
-                    int(match.group("patch")),
-                ]
+        # (change ids not included in the cached information, cached information)
+        self._cache_item: Optional[tuple[set[str], _VersionState]]     = None
 
-                enumerate_dm.WriteVerbose(
-                    "The explicit version '{}' was found in '{}' ({}).".format(
-                        match.group(0),
-                        change.id,
-                        change.author_date,
-                    ),
-                )
+        if version_cache is not None:
+            self._cache_item = version_cache.Get(cache_key)
 
-                return True
+    # ----------------------------------------------------------------------
+    def Process(
+        self,
+        change: Repository.ChangeInfo,
+    ) -> None:
+        assert not self.is_complete
+
+        if change.id == Repository.ChangeInfo.WORKING_CHANGES_COMMIT_ID:
+            # Configuration files added or removed in the working directory change the
+            # way in which committed changes are attributed to configurations.
+            if self._ModifiesConfiguration(change):
+                self._cache_item = None
+                self._persist_cache = False
 
-            return False
+        else:
+            self._state = self._committed_state
 
-        # ----------------------------------------------------------------------
+            if self._cache_item is not None:
+                pending_change_ids, cached_state = self._cache_item
 
-        for change in repository.EnumChangesEx(
-            include_working_changes=True,
-        ):
-            changes_processed += 1
+                if change.id not in pending_change_ids:
+                    # Only use the cached information if all of the changes that came after it
+                    # have been processed (changes on merged branches may be older than the
+                    # change associated with the cached information).
+                    if not pending_change_ids:
+                        self._dm.WriteVerbose("Cached version information was found for '{}'.".format(self._root_path))
 
-            if HasExplicitVersion(change, process_tags=True):
-                changes_applied += 1
-                break
+                        self._committed_state = self._committed_state.Combine(cached_state)
+                        self._state = self._committed_state
 
-            if not ShouldProcess(change):
-                continue
+                        self.used_cache = True
+                        self.is_complete = True
+                        return
 
-            changes_applied += 1
+                    self._cache_item = None
 
-            if change.id == Repository.ChangeInfo.WORKING_CHANGES_COMMIT_ID:
-                has_working_changes = True
+                elif self._ModifiesConfiguration(change):
+                    self._cache_item = None
 
-            if HasExplicitVersion(change):
-                break
+                else:
+                    pending_change_ids.remove(change.id)
 
-            elif "+major" in change.description:
-                enumerate_dm.WriteVerbose(
-                    "Incrementing major version based on '{}' ({}).".format(
+        if self._HasExplicitVersion(change, process_tags=True):
+            self.changes_applied += 1
+            self.is_complete = True
+            return
+
+        if not self._ShouldProcess(change):
+            return
+
+        self.changes_applied += 1
+
+        if change.id == Repository.ChangeInfo.WORKING_CHANGES_COMMIT_ID:
+            self.has_working_changes = True
+
+        if self._HasExplicitVersion(change):
+            self.is_complete = True
+
+        elif "+major" in change.description:
+            self._dm.WriteVerbose(
+                "Incrementing major version based on '{}' ({}).".format(
+                    change.id,
+                    change.author_date,
+                ),
+            )
+
+            self._state.major_delta += 1
+
+            self._state.update_minor = False
+            self._state.update_patch = False
+
+        elif "+minor" in change.description:
+            if self._state.update_minor:
+                self._dm.WriteVerbose(
+                    "Incrementing minor version based on '{}' ({}).".format(
                         change.id,
                         change.author_date,
                     ),
                 )
 
-                major_delta += 1
-
-                update_minor = False
-                update_patch = False
+                self._state.minor_delta += 1
 
-            elif "+minor" in change.description:
-                if update_minor:
-                    enumerate_dm.WriteVerbose(
-                        "Incrementing minor version based on '{}' ({}).".format(
-                            change.id,
-                            change.author_date,
-                        ),
-                    )
+                self._state.update_patch = False
 
-                    minor_delta += 1
+        else:
+            if self._state.update_patch:
+                self._dm.WriteVerbose(
+                    "Incrementing patch version based on '{}' ({}).".format(
+                        change.id,
+                        change.author_date,
+                    ),
+                )
 
-                    update_patch = False
+                self._state.patch_delta += 1
 
-            else:
-                if update_patch:
-                    enumerate_dm.WriteVerbose(
-                        "Incrementing patch version based on '{}' ({}).".format(
-                            change.id,
-                            change.author_date,
-                        ),
-                    )
+    # ----------------------------------------------------------------------
+    def Complete(self) -> None:
+        """Called once all changes have been processed"""
+
+        # Only persist the information if all of the committed changes were processed
+        if (
+            self._version_cache is not None
+            and self._persist_cache
+            and self._state is self._committed_state
+        ):
+            self._version_cache.Set(self._cache_key, self._committed_state)
 
-                    patch_delta += 1
+    # ----------------------------------------------------------------------
+    def GetSemanticVersion(self) -> SemVer:
+        state = self._working_state.Combine(self._committed_state)
 
-    semantic_version: Optional[SemVer] = None
+        baseline_version = state.baseline_version
+        major_delta = state.major_delta
+        minor_delta = state.minor_delta
+        patch_delta = state.patch_delta
 
-    with dm.Nested(
-        "Calculating semantic version...",
-        lambda: str(semantic_version) if semantic_version is not None else "errors were encountered",
-    ):
         if baseline_version is None:
             baseline_version = [
-                Types.EnsureValid(configuration.initial_version.major),
-                Types.EnsureValid(configuration.initial_version.minor),
-                Types.EnsureValid(configuration.initial_version.patch),
+                Types.EnsureValid(self._configuration.initial_version.major),
+                Types.EnsureValid(self._configuration.initial_version.minor),
+                Types.EnsureValid(self._configuration.initial_version.patch),
             ]
 
         # A version in the form "0.0.x" is not valid, so make sure that there is at least
         # a minor version when the major version is 0.
         if baseline_version[0] == 0 and baseline_version[1] == 0:
-            baseline_version[1] = 1
+            baseline_version = [baseline_version[0], 1, baseline_version[2]]
 
             # If we have only seen patch updates, apply one of those changes as a minor change so that
             # we don't end up with versions that look like 0.0.N; in this case the version should be
@@ -331,12 +628,457 @@ def GetSemanticVersion(
                 assert patch_delta > 0, patch_delta
                 patch_delta -= 1
 
-        semantic_version = SemVer(
+        return SemVer(
             major=baseline_version[0] + major_delta,
             minor=baseline_version[1] + minor_delta,
             patch=baseline_version[2] + patch_delta,
         )
 
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _ShouldProcess(
+        self,
+        change: Repository.ChangeInfo,
+    ) -> bool:
+        for filename in itertools.chain(
+            change.files_added,
+            change.files_modified,
+            change.files_removed,
+            change.working_files
+        ):
+            if (
+                PathEx.IsDescendant(filename, self._root_path)
+                and self._GetConfigurationPathForFile(filename) == self._root_path
+            ):
+                return True
+
+        return False
+
+    # ----------------------------------------------------------------------
+    def _GetConfigurationPathForFile(
+        self,
+        filename: Path,
+    ) -> Path:
+        result = self._configuration_filename_lookup.Get(filename.parent)
+
+        if result is not None:
+            return result.parent
+
+        return self._root_path
+
+    # ----------------------------------------------------------------------
+    def _HasExplicitVersion(
+        self,
+        change: Repository.ChangeInfo,
+        *,
+        process_tags: bool=False,
+    ) -> bool:
+        queries = change.tags if process_tags else [change.description, ]
+
+        for query in queries:
+            match = self._version_regex.search(query)
+            if match is None:
+                continue
+
+            self._state.baseline_version = [
+                int(match.group("major")),
+                int(match.group("minor")),
+                int(match.group("patch")),
+            ]
+
+            self._dm.WriteVerbose(
+                "The explicit version '{}' was found in '{}' ({}).".format(
+                    match.group(0),
+                    change.id,
+                    change.author_date,
+                ),
+            )
+
+            return True
+
+        return False
+
+    # ----------------------------------------------------------------------
+    def _ModifiesConfiguration(
+        self,
+        change: Repository.ChangeInfo,
+    ) -> bool:
+        for filename in itertools.chain(
+            change.files_added,
+            change.files_removed,
+            change.working_files,
+        ):
+            if filename.name in self._configuration_filenames:
+                return True
+
+        return False
+
+
+# ----------------------------------------------------------------------
+class _VersionCache(object):
+    """Persists the version information calculated for committed changes, keyed by configuration"""
+
+    # ----------------------------------------------------------------------
+    FILENAME                                = "AutoSemVer.Cache.json"
+    VERSION                                 = 1
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        repository: Repository,
+    ) -> Optional["_VersionCache"]:
+        # The cache is only valid if we are able to determine the changes between the cached change
+        # and the current change.
+        if not isinstance(repository, GitRepository):
+            return None
+
+        # Worktrees and submodules use a '.git' file that points to the actual directory
+        result = SubprocessEx.Run("git rev-parse --git-common-dir", cwd=repository.repo_root)
+        if result.returncode != 0:
+            return None
+
+        git_dir = repository.repo_root / result.output.strip()
+        if not git_dir.is_dir():
+            return None
+
+        # Tags can be added to (or removed from) changes that have already been processed, so
+        # cached information is only valid for the set of tags that existed when it was calculated.
+        result = SubprocessEx.Run(
+            'git for-each-ref "--format=%(objectname) %(refname)" refs/tags',
+            cwd=repository.repo_root,
+        )
+
+        if result.returncode != 0:
+            return None
+
+        tags_hash = hashlib.sha256(result.output.encode("utf-8")).hexdigest()
+
+        result = SubprocessEx.Run("git rev-parse --verify --quiet HEAD", cwd=repository.repo_root)
+        if result.returncode != 0:
+            return None
+
+        return cls(
+            repository,
+            git_dir / cls.FILENAME,
+            result.output.strip(),
+            tags_hash,
+        )
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        repository: GitRepository,
+        filename: Path,
+        head_change_id: str,
+        tags_hash: str,
+    ):
+        self._repository                    = repository
+        self._filename                      = filename
+        self._head_change_id                = head_change_id
+        self._tags_hash                     = tags_hash
+
+        self._items                         = self._Load()
+        self._modified_items: dict[str, Any]            = {}
+
+        # Ids of changes made after a cached change, keyed by the cached change id (None if the
+        # cached change isn't an ancestor of the current change). Cached information is usually
+        # calculated for the same change, so this is shared by all of the configurations.
+        self._pending_change_ids: dict[str, Optional[frozenset[str]]]   = {}
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        key: str,
+    ) -> Optional[tuple[set[str], _VersionState]]:
+        """Returns the ids of changes made after the cached information was calculated and the cached information"""
+
+        try:
+            item = self._items.get(key, None)
+            if item is None or item["tags_hash"] != self._tags_hash:
+                return None
+
+            change_id = item["change_id"]
+            state = _VersionState(**item["state"])
+
+        except (KeyError, TypeError):
+            return None
+
+        pending_change_ids = self._GetPendingChangeIds(change_id)
+        if pending_change_ids is None:
+            return None
+
+        # The caller modifies the set as changes are processed
+        return set(pending_change_ids), state
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: str,
+        state: _VersionState,
+    ) -> None:
+        """Updates the cached information; call `Save` to persist the changes"""
+
+        self._modified_items[key] = {
+            "change_id": self._head_change_id,
+            "tags_hash": self._tags_hash,
+            "state": dict(state.__dict__),
+        }
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        if not self._modified_items:
+            return
+
+        # Merge with the latest content, as other processes may have updated the file
+        items = self._Load()
+        items.update(self._modified_items)
+
+        self._items = items
+        self._modified_items = {}
+
+        temp_filename = self._filename.with_suffix(".{}.tmp".format(os.getpid()))
+
+        try:
+            with temp_filename.open("w") as f:
+                json.dump(
+                    {
+                        "version": self.__class__.VERSION,
+                        "items": items,
+                    },
+                    f,
+                )
+
+            os.replace(temp_filename, self._filename)
+
+        except OSError:
+            # The cache is an optimization; errors are not fatal
+            temp_filename.unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetPendingChangeIds(
+        self,
+        change_id: str,
+    ) -> Optional[frozenset[str]]:
+        if change_id not in self._pending_change_ids:
+            result: Optional[frozenset[str]] = None
+
+            # The cached information is only valid if it was calculated for an ancestor of the current change
+            is_ancestor = change_id == self._head_change_id
+
+            if not is_ancestor:
+                is_ancestor = SubprocessEx.Run(
+                    'git merge-base --is-ancestor "{}" "{}"'.format(change_id, self._head_change_id),
+                    cwd=self._repository.repo_root,
+                ).returncode == 0
+
+            if is_ancestor:
+                # Changes without files (such as merges) are not enumerated by EnumChangesEx
+                result = frozenset(
+                    pending_change_id
+                    for pending_change_id, filenames in self._repository.EnumChangedFilesInRange(change_id, self._head_change_id)
+                    if filenames
+                )
+
+            self._pending_change_ids[change_id] = result
+
+        return self._pending_change_ids[change_id]
+
+    # ----------------------------------------------------------------------
+    def _Load(self) -> dict[str, Any]:
+        try:
+            with self._filename.open() as f:
+                content = json.load(f)
+
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(content, dict) or content.get("version", None) != self.__class__.VERSION:
+            return {}
+
+        items = content.get("items", None)
+        if not isinstance(items, dict):
+            return {}
+
+        return items
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetConfigurationValidator() -> Any:
+    global _configuration_validator  # pylint: disable=global-statement
+
+    with _configuration_validator_lock:
+        if _configuration_validator is None:
+            schema_filename = PathEx.EnsureFile(Path(__file__).parent / "Configuration" / "GeneratedCode" / "AutoSemVerSchema.json")
+
+            with schema_filename.open() as f:
+                schema_content = json.load(f)
+
+            _configuration_validator = _DefaultValidatingValidator(schema_content)
+
+        return _configuration_validator
+
+
+# ----------------------------------------------------------------------
+def _LoadConfiguration(
+    dm: DoneManager,
+    path: Path,
+    repository: Repository,
+    configuration_filenames: list[str],
+) -> Configuration:
+    configuration: Optional[Configuration] = None
+
+    # ----------------------------------------------------------------------
+    def DisplayConfiguration() -> str:
+        if configuration is None:
+            return "configuration errors were encountered"
+
+        if configuration.filename is None:
+            return "default configuration info will be used"
+
+        return "configuration info found at '{}'".format(configuration.filename)
+
+    # ----------------------------------------------------------------------
+
+    with dm.Nested(
+        "Loading AutoSemVer configuration...",
+        DisplayConfiguration,
+    ) as configuration_dm:
+        configuration = GetConfiguration(
+            path,
+            repository.repo_root,
+            configuration_filenames,
+        )
+
+        if configuration.filename is None:
+            configuration_dm.WriteVerbose("The default configuration will be used.")
+        else:
+            configuration_dm.WriteVerbose("Configuration information loaded from '{}'.".format(configuration.filename))
+
+    return configuration
+
+
+# ----------------------------------------------------------------------
+def _CalculateSemanticVersions(
+    dm: DoneManager,
+    repository: Repository,
+    configurations: list[Configuration],
+    configuration_filenames: list[str],
+    *,
+    no_cache: bool,
+) -> list[_SemanticVersionInfo]:
+    """Returns the semantic version (and information about how it was calculated) for each configuration"""
+
+    calculators: dict[Path, _VersionCalculator] = {}
+
+    changes_processed = 0
+
+    # ----------------------------------------------------------------------
+    def GetChangesApplied() -> int:
+        return sum(calculator.changes_applied for calculator in calculators.values())
+
+    # ----------------------------------------------------------------------
+
+    with dm.Nested(
+        "Enumerating changes...",
+        [
+            lambda: "{} processed".format(inflect.no("change", changes_processed)),
+            lambda: "{} applied [{:.02f}%]".format(
+                inflect.no("change", GetChangesApplied()),
+                0 if changes_processed == 0 else ((GetChangesApplied() / (changes_processed * len(calculators))) * 100),
+            ),
+        ],
+    ) as enumerate_dm:
+        configuration_filename_lookup = _ConfigurationFilenameLookup(
+            repository.repo_root,
+            configuration_filenames,
+        )
+
+        version_cache = None if no_cache else _VersionCache.Create(repository)
+
+        # Configurations that share a root generate the same version
+        for configuration in configurations:
+            root_path = configuration.filename.parent if configuration.filename else repository.repo_root
+
+            if root_path not in calculators:
+                calculators[root_path] = _VersionCalculator(
+                    enumerate_dm,
+                    configuration,
+                    root_path,
+                    configuration_filenames,
+                    configuration_filename_lookup,
+                    version_cache,
+                )
+
+        active_calculators = list(calculators.values())
+
+        for change in repository.EnumChangesEx(
+            include_working_changes=True,
+        ):
+            changes_processed += 1
+
+            for calculator in active_calculators:
+                calculator.Process(change)
+
+            active_calculators = [calculator for calculator in active_calculators if not calculator.is_complete]
+            if not active_calculators:
+                break
+
+        for calculator in calculators.values():
+            calculator.Complete()
+
+        if version_cache is not None:
+            version_cache.Save()
+
+    results: list[_SemanticVersionInfo] = []
+
+    for configuration in configurations:
+        calculator = calculators[configuration.filename.parent if configuration.filename else repository.repo_root]
+
+        semantic_version: Optional[SemVer] = None
+
+        with dm.Nested(
+            "Calculating semantic version...",
+            lambda: str(semantic_version) if semantic_version is not None else "errors were encountered",
+        ):
+            semantic_version = calculator.GetSemanticVersion()
+
+        results.append(
+            _SemanticVersionInfo(
+                semantic_version,
+                calculator.has_working_changes,
+                changes_processed,
+                calculator.changes_applied,
+                calculator.used_cache,
+            ),
+        )
+
+    return results
+
+
+# ----------------------------------------------------------------------
+def _CalculateVersionString(
+    dm: DoneManager,
+    repository: Repository,
+    configuration: Configuration,
+    semantic_version: SemVer,
+    has_working_changes: bool,
+    *,
+    prerelease_name: Optional[str],
+    include_branch_name_when_necessary: bool,
+    include_timestamp_when_necessary: bool,
+    include_computer_name_when_necessary: bool,
+    no_prefix: bool,
+    no_metadata: bool,
+    style: GenerateStyle,
+) -> str:
     version_string: Optional[str] = None
 
     with dm.Nested(
@@ -411,115 +1153,9 @@ def GetSemanticVersion(
 
         version_string = "".join(version_parts)
 
-    return GetSemanticVersionResult(configuration.filename, semantic_version, version_string)
-
-
-# ----------------------------------------------------------------------
-def GetConfigurationFilename(
-    path: Path,
-    repository_root: Path,
-    configuration_filenames: Optional[list[str]]=None,
-) -> Optional[Path]:
-    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
-
-    for parent in itertools.chain([path, ], path.parents):
-        for potential_configuration_filename in configuration_filenames:
-            potential_filename = parent / potential_configuration_filename
-            if potential_filename.is_file():
-                return potential_filename
-
-        if parent == repository_root:
-            break
-
-    return None
-
-
-# ----------------------------------------------------------------------
-def GetConfiguration(
-    path: Path,
-    repository_root: Path,
-    configuration_filenames: Optional[list[str]]=None,
-) -> Configuration:
-    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
-
-    # Get the configuration filename
-    configuration_filename: Optional[Path] = GetConfigurationFilename(
-        path,
-        repository_root,
-        configuration_filenames,
-    )
-
-    # Get the configuration content
-    configuration_content: dict[str, Any] = {}
-
-    if configuration_filename:
-        with configuration_filename.open() as f:
-            if configuration_filename.suffix in [".yaml", ".yml"]:
-                configuration_content = cast(dict[str, Any], rtyaml.load(f))
-
-            elif configuration_filename.suffix == ".json":
-                configuration_content = json.load(f)
-
-            else:
-                raise Exception("'{}' is not a recognized configuration file type.".format(configuration_filename))
-
-    # Load the schema
-    schema_filename = PathEx.EnsureFile(Path(__file__).parent / "Configuration" / "GeneratedCode" / "AutoSemVerSchema.json")
+    return version_string
 
-    with schema_filename.open() as f:
-        schema_content = json.load(f)
 
-    # Validate the configuration data
-    _DefaultValidatingValidator(schema_content).validate(configuration_content)
-
-    # Map the configuration data to a Configuration instance
-    return Configuration(
-        configuration_filename,
-        configuration_content.get("version_prefix", None),
-        configuration_content["pre_release_environment_variable_name"],
-        SemVer.coerce(configuration_content["initial_version"]),
-        configuration_content["main_branch_names"],
-        include_branch_name_when_necessary=configuration_content["include_branch_name_when_necessary"],
-        include_timestamp_when_necessary=configuration_content["include_timestamp_when_necessary"],
-        include_computer_name_when_necessary=configuration_content["include_computer_name_when_necessary"],
-    )
-
-
-# ----------------------------------------------------------------------
-# |
-# |  Private Types
-# |
-# ----------------------------------------------------------------------
-def _DefaultValidatingValidatorFactory(
-    validator_class: PythonType,
-) -> PythonType:
-    # This code is based on https://python-jsonschema.readthedocs.io/en/latest/faq/
-    validate_properties = validator_class.VALIDATORS["properties"]
-
-    # ----------------------------------------------------------------------
-    def SetDefaults(validator, properties, instance, schema):
-        for prop, sub_schema in properties.items():
-            default_schema = sub_schema.get("default", None)
-            if default_schema is not None:
-                instance.setdefault(prop, default_schema)
-
-            for error in validate_properties(validator, properties, instance, schema):
-                yield error
-
-    # ----------------------------------------------------------------------
-
-    return validators.extend(validator_class, {"properties": SetDefaults})
-
-
-_DefaultValidatingValidator                 = _DefaultValidatingValidatorFactory(Draft202012Validator)
-
-del _DefaultValidatingValidatorFactory
-
-
-# ----------------------------------------------------------------------
-# |
-# |  Private Functions
-# |
 # ----------------------------------------------------------------------
 def _GetRepository(
     dm: DoneManager,
@@ -15,6 +15,7 @@
 # ----------------------------------------------------------------------
 """Automatically generates semantic versions based on changes in the active repository."""
 
+import json
 import sys
 
 from contextlib import contextmanager
@@ -53,7 +54,7 @@ else:
 
 sys.path.insert(0, str(PathEx.EnsureDir(_lib_path)))
 with ExitStack(lambda: sys.path.pop(0)):
-    from AutoSemVerLib import GenerateStyle, GetSemanticVersion
+    from AutoSemVerLib import GenerateStyle, GetSemanticVersion, GetSemanticVersions
 
 del _lib_path
 
@@ -85,6 +86,7 @@ def Generate(
     no_prefix: bool=typer.Option(False, "--no-prefix", help="Do not include the prefix in the generated semantic version."),
     no_branch_name: bool=typer.Option(False, "--no-branch-name", help="Do not include the branch name in the prerelease section of the generated semantic version."),
     no_metadata: bool=typer.Option(False, "--no-metadata", help="Do not include the build metadata section of the generated semantic version."),
+    no_cache: bool=typer.Option(False, "--no-cache", help="Do not use (or update) version information cached by previous invocations."),
     verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
     debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
     quiet: bool=typer.Option(False, "--quiet", help="Do not display any information other than the generated semantic version."),
@@ -121,12 +123,71 @@ def Generate(
             include_branch_name_when_necessary=not no_branch_name,
             no_prefix=no_prefix,
             no_metadata=no_metadata,
+            no_cache=no_cache,
             style=style,
         )
 
         output(result.version)
 
 
+# ----------------------------------------------------------------------
+@app.command("GenerateBatch", no_args_is_help=True)
+def GenerateBatch(
+    paths: list[Path]=typer.Argument(..., file_okay=False, exists=True, resolve_path=True, help="Generate semantic versions based on changes that impact each of these paths."),
+    style: GenerateStyle=typer.Option(GenerateStyle.Standard, "--style", case_sensitive=False, help="Specifies the way in which the semantic versions are generated; this is useful when targets using the generated semantic versions do not fully support the semantic version specification."),
+    prerelease_name: str=typer.Option(None, "--prerelease-name", help="Create semantic version strings with this prerelease name."),
+    no_prefix: bool=typer.Option(False, "--no-prefix", help="Do not include the prefix in the generated semantic versions."),
+    no_branch_name: bool=typer.Option(False, "--no-branch-name", help="Do not include the branch name in the prerelease section of the generated semantic versions."),
+    no_metadata: bool=typer.Option(False, "--no-metadata", help="Do not include the build metadata section of the generated semantic versions."),
+    no_cache: bool=typer.Option(False, "--no-cache", help="Do not use (or update) version information cached by previous invocations."),
+    verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to stderr."),
+    debug: bool=typer.Option(False, "--debug", help="Write debug information to stderr."),
+    quiet: bool=typer.Option(False, "--quiet", help="Do not display any information other than the generated JSON."),
+) -> None:
+    """Generates semantic versions for multiple paths, writing them to stdout as a JSON object keyed by path."""
+
+    if quiet:
+        if verbose:
+            raise typer.BadParameter("The 'verbose' and 'quiet' options are mutually exclusive.")
+        if debug:
+            raise typer.BadParameter("The 'debug' and 'quiet' options are mutually exclusive.")
+
+    # Status information is written to stderr so that stdout only contains the JSON content
+    with DoneManager.CreateCommandLine(
+        StreamDecorator(None) if quiet else sys.stderr,
+        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+    ) as dm:
+        results = GetSemanticVersions(
+            dm,
+            paths,
+            prerelease_name=prerelease_name,
+            include_branch_name_when_necessary=not no_branch_name,
+            no_prefix=no_prefix,
+            no_metadata=no_metadata,
+            no_cache=no_cache,
+            style=style,
+        )
+
+        json.dump(
+            {
+                str(path): {
+                    "version": result.version,
+                    "semantic_version": str(result.semantic_version),
+                    "configuration_filename": None if result.configuration_filename is None else str(result.configuration_filename),
+                    "has_working_changes": result.has_working_changes,
+                    "changes_processed": result.changes_processed,
+                    "changes_applied": result.changes_applied,
+                    "used_cache": result.used_cache,
+                }
+                for path, result in zip(paths, results)
+            },
+            sys.stdout,
+            indent=2,
+        )
+
+        sys.stdout.write("\n")
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -0,0 +1,285 @@
+# ----------------------------------------------------------------------
+# |
+# |  AutoSemVerLib_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 23:30:00
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoSemVerLib"""
+
+import os
+import subprocess
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.SourceControlManagers.GitSourceControlManager import GitSourceControlManager, Repository
+
+from ..AutoSemVerLib import _VersionCache, _VersionState
+
+
+# ----------------------------------------------------------------------
+def test_VersionStateCombineWithBaseline():
+    newer = _VersionState([1, 2, 3], 1, 2, 3, False, False)
+
+    assert newer.Combine(_VersionState([4, 5, 6], 10, 20, 30)) is newer
+
+
+# ----------------------------------------------------------------------
+def test_VersionStateCombine():
+    assert _VersionState(None, 1, 2, 3).Combine(_VersionState([4, 5, 6], 10, 20, 30)) == _VersionState(
+        [4, 5, 6],
+        11,
+        22,
+        33,
+    )
+
+    # Minor and patch changes in older ranges don't apply after newer major/minor changes
+    assert _VersionState(None, 1, 0, 0, False, False).Combine(_VersionState(None, 1, 2, 3)) == _VersionState(
+        None,
+        2,
+        0,
+        0,
+        False,
+        False,
+    )
+
+    assert _VersionState(None, 0, 1, 0, True, False).Combine(_VersionState(None, 0, 2, 3)) == _VersionState(
+        None,
+        0,
+        3,
+        0,
+        True,
+        False,
+    )
+
+    # Flags in the older range are carried forward
+    assert _VersionState(None, 0, 0, 1).Combine(_VersionState([1, 0, 0], 0, 1, 0, True, False)) == _VersionState(
+        [1, 0, 0],
+        0,
+        1,
+        1,
+        True,
+        False,
+    )
+
+
+# ----------------------------------------------------------------------
+def test_VersionStateCombineIsAssociative():
+    states = [
+        _VersionState(None, 0, 0, 2),
+        _VersionState(None, 0, 1, 1, True, False),
+        _VersionState(None, 1, 0, 3, False, False),
+        _VersionState([1, 2, 3], 0, 0, 1),
+    ]
+
+    for split_index in range(1, len(states)):
+        newer = states[0]
+        for state in states[1:split_index]:
+            newer = newer.Combine(state)
+
+        older = states[split_index]
+        for state in states[split_index + 1:]:
+            older = older.Combine(state)
+
+        expected = states[0]
+        for state in states[1:]:
+            expected = expected.Combine(state)
+
+        assert newer.Combine(older) == expected
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(not GitSourceControlManager().IsAvailable(), reason="git is not available")
+def test_VersionCacheRoundTrip(tmp_path):
+    repo = _CreateRepository(tmp_path)
+
+    _Commit(tmp_path, "one.txt")
+
+    state = _VersionState([1, 2, 3], 1, 2, 3, False, True)
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    assert cache.Get("key") is None
+
+    cache.Set("key", state)
+
+    # Information is persisted when the cache is saved
+    cache_filename = tmp_path / ".git" / _VersionCache.FILENAME
+
+    assert not cache_filename.is_file()
+    cache.Save()
+    assert cache_filename.is_file()
+
+    # The information is persisted
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    assert cache.Get("key") == (set(), state)
+    assert cache.Get("other key") is None
+
+    # Changes made after the information was calculated are reported
+    change_ids = [_Commit(tmp_path, "two.txt"), _Commit(tmp_path, "three.txt")]
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    assert cache.Get("key") == (set(change_ids), state)
+
+    # The information is not valid when tags change
+    _Git(tmp_path, "tag", "v1.0.0", change_ids[0])
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    assert cache.Get("key") is None
+
+    # The information is not valid for changes that aren't descendants
+    cache.Set("key", state)
+    cache.Save()
+
+    _Git(tmp_path, "checkout", "--quiet", "--detach", "HEAD~2")
+    _Commit(tmp_path, "four.txt")
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    assert cache.Get("key") is None
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(not GitSourceControlManager().IsAvailable(), reason="git is not available")
+def test_VersionCacheSharedPendingChanges(tmp_path, monkeypatch):
+    repo = _CreateRepository(tmp_path)
+
+    _Commit(tmp_path, "one.txt")
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    states = [_VersionState(None, 0, 0, index + 1) for index in range(3)]
+
+    for index, state in enumerate(states):
+        cache.Set("key{}".format(index), state)
+
+    cache.Save()
+
+    change_id = _Commit(tmp_path, "two.txt")
+
+    # The pending changes are calculated once for all keys
+    num_enum_calls = 0
+
+    original_enum_func = Repository.EnumChangedFilesInRange
+
+    # ----------------------------------------------------------------------
+    def EnumChangedFilesInRange(self, *args, **kwargs):
+        nonlocal num_enum_calls
+        num_enum_calls += 1
+
+        return original_enum_func(self, *args, **kwargs)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(Repository, "EnumChangedFilesInRange", EnumChangedFilesInRange)
+
+    cache = _VersionCache.Create(repo)
+    assert cache is not None
+
+    for index, state in enumerate(states):
+        pending_change_ids, cached_state = cache.Get("key{}".format(index)) or (None, None)
+
+        assert pending_change_ids == {change_id}
+        assert cached_state == state
+
+        # Modifying the results doesn't impact other results
+        pending_change_ids.clear()
+
+    assert num_enum_calls == 1
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(not GitSourceControlManager().IsAvailable(), reason="git is not available")
+def test_VersionCacheWorktree(tmp_path):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+
+    _CreateRepository(repo_root)
+    _Commit(repo_root, "one.txt")
+
+    worktree_root = tmp_path / "worktree"
+
+    _Git(repo_root, "worktree", "add", "--quiet", "--detach", str(worktree_root))
+
+    assert (worktree_root / ".git").is_file()
+
+    worktree_repo = GitSourceControlManager().Open(worktree_root)
+
+    state = _VersionState(None, 0, 1, 2)
+
+    cache = _VersionCache.Create(worktree_repo)
+    assert cache is not None
+
+    cache.Set("key", state)
+    cache.Save()
+
+    assert (repo_root / ".git" / _VersionCache.FILENAME).is_file()
+
+    cache = _VersionCache.Create(worktree_repo)
+    assert cache is not None
+
+    assert cache.Get("key") == (set(), state)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Git(
+    repo_root: Path,
+    *args: str,
+) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo_root), *args],
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            **{
+                "GIT_AUTHOR_NAME": "Test User",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "Test User",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+        },
+    ).stdout.decode("utf-8").strip()
+
+
+# ----------------------------------------------------------------------
+def _CreateRepository(
+    repo_root: Path,
+) -> Repository:
+    _Git(repo_root, "init", "--quiet")
+
+    return GitSourceControlManager().Open(repo_root)
+
+
+# ----------------------------------------------------------------------
+def _Commit(
+    repo_root: Path,
+    filename: str,
+) -> str:
+    (repo_root / filename).write_text(filename)
+
+    _Git(repo_root, "add", filename)
+    _Git(repo_root, "commit", "--quiet", "-m", "Added '{}'".format(filename))
+
+    return _Git(repo_root, "rev-parse", "HEAD")